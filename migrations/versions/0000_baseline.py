@@ -0,0 +1,142 @@
+"""baseline
+
+Revision ID: 0000_baseline
+Revises:
+Create Date: 2026-10-18 00:00:00
+
+The schema as scripts/init_db.py created it before migrations existed.
+Tables that are already there are left alone, so a database built by that
+older init_db upgrades from here like a fresh one. A database built by the
+current init_db already has the head schema: init_db stamps it at head (or
+run `alembic stamp head` on one created before it did).
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0000_baseline"
+down_revision: Union[str, Sequence[str], None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _id():
+    return sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True)
+
+
+def _fk(name, target, nullable=False):
+    return sa.Column(name, postgresql.UUID(as_uuid=True), sa.ForeignKey(f"{target}.id"), nullable=nullable)
+
+
+# In dependency order; (table, columns, indexes as (name, columns, unique))
+TABLES = [
+    ("regions", [
+        _id(),
+        sa.Column("code", sa.String(), nullable=False, unique=True),
+        sa.Column("name", sa.String(), nullable=False),
+    ], []),
+    ("events", [
+        _id(),
+        sa.Column("tournament_id", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("type", sa.String(), nullable=False),
+        sa.Column("category", sa.String(), nullable=False),
+    ], [("ix_events_tournament_id", ["tournament_id"], True)]),
+    ("schedules", [
+        _id(),
+        sa.Column("date", sa.Date(), nullable=False),
+    ], []),
+    ("tournament_schedules", [
+        _id(),
+        _fk("schedule_id", "schedules"),
+        sa.Column("tournament_id", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.Column("time", sa.String(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        _fk("region_id", "regions"),
+    ], [("ix_tournament_schedules_tournament_id", ["tournament_id"], True)]),
+    ("pro_points_players", [
+        _id(),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("nickname", sa.String(), nullable=False),
+        sa.Column("main_char", sa.String(), nullable=False),
+        sa.Column("total_points", sa.Integer(), nullable=True),
+        sa.Column("demacia_cup_total", sa.Integer(), nullable=True),
+        sa.Column("bilgewater_cup_total", sa.Integer(), nullable=True),
+        sa.Column("shurima_cup_total", sa.Integer(), nullable=True),
+        sa.Column("tournament_id", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False),
+    ], [("ix_pro_points_players_tournament_id", ["tournament_id"], False)]),
+    ("pro_points_seeding", [
+        _id(),
+        sa.Column("title", sa.String(), nullable=False),
+        sa.Column("description", sa.String(), nullable=False),
+    ], []),
+    ("pro_points_meta", [
+        _id(),
+        sa.Column("about", sa.String(), nullable=True),
+        sa.Column("seeding_description", sa.String(), nullable=True),
+    ], []),
+    ("players", [
+        _id(),
+        sa.Column("name", sa.String(), nullable=False),
+        _fk("region_id", "regions", nullable=True),
+    ], []),
+    ("games", [
+        _id(),
+        _fk("event_id", "events"),
+        sa.Column("day", sa.Integer(), nullable=False),
+        sa.Column("game_number", sa.Integer(), nullable=False),
+        _fk("region_id", "regions"),
+    ], []),
+    ("scores", [
+        _id(),
+        _fk("player_id", "players"),
+        _fk("game_id", "games"),
+        sa.Column("score", sa.Integer(), nullable=False),
+    ], []),
+    ("lobbies", [
+        _id(),
+        _fk("game_id", "games"),
+        sa.Column("lobby_number", sa.Integer(), nullable=False),
+    ], []),
+    ("lobby_players", [
+        _id(),
+        _fk("lobby_id", "lobbies"),
+        _fk("player_id", "players"),
+        sa.Column("placement", sa.Integer(), nullable=True),
+        sa.Column("score", sa.Integer(), nullable=False),
+    ], []),
+    ("daily_results", [
+        _id(),
+        _fk("player_id", "players"),
+        sa.Column("tournament_id", sa.String(), nullable=False),
+        sa.Column("day", sa.Integer(), nullable=False),
+        _fk("region_id", "regions"),
+        sa.Column("total_points", sa.Integer(), nullable=False),
+        sa.Column("qualified", sa.String(), nullable=True),
+        sa.Column("tiebreaker", sa.String(), nullable=True),
+    ], [("ix_daily_results_tournament_id", ["tournament_id"], False)]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for table, columns, indexes in TABLES:
+        if table in existing:
+            continue
+        op.create_table(table, *columns)
+        for name, index_columns, unique in indexes:
+            op.create_index(name, table, index_columns, unique=unique)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, _, _ in reversed(TABLES):
+        op.drop_table(table)
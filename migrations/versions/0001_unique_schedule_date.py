@@ -0,0 +1,50 @@
+"""unique schedule date
+
+Revision ID: 0001_unique_schedule_date
+Revises: 0000_baseline
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001_unique_schedule_date"
+down_revision: Union[str, Sequence[str], None] = "0000_baseline"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Earlier loaders created a new schedules row per date on every run:
+    # point tournaments at the oldest row per date and drop the duplicates.
+    op.execute("""
+        WITH keep AS (
+            SELECT DISTINCT ON (date) id, date
+            FROM schedules
+            ORDER BY date, id
+        )
+        UPDATE tournament_schedules ts
+        SET schedule_id = keep.id
+        FROM schedules s
+        JOIN keep ON keep.date = s.date
+        WHERE ts.schedule_id = s.id AND s.id <> keep.id
+    """)
+    op.execute("""
+        DELETE FROM schedules s
+        USING schedules k
+        WHERE s.date = k.date AND s.id > k.id
+    """)
+    # A schedules table created from the current models already has it
+    constraints = sa.inspect(op.get_bind()).get_unique_constraints("schedules")
+    if not any(c["column_names"] == ["date"] for c in constraints):
+        op.create_unique_constraint("schedules_date_key", "schedules", ["date"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint("schedules_date_key", "schedules", type_="unique")
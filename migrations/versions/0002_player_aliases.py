@@ -0,0 +1,36 @@
+"""player aliases
+
+Revision ID: 0002_player_aliases
+Revises: 0001_unique_schedule_date
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002_player_aliases"
+down_revision: Union[str, Sequence[str], None] = "0001_unique_schedule_date"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "player_aliases",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("alias", sa.String(), nullable=False, unique=True),
+        sa.Column("player_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("players.id"), nullable=False),
+    )
+    op.create_index("ix_player_aliases_player_id", "player_aliases", ["player_id"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_player_aliases_player_id", table_name="player_aliases")
+    op.drop_table("player_aliases")
@@ -0,0 +1,51 @@
+"""read path indexes
+
+Revision ID: 0003_read_path_indexes
+Revises: 0002_player_aliases
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003_read_path_indexes"
+down_revision: Union[str, Sequence[str], None] = "0002_player_aliases"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (name, table, columns) -- composites lead with the column the joins filter on
+INDEXES = [
+    ("ix_players_name", "players", ["name"]),
+    ("ix_games_event_day_region_game", "games", ["event_id", "day", "region_id", "game_number"]),
+    ("ix_lobbies_game_lobby", "lobbies", ["game_id", "lobby_number"]),
+    ("ix_lobby_players_lobby_player", "lobby_players", ["lobby_id", "player_id"]),
+    ("ix_lobby_players_player_id", "lobby_players", ["player_id"]),
+    ("ix_scores_game_player", "scores", ["game_id", "player_id"]),
+    ("ix_scores_player_id", "scores", ["player_id"]),
+    ("ix_daily_results_tournament_day_region", "daily_results", ["tournament_id", "day", "region_id"]),
+    ("ix_daily_results_player_id", "daily_results", ["player_id"]),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # CONCURRENTLY keeps the loaders writing while the indexes build; it
+    # cannot run inside a transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+        # Superseded by the (tournament_id, day, region_id) composite
+        op.drop_index("ix_daily_results_tournament_id", table_name="daily_results",
+                      postgresql_concurrently=True, if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index("ix_daily_results_tournament_id", "daily_results", ["tournament_id"],
+                        postgresql_concurrently=True, if_not_exists=True)
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
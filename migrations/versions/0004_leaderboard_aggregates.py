@@ -0,0 +1,63 @@
+"""leaderboard aggregates
+
+Revision ID: 0004_leaderboard_aggregates
+Revises: 0003_read_path_indexes
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004_leaderboard_aggregates"
+down_revision: Union[str, Sequence[str], None] = "0003_read_path_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STAT_COLUMNS = ("points", "games_played", "placement_sum", "placed_games", "top4")
+
+
+def _create(table, keys):
+    key_columns = [sa.Column("event_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("events.id"), nullable=False)]
+    if "day" in keys:
+        key_columns.append(sa.Column("day", sa.Integer(), nullable=False))
+    key_columns.append(sa.Column("player_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("players.id"), nullable=False))
+
+    op.create_table(
+        table,
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        *key_columns,
+        *[sa.Column(c, sa.Integer(), nullable=False, server_default="0") for c in STAT_COLUMNS],
+        sa.UniqueConstraint(*keys, name=f"uq_{table}"),
+    )
+    op.create_index(f"ix_{table}_leaderboard", table, [k for k in keys if k != "player_id"] + ["points"])
+    op.create_index(f"ix_{table}_player_id", table, ["player_id"])
+
+    # Backfill from everything already loaded
+    group = ", ".join("lp.player_id" if k == "player_id" else f"g.{k}" for k in keys)
+    op.execute(f"""
+        INSERT INTO {table} (id, {", ".join(keys)}, {", ".join(STAT_COLUMNS)})
+        SELECT gen_random_uuid(), {group},
+               SUM(lp.score), COUNT(*), COALESCE(SUM(lp.placement), 0),
+               COUNT(lp.placement), COUNT(*) FILTER (WHERE lp.placement <= 4)
+        FROM lobby_players lp
+        JOIN lobbies l ON l.id = lp.lobby_id
+        JOIN games g ON g.id = l.game_id
+        GROUP BY {group}
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _create("player_event_stats", ("event_id", "player_id"))
+    _create("player_event_day_stats", ("event_id", "day", "player_id"))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("player_event_day_stats")
+    op.drop_table("player_event_stats")
@@ -0,0 +1,132 @@
+"""pro points entries
+
+Revision ID: 0005_pro_points_entries
+Revises: 0004_leaderboard_aggregates
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005_pro_points_entries"
+down_revision: Union[str, Sequence[str], None] = "0004_leaderboard_aggregates"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Cup columns of pro_points_players -> cup header of the season they were scraped from
+# (every stored row is from season 115371820222511550, the only one scraped before)
+LEGACY_CUPS = {
+    "total_points": "Total",
+    "demacia_cup_total": "Demacia Cup",
+    "bilgewater_cup_total": "Bilgewater Cup",
+    "shurima_cup_total": "Shurima Cup",
+}
+
+# src.db.identity.canonical() in SQL: NFKC, zero-width characters dropped,
+# whitespace collapsed, "#tag" tightened, lower-cased
+CANONICAL_SQL = r"""
+    lower(regexp_replace(btrim(regexp_replace(
+        regexp_replace(normalize({0}, NFKC), '[\u00AD\u200B-\u200F\u2060\uFEFF]', '', 'g'),
+        '\s+', ' ', 'g')), '\s*#\s*', '#', 'g'))
+"""
+
+
+def _backfill():
+    """Unpivot the latest row per player and points table of pro_points_players into entries."""
+    # Rows were appended on every run without a timestamp: points only grow
+    # during a season, so the highest total is the latest snapshot
+    op.execute(f"""
+        CREATE TEMP TABLE legacy_pro_points ON COMMIT DROP AS
+        SELECT *, {CANONICAL_SQL.format("name")} AS key
+        FROM (
+            SELECT DISTINCT ON (tournament_id, main_char)
+                   rank, nickname, main_char, tournament_id, url, {", ".join(LEGACY_CUPS)},
+                   btrim(coalesce(nullif(main_char, ''), nickname)) AS name
+            FROM pro_points_players
+            ORDER BY tournament_id, main_char, total_points DESC NULLS LAST
+        ) latest
+    """)
+
+    # Player matching on the exact canonical key (players.name or an alias);
+    # unmatched names get a new player, like scripts/save_pro_points.py
+    op.execute(f"""
+        CREATE TEMP TABLE legacy_player_keys ON COMMIT DROP AS
+        SELECT DISTINCT ON (key) key, player_id
+        FROM (
+            SELECT alias AS key, player_id, 0 AS source FROM player_aliases
+            UNION ALL
+            SELECT {CANONICAL_SQL.format("name")}, id, 1 FROM players
+        ) k
+        ORDER BY key, source
+    """)
+    op.execute("""
+        INSERT INTO legacy_player_keys (key, player_id)
+        SELECT key, gen_random_uuid()
+        FROM legacy_pro_points
+        WHERE key <> '' AND key NOT IN (SELECT key FROM legacy_player_keys)
+        GROUP BY key
+    """)
+    op.execute("""
+        INSERT INTO players (id, name)
+        SELECT k.player_id, min(l.name)
+        FROM legacy_player_keys k JOIN legacy_pro_points l ON l.key = k.key
+        WHERE NOT EXISTS (SELECT 1 FROM players p WHERE p.id = k.player_id)
+        GROUP BY k.player_id
+    """)
+
+    # Two rows resolving to one player: the first (higher ranked) wins
+    cups = ", ".join(f"('{cup}', l.{column})" for column, cup in LEGACY_CUPS.items())
+    op.execute(f"""
+        INSERT INTO pro_points_entries
+            (id, season_id, points_id, player_id, rank, nickname, main_char, cup, points, url)
+        SELECT gen_random_uuid(),
+               coalesce(substring(l.url from '/season/([^/]+)/points/'), 'unknown'),
+               l.tournament_id, k.player_id, l.rank,
+               coalesce(nullif(l.nickname, ''), l.main_char), coalesce(nullif(l.main_char, ''), l.nickname),
+               c.cup, c.points, l.url
+        FROM legacy_pro_points l
+        JOIN legacy_player_keys k ON k.key = l.key AND l.key <> ''
+        CROSS JOIN LATERAL (VALUES {cups}) AS c (cup, points)
+        ORDER BY l.rank NULLS LAST
+        ON CONFLICT ON CONSTRAINT uq_pro_points_entries DO NOTHING
+    """)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "pro_points_entries",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("season_id", sa.String(), nullable=False),
+        sa.Column("points_id", sa.String(), nullable=False),
+        sa.Column("player_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("players.id"), nullable=False),
+        sa.Column("rank", sa.Integer(), nullable=True),
+        sa.Column("nickname", sa.String(), nullable=False),
+        sa.Column("main_char", sa.String(), nullable=False),
+        sa.Column("cup", sa.String(), nullable=False),
+        sa.Column("points", sa.Integer(), nullable=True),
+        sa.Column("url", sa.String(), nullable=False),
+        sa.UniqueConstraint("points_id", "player_id", "cup", name="uq_pro_points_entries"),
+    )
+    op.create_index("ix_pro_points_entries_standings", "pro_points_entries", ["points_id", "cup", "points"])
+    op.create_index("ix_pro_points_entries_season_id", "pro_points_entries", ["season_id"])
+    op.create_index("ix_pro_points_entries_player_id", "pro_points_entries", ["player_id"])
+
+    # pro_points_players (three hard-coded cup columns) is backfilled here and
+    # left in place; 0006_drop_pro_points_players drops it
+    if sa.inspect(op.get_bind()).has_table("pro_points_players"):
+        _backfill()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # pro_points_players was left untouched by upgrade()
+    op.drop_index("ix_pro_points_entries_player_id", table_name="pro_points_entries")
+    op.drop_index("ix_pro_points_entries_season_id", table_name="pro_points_entries")
+    op.drop_index("ix_pro_points_entries_standings", table_name="pro_points_entries")
+    op.drop_table("pro_points_entries")
@@ -0,0 +1,45 @@
+"""drop pro points players
+
+Revision ID: 0006_drop_pro_points_players
+Revises: 0005_pro_points_entries
+Create Date: 2026-10-18 00:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006_drop_pro_points_players"
+down_revision: Union[str, Sequence[str], None] = "0005_pro_points_entries"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Backfilled into pro_points_entries by 0005_pro_points_entries
+    if sa.inspect(op.get_bind()).has_table("pro_points_players"):
+        op.drop_table("pro_points_players")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Restores the (empty) table only: its rows live on in pro_points_entries
+    op.create_table(
+        "pro_points_players",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("rank", sa.Integer(), nullable=False),
+        sa.Column("nickname", sa.String(), nullable=False),
+        sa.Column("main_char", sa.String(), nullable=False),
+        sa.Column("total_points", sa.Integer(), nullable=True),
+        sa.Column("demacia_cup_total", sa.Integer(), nullable=True),
+        sa.Column("bilgewater_cup_total", sa.Integer(), nullable=True),
+        sa.Column("shurima_cup_total", sa.Integer(), nullable=True),
+        sa.Column("tournament_id", sa.String(), nullable=False),
+        sa.Column("url", sa.String(), nullable=False),
+    )
+    op.create_index("ix_pro_points_players_tournament_id", "pro_points_players", ["tournament_id"])
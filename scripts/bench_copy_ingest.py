@@ -0,0 +1,89 @@
+import sys
+import time
+import argparse
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from sqlalchemy import text
+from src.db.session import SessionLocal
+from src.db.insert import upsert_events
+from src.db.copy_ingest import copy_ingest
+
+# Synthetic data lives under this tournament_id / player prefix and is removed afterwards
+TOURNAMENT_ID = "bench-copy-ingest"
+PLAYER_PREFIX = "bench-player-"
+REGIONS = ("APAC", "AMER", "EMEA")
+
+
+def synthetic_weekend(days, games, lobbies):
+    """lobby_players + scores for a Pro Circuit-sized weekend: regions x days x games x lobbies x 8."""
+    lobby_players, scores = [], []
+    for region in REGIONS:
+        for day in range(1, days + 1):
+            for game in range(1, games + 1):
+                for lobby in range(1, lobbies + 1):
+                    for seat in range(8):
+                        player = f"{PLAYER_PREFIX}{region}-{(lobby - 1) * 8 + seat}"
+                        placement = (seat + game) % 8 + 1
+                        points = 9 - placement
+                        key = {"tournament_id": TOURNAMENT_ID, "day": day, "game_number": game, "region": region}
+                        lobby_players.append({**key, "lobby_number": lobby, "player": player,
+                                              "placement": placement, "score": points})
+                        scores.append({**key, "player": player, "score": points})
+    return lobby_players, scores
+
+
+def cleanup():
+    session = SessionLocal()
+    try:
+        params = {"tid": TOURNAMENT_ID, "prefix": f"{PLAYER_PREFIX}%"}
+        game_ids = "SELECT g.id FROM games g JOIN events e ON e.id = g.event_id WHERE e.tournament_id = :tid"
+        event_ids = "SELECT id FROM events WHERE tournament_id = :tid"
+        session.execute(text(f"DELETE FROM player_event_day_stats WHERE event_id IN ({event_ids})"), params)
+        session.execute(text(f"DELETE FROM player_event_stats WHERE event_id IN ({event_ids})"), params)
+        session.execute(text("DELETE FROM daily_results WHERE tournament_id = :tid"), params)
+        session.execute(text(f"DELETE FROM scores WHERE game_id IN ({game_ids})"), params)
+        session.execute(text(f"DELETE FROM lobby_players WHERE lobby_id IN (SELECT id FROM lobbies WHERE game_id IN ({game_ids}))"), params)
+        session.execute(text(f"DELETE FROM lobbies WHERE game_id IN ({game_ids})"), params)
+        session.execute(text(f"DELETE FROM games WHERE id IN ({game_ids})"), params)
+        session.execute(text("DELETE FROM players WHERE name LIKE :prefix"), params)
+        session.execute(text("DELETE FROM events WHERE tournament_id = :tid"), params)
+        session.commit()
+    finally:
+        session.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="COPY ingest benchmark on synthetic lobby data")
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--games", type=int, default=6)
+    parser.add_argument("--lobbies", type=int, default=16)
+    args = parser.parse_args()
+
+    lobby_players, scores = synthetic_weekend(args.days, args.games, args.lobbies)
+    cleanup()
+    try:
+        upsert_events([{"tournament_id": TOURNAMENT_ID, "url": "/bench", "name": "Bench Cup",
+                        "type": "Regional", "category": "Pro Circuit"}])
+
+        start = time.perf_counter()
+        first = copy_ingest(lobby_players=lobby_players, scores=scores)
+        cold = time.perf_counter() - start
+
+        # Same data again: everything already present, nothing written
+        start = time.perf_counter()
+        second = copy_ingest(lobby_players=lobby_players, scores=scores)
+        warm = time.perf_counter() - start
+    finally:
+        cleanup()
+
+    rows = len(lobby_players) + len(scores)
+    print(f"{rows} rows ({len(lobby_players)} lobby_players + {len(scores)} scores)")
+    print(f"  first load : {cold:8.3f}s  {rows / cold:10.0f} rows/s  written {first['written']}")
+    print(f"  re-load    : {warm:8.3f}s  {rows / warm:10.0f} rows/s  written {second['written']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+import sys
+import time
+import argparse
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from sqlalchemy import delete
+from src.db.session import SessionLocal
+from src.db.models import Event
+from src.db.insert import insert_event, upsert_events
+from src.db.ingest import ingest
+from src.events.models import EventItem
+
+# Synthetic rows are tagged so they can be cleaned up afterwards
+PREFIX = "bench-events-"
+
+
+def synthetic_events(n):
+    return [
+        {
+            "url": f"/en-US/tournament/{PREFIX}{i}",
+            "tournament_id": f"{PREFIX}{i}",
+            "name": f"Bench Cup {i}",
+            "type": "Regional",
+            "category": "Pro Circuit" if i % 2 else "Path to Pro",
+        }
+        for i in range(n)
+    ]
+
+
+def cleanup():
+    session = SessionLocal()
+    try:
+        session.execute(delete(Event).where(Event.tournament_id.like(f"{PREFIX}%")))
+        session.commit()
+    finally:
+        session.close()
+
+
+def bench_per_item(raws):
+    """Old path: validate + insert_event (own session and commit) per event."""
+    start = time.perf_counter()
+    for raw in raws:
+        insert_event(EventItem(**raw))
+    return time.perf_counter() - start
+
+
+def bench_batched(raws, batch_size):
+    """New path: one TypeAdapter validation, one upsert + commit per batch."""
+    report = ingest(raws, EventItem, lambda session, batch: upsert_events(batch, session=session),
+                    batch_size=batch_size, label="bench events")
+    return report["seconds"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Events ingest throughput: per-item vs batched")
+    parser.add_argument("-n", type=int, default=2000, help="number of synthetic events")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    raws = synthetic_events(args.n)
+    cleanup()
+    try:
+        per_item = bench_per_item(raws)
+        cleanup()
+        batched = bench_batched(raws, args.batch_size)
+    finally:
+        cleanup()
+
+    print(f"{args.n} events")
+    print(f"  per-item : {per_item:8.3f}s  {args.n / per_item:10.0f} rows/s")
+    print(f"  batched  : {batched:8.3f}s  {args.n / batched:10.0f} rows/s  ({per_item / batched:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
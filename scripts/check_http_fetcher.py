@@ -0,0 +1,82 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+# Serve the scrapers from a local stand-in server: settings read these at import
+server = ThreadingHTTPServer(("127.0.0.1", 0), None)
+os.environ["BASE_URL"] = f"http://127.0.0.1:{server.server_address[1]}"
+os.environ["FETCH_BACKEND_TOURNAMENT_PARTICIPANTS"] = "http"
+
+from src.config.settings import HEADERS
+from src.tournament.tournament_detail import fetch_tournament_participants, participants_from_html
+from src.utils.http_fetcher import fetch_via_http, shutdown_fetcher
+
+PARTICIPANTS = ["Alpha#EUW", "Bravo#NA1", "Charlie#KR1"]
+
+# Server-rendered list, and a page that only renders it client-side
+PAGES = {
+    "/en-US/tournament/1/participants": (
+        "<html><body><h5>Participating Players</h5><hr><div>"
+        + "".join(f"<div>{name}</div>" for name in PARTICIPANTS)
+        + "</div></body></html>"
+    ),
+    "/en-US/tournament/2/participants": (
+        '<html><body><h5>Participating Players</h5><hr><div id="app"></div></body></html>'
+    ),
+}
+
+requests_seen = []
+
+
+class StandIn(BaseHTTPRequestHandler):
+    def do_GET(self):
+        requests_seen.append((self.path, self.headers.get("User-Agent")))
+        body = PAGES.get(self.path)
+        self.send_response(200 if body else 404)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.end_headers()
+        if body:
+            self.wfile.write(body.encode("utf-8"))
+
+    def log_message(self, *args):
+        pass
+
+
+def main():
+    server.RequestHandlerClass = StandIn
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    failures = []
+
+    try:
+        # Server HTML -> parsed over HTTP, no browser involved
+        result = fetch_tournament_participants("1", retries=1)
+        if not result or result["participants"] != PARTICIPANTS:
+            failures.append(f"participants over HTTP: {result}")
+
+        # Client-rendered list -> "needs JS" (an error in forced "http" mode)
+        url = f"{os.environ['BASE_URL']}/en-US/tournament/2/participants"
+        try:
+            fetch_via_http("tournament_participants", url, lambda soup, payloads: participants_from_html(soup))
+            failures.append("client-rendered page was accepted over HTTP")
+        except ValueError:
+            pass
+
+        if not requests_seen or any(agent != HEADERS["User-Agent"] for _, agent in requests_seen):
+            failures.append(f"stand-in not reached with the configured headers: {requests_seen}")
+    finally:
+        shutdown_fetcher()
+        server.shutdown()
+
+    for failure in failures:
+        print(f"FAIL {failure}")
+    print(f"{len(requests_seen)} requests served by {os.environ['BASE_URL']}: {'FAILED' if failures else 'OK'}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
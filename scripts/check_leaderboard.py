@@ -0,0 +1,52 @@
+import sys
+import argparse
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from sqlalchemy import select
+from src.db.session import SessionLocal
+from src.db.models import Event
+from src.db.aggregates import check, rebuild
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare leaderboard aggregates against a full recompute")
+    parser.add_argument("--tournament", help="only check this tournament_id")
+    parser.add_argument("--repair", action="store_true", help="rebuild the aggregates when they drifted")
+    parser.add_argument("--limit", type=int, default=100, help="max mismatches listed per table")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        event_id = None
+        if args.tournament:
+            event_id = session.execute(
+                select(Event.id).where(Event.tournament_id == args.tournament)
+            ).scalar_one_or_none()
+            if event_id is None:
+                print(f"Unknown tournament {args.tournament}")
+                sys.exit(2)
+
+        mismatches = check(session, event_id, limit=args.limit)
+        drifted = False
+        for table, rows in mismatches.items():
+            print(f"{table}: {len(rows)} mismatching rows")
+            for row in rows:
+                print(f"  {row}")
+            drifted = drifted or bool(rows)
+
+        if drifted and args.repair:
+            rebuild(session, event_id)
+            session.commit()
+            print("Aggregates rebuilt")
+            drifted = False
+    finally:
+        session.close()
+
+    sys.exit(1 if drifted else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import sys
+import argparse
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.config.settings import TOURNAMENT_WORKERS
+from src.events.events_scraper import scrape as scrape_events
+from src.schedule.schedule_scraper import scrape as scrape_schedule
+from src.tournament.discovery import crawl_discovered
+from src.utils.browser_pool import shutdown_pool
+from src.utils.http_fetcher import shutdown_fetcher
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Discover tournaments and crawl the new or stale ones")
+    parser.add_argument("--limit", type=int, help="crawl at most this many tournaments this run")
+    parser.add_argument("--workers", type=int, default=TOURNAMENT_WORKERS,
+                        help=f"tournaments crawled at once (default {TOURNAMENT_WORKERS})")
+    parser.add_argument("--resume", action="store_true",
+                        help="skip discovery and only work through the persisted frontier")
+    args = parser.parse_args()
+
+    try:
+        events = schedule = None
+        if not args.resume:
+            events, schedule = scrape_events(), scrape_schedule()
+        reports = crawl_discovered(events, schedule, workers=args.workers, limit=args.limit)
+    except KeyboardInterrupt:
+        print("Interrupted: finished tournaments are saved, run again with --resume to continue")
+        return
+    finally:
+        shutdown_pool()
+        shutdown_fetcher()
+
+    failed = [r["tournament_id"] for r in reports if r["error"]]
+    print(f"Crawled {len(reports)} tournaments, {len(failed)} with errors")
+    for tid in failed:
+        print(f"  {tid}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+import sys
+import argparse
+from collections import defaultdict
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from sqlalchemy import select, text
+from src.db.session import SessionLocal
+from src.db.models import Player
+from src.db.insert import upsert_events
+from src.db.copy_ingest import copy_ingest
+from src.db.queries import (
+    standings_query, player_history_query, lobby_breakdown_query, leaderboard_query, explain, seq_scanned_tables,
+)
+from scripts.bench_copy_ingest import synthetic_weekend, cleanup, TOURNAMENT_ID, PLAYER_PREFIX
+
+# Tables that grow with every tournament; reads must reach them through an index
+LARGE_TABLES = {
+    "games", "lobbies", "lobby_players", "scores", "daily_results",
+    "player_event_stats", "player_event_day_stats",
+}
+
+
+def synthetic_daily_results(lobby_players):
+    totals = defaultdict(int)
+    for row in lobby_players:
+        totals[(row["day"], row["region"], row["player"])] += row["score"]
+    return [
+        {"tournament_id": TOURNAMENT_ID, "day": day, "region": region, "player": player,
+         "total_points": points, "qualified": None, "tiebreaker": None}
+        for (day, region, player), points in totals.items()
+    ]
+
+
+def seed(days, games, lobbies):
+    lobby_players, scores = synthetic_weekend(days, games, lobbies)
+    upsert_events([{"tournament_id": TOURNAMENT_ID, "url": "/bench", "name": "Bench Cup",
+                    "type": "Regional", "category": "Pro Circuit"}])
+    copy_ingest(lobby_players=lobby_players, scores=scores,
+                daily_results=synthetic_daily_results(lobby_players))
+
+    session = SessionLocal()
+    try:
+        for table in sorted(LARGE_TABLES | {"players", "events", "regions"}):
+            session.execute(text(f"ANALYZE {table}"))
+        session.commit()
+    finally:
+        session.close()
+
+
+def check(session, label, stmt, analyze):
+    # With seq scans disabled the planner only falls back to one when no
+    # index can serve the query -- exactly what this check is after.
+    session.execute(text("SET LOCAL enable_seqscan = off"))
+    forced = seq_scanned_tables(explain(session, stmt)) & LARGE_TABLES
+    session.execute(text("SET LOCAL enable_seqscan = on"))
+    plan = explain(session, stmt, analyze=analyze)
+
+    status = "OK" if not forced else f"NO INDEX PATH for {', '.join(sorted(forced))}"
+    print(f"=== {label}: {status}")
+    for line in plan:
+        print(f"  {line}")
+    return not forced
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed synthetic results and EXPLAIN the read queries")
+    parser.add_argument("--days", type=int, default=3)
+    parser.add_argument("--games", type=int, default=6)
+    parser.add_argument("--lobbies", type=int, default=16)
+    parser.add_argument("--analyze", action="store_true", help="EXPLAIN ANALYZE (runs the queries)")
+    parser.add_argument("--keep", action="store_true", help="leave the seeded rows in place")
+    args = parser.parse_args()
+
+    cleanup()
+    ok = True
+    try:
+        seed(args.days, args.games, args.lobbies)
+        session = SessionLocal()
+        try:
+            player_id = session.execute(
+                select(Player.id).where(Player.name.like(f"{PLAYER_PREFIX}%")).limit(1)
+            ).scalar_one()
+            queries = [
+                ("standings (latest day)", standings_query(TOURNAMENT_ID)),
+                ("standings (day 1, EMEA)", standings_query(TOURNAMENT_ID, day=1, region_code="EMEA")),
+                ("player history", player_history_query(player_id, limit=50)),
+                ("lobby breakdown (day 1)", lobby_breakdown_query(TOURNAMENT_ID, day=1)),
+                ("lobby breakdown (day 1, game 2, APAC)",
+                 lobby_breakdown_query(TOURNAMENT_ID, day=1, game_number=2, region_code="APAC")),
+                ("leaderboard", leaderboard_query(TOURNAMENT_ID, limit=32)),
+                ("leaderboard (day 2)", leaderboard_query(TOURNAMENT_ID, day=2, limit=32)),
+            ]
+            for label, stmt in queries:
+                ok = check(session, label, stmt, args.analyze) and ok
+            session.rollback()
+        finally:
+            session.close()
+    finally:
+        if not args.keep:
+            cleanup()
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import sys
+import argparse
+from pathlib import Path
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+sys.path.append(str(ROOT_DIR))
+
+from src.config.settings import EXPORT_DIR
+from src.export import export_all
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export raw scraped data to partitioned Parquet datasets")
+    parser.add_argument("--out", default=EXPORT_DIR, help=f"output directory (default {EXPORT_DIR})")
+    parser.add_argument("--full", action="store_true", help="re-export every source, not only changed ones")
+    args = parser.parse_args()
+
+    written = export_all(args.out, full=args.full)
+    if not written:
+        print("Nothing changed since the last export")
+    for name, rows in written.items():
+        print(f"{name}: {rows} rows -> {Path(args.out) / name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,13 +5,26 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).resolve().parent.parent
 sys.path.append(str(ROOT_DIR))
 
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import inspect
 from src.db.models import Base  
 from src.db.session import engine
 
 def init_db():
     try:
+        fresh = not inspect(engine).get_table_names()
         Base.metadata.create_all(bind=engine)
         print("Database tables created successfully.")
+
+        # An empty database now has the latest schema: stamp it so
+        # `alembic upgrade head` does not replay the migrations over it.
+        # Existing tables are left to the migrations (see 0000_baseline).
+        if fresh:
+            config = Config()
+            config.set_main_option("script_location", str(ROOT_DIR / "migrations"))
+            command.stamp(config, "head")
+            print("Database stamped at the latest migration.")
     except Exception as e:
         print("Failed to connect or create tables:", e)
 
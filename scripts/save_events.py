@@ -7,42 +7,30 @@ sys.path.append(str(ROOT_DIR))
 
 # Import the scraper and database modules
 from src.events import scrape
-from src.db.session import SessionLocal
-from src.db.models import Event
+from src.db.insert import upsert_events
+from src.utils.fingerprint import get_store, log_diff
 
 def save_events():
     # Get the list of events from the scraper
     events = scrape()
-    session = SessionLocal()
 
-    try:
-        for e in events:
-            # Check if the tournament_id already exists in the database
-            existing = session.query(Event).filter_by(tournament_id=e["tournament_id"]).first()
-            if existing:
-                continue  # Skip duplicate entries
-
-            # Create a new Event object
-            event = Event(
-                tournament_id=e["tournament_id"],
-                url=e["url"],
-                name=e["name"],
-                type=e["type"],
-                category=e["category"],
-            )
-            # Add the new event to the session
-            session.add(event)
+    # Only events that changed since the last successful load reach the DB
+    fingerprints = get_store()
+    changed, skipped = fingerprints.diff("db.events", events, key="tournament_id")
+    log_diff("save_events", len(changed), skipped)
+    if not changed:
+        print(f"No changes: {skipped} events unchanged, DB untouched")
+        return
 
-        # Commit all changes to the database
-        session.commit()
-        print(f"Inserted {len(events)} events into DB")
+    try:
+        # One INSERT ... ON CONFLICT per batch, single transaction
+        counts = upsert_events(changed)
+        fingerprints.mark_all("db.events", changed, key="tournament_id")
+        fingerprints.save()
+        print(f"Events: {counts['inserted']} inserted, {counts['updated']} updated, "
+              f"{counts['unchanged'] + skipped} unchanged")
     except Exception as ex:
-        # Rollback the session if any error occurs
-        session.rollback()
         print("Error inserting events:", ex)
-    finally:
-        # Close the database session
-        session.close()
 
 if __name__ == "__main__":
     # Run the save_events function when this script is executed
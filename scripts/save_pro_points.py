@@ -4,52 +4,90 @@ from pathlib import Path
 ROOT_DIR = Path(__file__).resolve().parent.parent
 sys.path.append(str(ROOT_DIR))
 
+import uuid
+from sqlalchemy import delete, insert
 from src.db.session import SessionLocal
-from src.db.models import ProPointsPlayer, ProPointsSeeding, ProPointsMeta
+from src.db.models import ProPointsEntry, ProPointsSeeding, ProPointsMeta, TOTAL_CUP
+from src.db.identity import get_identity_index
+from src.db.dimensions import get_dimensions
 from src.pro_points.pro_points_scraper import scrape
+from src.utils.fingerprint import get_store
+
+
+def entry_rows(season, player_ids):
+    """Normalized (player, season, cup, points) rows of one scraped season, total included."""
+    rows = {}
+    for p in season.get("players", []):
+        player_id = player_ids.get(p["main_char"] or p["nickname"])
+        if player_id is None:
+            continue
+        base = {
+            "season_id": season["season_id"],
+            "points_id": season["points_id"],
+            "player_id": player_id,
+            "rank": p["rank"],
+            "nickname": p["nickname"] or p["main_char"],
+            "main_char": p["main_char"] or p["nickname"],
+            "url": season["url"],
+        }
+        cups = {TOTAL_CUP: p["total_points"], **(p.get("cups") or {})}
+        for cup, points in cups.items():
+            # Two rows resolving to one player: the first (higher ranked) wins
+            rows.setdefault((player_id, cup), {"id": uuid.uuid4(), **base, "cup": cup, "points": points})
+    return list(rows.values())
+
 
 def save_pro_points():
     data = scrape()
+
+    # Each season is loaded as one snapshot: skip the ones that are unchanged
+    fingerprints = get_store()
+    changed = {
+        key: season for key, season in data.get("seasons", {}).items()
+        if fingerprints.changed("db.pro_points", season["url"], season)
+    }
+    if not changed:
+        print(f"No changes: {len(data.get('seasons', {}))} pro points seasons unchanged, DB untouched")
+        return
+
     session = SessionLocal()
+    identity = get_identity_index()
 
     try:
-        # Insert players
-        for p in data.get("players", []):
-            player = ProPointsPlayer(
-                rank=p["rank"],
-                nickname=p["nickname"],
-                main_char=p["main_char"],
-                total_points=p["total_points"],
-                demacia_cup_total=p["demacia_cup_total"],
-                bilgewater_cup_total=p["bilgewater_cup_total"],
-                shurima_cup_total=p["shurima_cup_total"],
-                tournament_id=p["tournament_id"],
-                url=p["url"],
-            )
-            session.add(player)
-
-        # Insert seeding rules
-        for s in data.get("seeding", {}).get("list", []):
-            seeding = ProPointsSeeding(
-                title=s["title"],
-                description=s["desc"],
-            )
-            session.add(seeding)
-
-        # Insert meta info
-        meta = ProPointsMeta(
-            about=data.get("about"),
-            seeding_description=data.get("seeding", {}).get("description"),
-        )
-        session.add(meta)
+        inserted = 0
+        for key, season in changed.items():
+            # Replace the season's entries, so players who dropped off disappear too
+            names = [p["main_char"] or p["nickname"] for p in season.get("players", [])]
+            player_ids = identity.resolve_or_create(session, [n for n in names if n])
+            rows = entry_rows(season, player_ids)
+            session.execute(delete(ProPointsEntry).where(ProPointsEntry.points_id == season["points_id"]))
+            if rows:
+                session.execute(insert(ProPointsEntry), rows)
+            inserted += len(rows)
+
+            # Insert seeding rules
+            for s in season.get("seeding", {}).get("list", []):
+                session.add(ProPointsSeeding(title=s["title"], description=s["desc"]))
+
+            # Insert meta info
+            session.add(ProPointsMeta(
+                about=season.get("about"),
+                seeding_description=season.get("seeding", {}).get("description"),
+            ))
+            print(f"{key}: {len(season.get('players', []))} players, cups {season.get('cups')}")
 
         session.commit()
-        print(f"Inserted {len(data.get('players', []))} players, "
-              f"{len(data.get('seeding', {}).get('list', []))} seeding rules, "
-              f"and meta info")
+        for season in changed.values():
+            fingerprints.mark("db.pro_points", season["url"], season)
+        fingerprints.save()
+        print(f"Inserted {inserted} pro points entries for {len(changed)} seasons "
+              f"({len(data.get('seasons', {})) - len(changed)} unchanged)")
 
     except Exception as ex:
         session.rollback()
+        # Players created in this transaction are gone
+        get_dimensions().invalidate()
+        identity.invalidate()
         print("Error inserting pro points:", ex)
     finally:
         session.close()
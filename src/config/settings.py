@@ -1,7 +1,102 @@
-BASE_URL = "https://competetft.com"
+import os
+
+# Site root for every scraper (browser and HTTP); point it at a local
+# stand-in server for testing (see scripts/check_http_fetcher.py)
+BASE_URL = os.getenv("BASE_URL", "https://competetft.com").rstrip("/")
 SCHEDULE_URL = BASE_URL + "/schedule"
 HEADERS = {
     "User-Agent": "CompetetFTScraper/1.0 (+https://github.com/hsib19/competetft-data-scraper)"
 }
 DATA_DIR = "data"
 LOG_DIR = "logs"
+
+# Shared browser pool (see src/utils/browser_pool.py)
+BROWSER_POOL_SIZE = int(os.getenv("BROWSER_POOL_SIZE", "4"))   # max pages open at once
+BROWSER_HEADLESS = os.getenv("BROWSER_HEADLESS", "1") != "0"
+
+# Tournament crawl: how many tournaments are scraped at once
+TOURNAMENT_WORKERS = int(os.getenv("TOURNAMENT_WORKERS", "4"))
+
+# Max time to wait for a page's readiness condition (see src/utils/page_wait.py)
+PAGE_READY_TIMEOUT_MS = int(os.getenv("PAGE_READY_TIMEOUT_MS", "15000"))
+
+# Request filtering (see src/utils/request_filter.py)
+REQUEST_FILTER_ENABLED = os.getenv("REQUEST_FILTER", "1") != "0"
+BLOCK_RESOURCE_TYPES = os.getenv("BLOCK_RESOURCE_TYPES", "image,font,media").split(",")
+BLOCK_HOST_PATTERNS = [
+    "*google-analytics.com",
+    "*googletagmanager.com",
+    "*doubleclick.net",
+    "*facebook.net",
+    "*hotjar.com",
+    "*segment.io",
+    "*sentry.io",
+]
+
+# Build scraper output from the site's JSON payloads when available,
+# falling back to DOM scraping (see src/utils/payload_capture.py)
+JSON_EXTRACTION = os.getenv("JSON_EXTRACTION", "1") != "0"
+
+# Fetch backend per page type (see src/utils/http_fetcher.py):
+#   "browser" = headless Chromium only
+#   "http"    = plain HTTP only (fails if the page needs JS)
+#   "auto"    = try HTTP first, fall back to the browser
+FETCH_BACKENDS = {
+    page_type: os.getenv(f"FETCH_BACKEND_{page_type.upper()}", default)
+    for page_type, default in {
+        "events": "auto",
+        "schedule": "auto",
+        "tournament_overview": "browser",
+        "tournament_participants": "auto",
+        "pro_points": "auto",
+        "ladder_points": "auto",
+    }.items()
+}
+# Optional JSON data endpoint per page type, e.g. DATA_URL_SCHEDULE=https://...
+DATA_URLS = {
+    page_type: os.getenv(f"DATA_URL_{page_type.upper()}")
+    for page_type in FETCH_BACKENDS
+    if os.getenv(f"DATA_URL_{page_type.upper()}")
+}
+HTTP_MAX_CONNECTIONS = int(os.getenv("HTTP_MAX_CONNECTIONS", "20"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "15"))
+
+# Run-to-run state (fingerprints, snapshots, crawl frontier)
+STATE_DIR = os.path.join(DATA_DIR, "state")
+
+# Rows written per transaction by the batched ingest stage (src/db/ingest.py)
+INGEST_BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "1000"))
+
+# Raw scraper output (src/utils/raw_output.py): NDJSON, optionally compressed.
+# "gzip" uses the standard library; "zstd" needs the zstandard package.
+RAW_DATA_DIR = os.path.join(DATA_DIR, "raw")
+RAW_COMPRESSION = os.getenv("RAW_COMPRESSION", "").lower()   # "", "gzip" or "zstd"
+
+# Columnar Parquet export for analytics (src/export/parquet_export.py)
+EXPORT_DIR = os.getenv("EXPORT_DIR", os.path.join(DATA_DIR, "export"))
+
+# Daemon mode (src/daemon/scheduler.py): one shared worker pool, intervals in seconds
+DAEMON_WORKERS = int(os.getenv("DAEMON_WORKERS", str(TOURNAMENT_WORKERS)))
+LIVE_INTERVAL = int(os.getenv("LIVE_INTERVAL", "600"))              # live tournaments
+UPCOMING_INTERVAL = int(os.getenv("UPCOMING_INTERVAL", "21600"))    # tournaments not started yet
+LIVE_WINDOW = int(os.getenv("LIVE_WINDOW", "43200"))                # assumed length when end_date is unknown
+STATIC_INTERVALS = {
+    page: int(os.getenv(f"{page.upper()}_INTERVAL", default))
+    for page, default in (("events", "21600"), ("schedule", "1800"), ("pro_points", "21600"), ("ladder_points", "1800"))
+}
+
+# Ladder shards to scrape (comma-separated); empty = discover from the seeding block
+LADDER_SHARDS = [s.strip() for s in os.getenv("LADDER_SHARDS", "").split(",") if s.strip()]
+
+# Pro points tables to scrape (comma-separated "season_id/points_id" pairs)
+PRO_POINTS_SEASONS = [
+    tuple(pair.strip().split("/", 1))
+    for pair in os.getenv("PRO_POINTS_SEASONS", "115371820222511550/114777641829694521").split(",")
+    if "/" in pair
+]
+
+# Tournament discovery (src/tournament/discovery.py): unfinished tournaments are
+# re-crawled once their last fetch is older than the refresh interval (seconds);
+# a tournament that keeps failing is given up after the max attempts
+TOURNAMENT_REFRESH_INTERVAL = int(os.getenv("TOURNAMENT_REFRESH_INTERVAL", "21600"))
+TOURNAMENT_MAX_ATTEMPTS = int(os.getenv("TOURNAMENT_MAX_ATTEMPTS", "3"))
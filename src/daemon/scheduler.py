@@ -0,0 +1,225 @@
+import heapq
+import itertools
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+from src.config.settings import (
+    DAEMON_WORKERS, LIVE_INTERVAL, UPCOMING_INTERVAL, LIVE_WINDOW, STATIC_INTERVALS,
+)
+from src.events.events_scraper import scrape as scrape_events
+from src.schedule.schedule_scraper import scrape as scrape_schedule
+from src.tournament.tournament_scraper import scrape_one
+from src.tournament.discovery import get_frontier, is_tournament_id
+from src.pro_points.pro_points_scraper import scrape as scrape_pro_points
+from src.ladder_points.ladder_scraper import scrape as scrape_ladder_points
+from src.utils.logger import logger
+
+# Lower runs first when two jobs are due at the same time
+PRIORITY = {"live": 0, "static": 1, "upcoming": 2, "completed": 3}
+
+
+@dataclass
+class Job:
+    key: str
+    kind: str                       # "static" or a tournament phase
+    run: Callable[[], object]
+    interval: Optional[int] = None  # static pages only
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+    runs: int = 0
+    meta: dict = field(default_factory=dict)
+
+
+def tournament_start(section_date, time_text):
+    """Local start time from a schedule section date ("2025-12-17") and time ("5:00 PM")."""
+    day = datetime.strptime(section_date, "%Y-%m-%d")
+    try:
+        return datetime.combine(day.date(), datetime.strptime(time_text.strip(), "%I:%M %p").time())
+    except (AttributeError, ValueError):
+        return day
+
+
+def crawl_tournament(tid):
+    """scrape_one, with the outcome recorded in the discovery frontier shared with one-shot runs."""
+    report = scrape_one(tid)
+    get_frontier().record(report)
+    return report
+
+
+def phase(job, now):
+    if now < job.start:
+        return "upcoming"
+    end = job.end or job.start + timedelta(seconds=LIVE_WINDOW)
+    return "live" if now < end else "completed"
+
+
+class Scheduler:
+    """
+    Daemon-mode scheduler: one priority queue of due times, one worker pool.
+
+    Static pages (events, schedule, pro points, ladder points) refresh on
+    their own STATIC_INTERVALS. Every schedule refresh plans the tournaments
+    it lists:
+      - upcoming: re-fetched every UPCOMING_INTERVAL (and at start time)
+      - live: re-fetched every LIVE_INTERVAL until its end_date has passed
+        (LIVE_WINDOW after the start while the end is still unknown)
+      - completed: fetched once more, then dropped
+    A job is never queued twice or run concurrently with itself.
+    """
+
+    def __init__(self, workers=DAEMON_WORKERS, intervals=STATIC_INTERVALS):
+        self.workers = workers
+        self.intervals = intervals
+        self._queue = []
+        self._seq = itertools.count()
+        self._lock = threading.RLock()     # re-entrant: stop() may run in a signal handler
+        self._slots = threading.Semaphore(workers)
+        self._wakeup = threading.Condition(self._lock)
+        self._queued = set()
+        self._running = set()
+        self._done = set()
+        self._stop = threading.Event()
+
+    # ===== Queue =====
+    def _push(self, due, job):
+        with self._wakeup:
+            if job.key in self._queued or job.key in self._done:
+                return
+            heapq.heappush(self._queue, (due, PRIORITY[job.kind], next(self._seq), job))
+            self._queued.add(job.key)
+            self._wakeup.notify()
+
+    def _pop_due(self):
+        """Block until a job is due (or stop), then return it."""
+        with self._wakeup:
+            while not self._stop.is_set():
+                if self._queue:
+                    due = self._queue[0][0]
+                    wait = (due - datetime.now()).total_seconds()
+                    if wait <= 0:
+                        job = heapq.heappop(self._queue)[3]
+                        self._queued.discard(job.key)
+                        self._running.add(job.key)
+                        return job
+                else:
+                    wait = None
+                self._wakeup.wait(timeout=wait if wait is None else min(wait, 60))
+        return None
+
+    def stop(self, *_):
+        logger.info("[Scheduler] Stopping after running jobs finish")
+        self._stop.set()
+        with self._wakeup:
+            self._wakeup.notify_all()
+
+    # ===== Planning =====
+    def add_static(self, key, run):
+        self._push(datetime.now(), Job(key=key, kind="static", run=run, interval=self.intervals[key]))
+
+    def plan_tournaments(self, sections):
+        """
+        Queue every tournament of the schedule that is not queued, running or
+        done. Tournaments the frontier already has final data for count as done.
+        """
+        now = datetime.now()
+        frontier = get_frontier()
+        for section in sections or []:
+            for t in section.get("tournaments", []):
+                tid = t.get("tournament_id")
+                if not is_tournament_id(tid):
+                    continue
+                frontier.add(tid, "schedule", section.get("date"))
+                key = f"tournament:{tid}"
+                with self._lock:
+                    if frontier.is_final(tid):
+                        self._done.add(key)
+                    if key in self._queued or key in self._running or key in self._done:
+                        continue
+                job = Job(key=key, kind="upcoming", run=lambda tid=tid: crawl_tournament(tid),
+                          start=tournament_start(section["date"], t.get("time")), meta={"tournament_id": tid})
+                job.kind = phase(job, now)
+                # First fetch right away (it also tells us the end_date), then by phase
+                self._push(now, job)
+        frontier.save()
+
+    def _reschedule(self, job, result):
+        now = datetime.now()
+        if job.kind == "static":
+            if job.key == "schedule":
+                self.plan_tournaments(result)
+            self._push(now + timedelta(seconds=job.interval), job)
+            return
+
+        detail = (result or {}).get("detail") if isinstance(result, dict) else None
+        if detail and detail.get("end_date"):
+            try:
+                job.end = datetime.strptime(detail["end_date"], "%Y-%m-%d") + timedelta(days=1)
+            except ValueError:
+                pass
+
+        if job.kind == "completed":
+            with self._lock:
+                self._done.add(job.key)
+            logger.info(f"[Scheduler] {job.key} completed, final fetch done")
+            return
+
+        job.kind = phase(job, now)
+        if job.kind == "live":
+            due = now + timedelta(seconds=LIVE_INTERVAL)
+        elif job.kind == "upcoming":
+            due = min(now + timedelta(seconds=UPCOMING_INTERVAL), job.start)
+        else:
+            due = now
+        self._push(due, job)
+
+    # ===== Running =====
+    def _execute(self, job):
+        started = time.perf_counter()
+        result = None
+        try:
+            result = job.run()
+            logger.info(f"[Scheduler] {job.key} ({job.kind}) done in {time.perf_counter() - started:.1f}s")
+        except Exception as e:
+            logger.error(f"[Scheduler] {job.key} ({job.kind}) failed: {e}")
+        finally:
+            job.runs += 1
+            with self._lock:
+                self._running.discard(job.key)
+            if not self._stop.is_set():
+                self._reschedule(job, result)
+            self._slots.release()
+
+    def run(self):
+        """Run until stop() (SIGINT/SIGTERM when started through run_daemon)."""
+        logger.info(f"[Scheduler] Started with {self.workers} workers")
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="daemon") as executor:
+            while True:
+                # Wait for a free worker first, so jobs wait in the priority
+                # queue (where a newly due live tournament can overtake) and
+                # not in the executor's FIFO
+                while not self._slots.acquire(timeout=1):
+                    if self._stop.is_set():
+                        return
+                job = self._pop_due()
+                if job is None:
+                    self._slots.release()
+                    break
+                executor.submit(self._execute, job)
+
+
+def run_daemon(workers=DAEMON_WORKERS):
+    """Start the scheduler with every static page and block until interrupted."""
+    scheduler = Scheduler(workers)
+    if threading.current_thread() is threading.main_thread():
+        signal.signal(signal.SIGINT, scheduler.stop)
+        signal.signal(signal.SIGTERM, scheduler.stop)
+
+    scheduler.add_static("schedule", scrape_schedule)
+    scheduler.add_static("events", scrape_events)
+    scheduler.add_static("pro_points", scrape_pro_points)
+    scheduler.add_static("ladder_points", scrape_ladder_points)
+    scheduler.run()
@@ -0,0 +1,131 @@
+from sqlalchemy import text
+from src.utils.logger import logger
+
+# Aggregate table -> grouping key. Both are fed from lobby_players.
+AGGREGATES = {
+    "player_event_stats": ("event_id", "player_id"),
+    "player_event_day_stats": ("event_id", "day", "player_id"),
+}
+STAT_COLUMNS = ("points", "games_played", "placement_sum", "placed_games", "top4")
+_STAT_LIST = ", ".join(STAT_COLUMNS)
+
+
+# ===== Incremental maintenance (used by src/db/copy_ingest.py) =====
+# Must run after stage_lobby_players_resolved exists and BEFORE lobby_players
+# is updated: each staged row contributes (new values - stored values), and a
+# row that is new also adds one game played. Unchanged rows contribute nothing.
+CAPTURE_DELTAS_SQL = """
+    CREATE TEMP TABLE stage_stats_delta ON COMMIT DROP AS
+    SELECT g.event_id, g.day, s.player_id,
+           s.score - COALESCE(old.score, 0) AS points,
+           CASE WHEN old.present THEN 0 ELSE 1 END AS games_played,
+           COALESCE(s.placement, 0) - COALESCE(old.placement, 0) AS placement_sum,
+           (s.placement IS NOT NULL)::int - (old.placement IS NOT NULL)::int AS placed_games,
+           COALESCE(s.placement <= 4, false)::int - COALESCE(old.placement <= 4, false)::int AS top4
+    FROM stage_lobby_players_resolved s
+    JOIN lobbies l ON l.id = s.lobby_id
+    JOIN games g ON g.id = l.game_id
+    LEFT JOIN LATERAL (
+        SELECT true AS present, lp.placement, lp.score
+        FROM lobby_players lp
+        WHERE lp.lobby_id = s.lobby_id AND lp.player_id = s.player_id
+        ORDER BY lp.id
+        LIMIT 1
+    ) old ON true
+    WHERE old.present IS NULL
+       OR old.score IS DISTINCT FROM s.score
+       OR old.placement IS DISTINCT FROM s.placement
+"""
+
+
+def _apply_deltas_sql(table, keys):
+    key_list = ", ".join(keys)
+    sums = ", ".join(f"SUM({c})" for c in STAT_COLUMNS)
+    updates = ", ".join(f"{c} = {table}.{c} + EXCLUDED.{c}" for c in STAT_COLUMNS)
+    return f"""
+        INSERT INTO {table} (id, {key_list}, {_STAT_LIST})
+        SELECT gen_random_uuid(), {key_list}, {sums}
+        FROM stage_stats_delta
+        GROUP BY {key_list}
+        ON CONFLICT ({key_list}) DO UPDATE SET {updates}
+    """
+
+
+APPLY_DELTAS_SQL = [(table, _apply_deltas_sql(table, keys)) for table, keys in AGGREGATES.items()]
+
+
+# ===== Full recompute (consistency check / repair) =====
+def _recompute_sql(keys):
+    key_select = ", ".join("lp.player_id" if k == "player_id" else f"g.{k}" for k in keys)
+    return f"""
+        SELECT {key_select},
+               SUM(lp.score) AS points,
+               COUNT(*) AS games_played,
+               COALESCE(SUM(lp.placement), 0) AS placement_sum,
+               COUNT(lp.placement) AS placed_games,
+               COUNT(*) FILTER (WHERE lp.placement <= 4) AS top4
+        FROM lobby_players lp
+        JOIN lobbies l ON l.id = lp.lobby_id
+        JOIN games g ON g.id = l.game_id
+        WHERE CAST(:event_id AS uuid) IS NULL OR g.event_id = CAST(:event_id AS uuid)
+        GROUP BY {key_select}
+    """
+
+
+def check(session, event_id=None, limit=100):
+    """
+    Compare the aggregate tables against a full recompute from lobby_players.
+
+    Returns:
+        dict: table -> list of mismatching rows (key, stored and expected stats)
+    """
+    event_id = str(event_id) if event_id is not None else None
+    mismatches = {}
+    for table, keys in AGGREGATES.items():
+        on = " AND ".join(f"a.{k} = r.{k}" for k in keys)
+        differs = " OR ".join(f"a.{c} IS DISTINCT FROM r.{c}" for c in STAT_COLUMNS)
+        columns = ", ".join(
+            [f"COALESCE(a.{k}, r.{k}) AS {k}" for k in keys]
+            + [f"a.{c} AS stored_{c}, r.{c} AS expected_{c}" for c in STAT_COLUMNS]
+        )
+        rows = session.execute(
+            text(f"""
+                SELECT {columns}
+                FROM (SELECT * FROM {table}
+                      WHERE CAST(:event_id AS uuid) IS NULL OR event_id = CAST(:event_id AS uuid)) a
+                FULL OUTER JOIN ({_recompute_sql(keys)}) r ON {on}
+                WHERE {differs}
+                LIMIT :limit
+            """),
+            {"event_id": event_id, "limit": limit},
+        ).mappings().all()
+        mismatches[table] = [dict(r) for r in rows]
+        logger.info(f"[Aggregates] {table}: {len(rows)} mismatching rows"
+                    + (f" (showing first {limit})" if len(rows) == limit else ""))
+    return mismatches
+
+
+def rebuild(session, event_id=None):
+    """
+    Replace the aggregate rows (for one event, or all) with a full recompute.
+    Runs in the caller's transaction. Returns {table: rows written}.
+    """
+    event_id = str(event_id) if event_id is not None else None
+    written = {}
+    for table, keys in AGGREGATES.items():
+        session.execute(
+            text(f"DELETE FROM {table} WHERE CAST(:event_id AS uuid) IS NULL OR event_id = CAST(:event_id AS uuid)"),
+            {"event_id": event_id},
+        )
+        key_list = ", ".join(keys)
+        result = session.execute(
+            text(f"""
+                INSERT INTO {table} (id, {key_list}, {_STAT_LIST})
+                SELECT gen_random_uuid(), r.*
+                FROM ({_recompute_sql(keys)}) r
+            """),
+            {"event_id": event_id},
+        )
+        written[table] = result.rowcount
+    logger.info(f"[Aggregates] Rebuilt {written}")
+    return written
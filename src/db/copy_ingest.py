@@ -0,0 +1,322 @@
+import csv
+import io
+import time
+from src.db.session import engine
+from src.db.dimensions import get_dimensions, REGION_NAMES
+from src.db.aggregates import CAPTURE_DELTAS_SQL, APPLY_DELTAS_SQL
+from src.utils.logger import logger
+
+# Staging layout per entity. Rows carry natural keys (tournament_id, region
+# code, player name); surrogate ids are resolved inside PostgreSQL.
+STAGING_COLUMNS = {
+    "games": [
+        ("tournament_id", "text"), ("day", "int"), ("game_number", "int"), ("region", "text"),
+    ],
+    "lobbies": [
+        ("tournament_id", "text"), ("day", "int"), ("game_number", "int"), ("region", "text"),
+        ("lobby_number", "int"),
+    ],
+    "lobby_players": [
+        ("tournament_id", "text"), ("day", "int"), ("game_number", "int"), ("region", "text"),
+        ("lobby_number", "int"), ("player", "text"), ("placement", "int"), ("score", "int"),
+    ],
+    "scores": [
+        ("tournament_id", "text"), ("day", "int"), ("game_number", "int"), ("region", "text"),
+        ("player", "text"), ("score", "int"),
+    ],
+    "daily_results": [
+        ("tournament_id", "text"), ("day", "int"), ("region", "text"), ("player", "text"),
+        ("total_points", "int"), ("qualified", "text"), ("tiebreaker", "text"),
+    ],
+}
+
+
+class _CsvStream(io.TextIOBase):
+    """File-like CSV view over a row iterator, so COPY streams without building the whole payload."""
+
+    def __init__(self, rows, columns):
+        self._rows = iter(rows)
+        self._columns = columns
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator="\n")
+        self._pending = ""
+        self.count = 0
+
+    def readable(self):
+        return True
+
+    def _fill(self, size):
+        while len(self._pending) < size:
+            for row in self._rows:
+                self._writer.writerow([row.get(c) for c in self._columns])
+                self.count += 1
+                if self._buffer.tell() >= 64 * 1024:
+                    break
+            data = self._buffer.getvalue()
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            if not data:
+                return
+            self._pending += data
+
+    def read(self, size=-1):
+        self._fill(size if size and size > 0 else float("inf"))
+        if size is None or size < 0:
+            data, self._pending = self._pending, ""
+        else:
+            data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def readline(self, size=-1):
+        return self.read(size)
+
+
+# ===== Set-based merge SQL (staging -> real tables) =====
+# Player names map to the oldest-id row if a name was stored twice
+_PLAYER_IDS = "(SELECT DISTINCT ON (name) name, id FROM players ORDER BY name, id)"
+_REGION_NAMES = ", ".join(f"('{code}', '{name}')" for code, name in REGION_NAMES.items())
+
+# The merges are NOT EXISTS checks against tables without unique keys, so
+# two ingests of the same data running at once could both insert. Each
+# transaction first takes advisory locks (held until commit) on every staged
+# tournament, then on every player name it is about to create, each set in
+# hash order so concurrent ingests always lock in the same order.
+_LOCK_SQL = [
+    (None, """
+        SELECT pg_advisory_xact_lock(k.lock_key)
+        FROM (
+            SELECT DISTINCT hashtext('copy_ingest.tournament:' || tournament_id) AS lock_key
+            FROM (
+                SELECT tournament_id FROM stage_games UNION SELECT tournament_id FROM stage_lobbies
+                UNION SELECT tournament_id FROM stage_lobby_players UNION SELECT tournament_id FROM stage_scores
+                UNION SELECT tournament_id FROM stage_daily_results
+            ) t
+            WHERE tournament_id IS NOT NULL
+            ORDER BY lock_key
+        ) k
+    """),
+    (None, """
+        SELECT pg_advisory_xact_lock(k.lock_key)
+        FROM (
+            SELECT DISTINCT hashtext('copy_ingest.player:' || player) AS lock_key
+            FROM (
+                SELECT player FROM stage_lobby_players UNION SELECT player FROM stage_scores
+                UNION SELECT player FROM stage_daily_results
+            ) n
+            WHERE player IS NOT NULL AND NOT EXISTS (SELECT 1 FROM players p WHERE p.name = n.player)
+            ORDER BY lock_key
+        ) k
+    """),
+]
+
+_MERGE_SQL = [
+    *_LOCK_SQL,
+    ("regions", f"""
+        INSERT INTO regions (id, code, name)
+        SELECT gen_random_uuid(), k.region, COALESCE(n.name, k.region)
+        FROM (
+            SELECT region FROM stage_games UNION SELECT region FROM stage_lobbies
+            UNION SELECT region FROM stage_lobby_players UNION SELECT region FROM stage_scores
+            UNION SELECT region FROM stage_daily_results
+        ) k
+        LEFT JOIN (VALUES {_REGION_NAMES}) n(code, name) ON n.code = k.region
+        WHERE k.region IS NOT NULL
+        ON CONFLICT (code) DO NOTHING
+    """),
+    ("players", """
+        INSERT INTO players (id, name)
+        SELECT gen_random_uuid(), k.player
+        FROM (
+            SELECT player FROM stage_lobby_players UNION SELECT player FROM stage_scores
+            UNION SELECT player FROM stage_daily_results
+        ) k
+        WHERE k.player IS NOT NULL
+          AND NOT EXISTS (SELECT 1 FROM players p WHERE p.name = k.player)
+    """),
+    ("games", """
+        INSERT INTO games (id, event_id, day, game_number, region_id)
+        SELECT gen_random_uuid(), e.id, k.day, k.game_number, r.id
+        FROM (
+            SELECT tournament_id, day, game_number, region FROM stage_games
+            UNION SELECT tournament_id, day, game_number, region FROM stage_lobbies
+            UNION SELECT tournament_id, day, game_number, region FROM stage_lobby_players
+            UNION SELECT tournament_id, day, game_number, region FROM stage_scores
+        ) k
+        JOIN events e ON e.tournament_id = k.tournament_id
+        JOIN regions r ON r.code = k.region
+        WHERE NOT EXISTS (
+            SELECT 1 FROM games g
+            WHERE g.event_id = e.id AND g.day = k.day AND g.game_number = k.game_number AND g.region_id = r.id
+        )
+    """),
+    # Resolved game ids for every staged (tournament, day, game, region)
+    (None, """
+        CREATE TEMP TABLE stage_game_ids ON COMMIT DROP AS
+        SELECT DISTINCT ON (e.tournament_id, g.day, g.game_number, r.code)
+               e.tournament_id, g.day, g.game_number, r.code AS region, g.id AS game_id
+        FROM games g
+        JOIN events e ON e.id = g.event_id
+        JOIN regions r ON r.id = g.region_id
+        WHERE e.tournament_id IN (
+            SELECT tournament_id FROM stage_lobbies UNION SELECT tournament_id FROM stage_lobby_players
+            UNION SELECT tournament_id FROM stage_scores
+        )
+        ORDER BY e.tournament_id, g.day, g.game_number, r.code, g.id
+    """),
+    ("lobbies", """
+        INSERT INTO lobbies (id, game_id, lobby_number)
+        SELECT gen_random_uuid(), gi.game_id, k.lobby_number
+        FROM (
+            SELECT tournament_id, day, game_number, region, lobby_number FROM stage_lobbies
+            UNION SELECT tournament_id, day, game_number, region, lobby_number FROM stage_lobby_players
+        ) k
+        JOIN stage_game_ids gi USING (tournament_id, day, game_number, region)
+        WHERE NOT EXISTS (
+            SELECT 1 FROM lobbies l WHERE l.game_id = gi.game_id AND l.lobby_number = k.lobby_number
+        )
+    """),
+    (None, f"""
+        CREATE TEMP TABLE stage_lobby_players_resolved ON COMMIT DROP AS
+        SELECT DISTINCT ON (l.id, p.id) l.id AS lobby_id, p.id AS player_id, s.placement, s.score
+        FROM stage_lobby_players s
+        JOIN stage_game_ids gi USING (tournament_id, day, game_number, region)
+        JOIN lobbies l ON l.game_id = gi.game_id AND l.lobby_number = s.lobby_number
+        JOIN {_PLAYER_IDS} p ON p.name = s.player
+        ORDER BY l.id, p.id
+    """),
+    # Leaderboard aggregate deltas, taken before lobby_players changes
+    (None, CAPTURE_DELTAS_SQL),
+    ("lobby_players_updated", """
+        UPDATE lobby_players lp
+        SET placement = s.placement, score = s.score
+        FROM stage_lobby_players_resolved s
+        WHERE lp.lobby_id = s.lobby_id AND lp.player_id = s.player_id
+          AND (lp.placement IS DISTINCT FROM s.placement OR lp.score IS DISTINCT FROM s.score)
+    """),
+    ("lobby_players", """
+        INSERT INTO lobby_players (id, lobby_id, player_id, placement, score)
+        SELECT gen_random_uuid(), s.lobby_id, s.player_id, s.placement, s.score
+        FROM stage_lobby_players_resolved s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM lobby_players lp WHERE lp.lobby_id = s.lobby_id AND lp.player_id = s.player_id
+        )
+    """),
+    *APPLY_DELTAS_SQL,
+    (None, f"""
+        CREATE TEMP TABLE stage_scores_resolved ON COMMIT DROP AS
+        SELECT DISTINCT ON (gi.game_id, p.id) gi.game_id, p.id AS player_id, s.score
+        FROM stage_scores s
+        JOIN stage_game_ids gi USING (tournament_id, day, game_number, region)
+        JOIN {_PLAYER_IDS} p ON p.name = s.player
+        ORDER BY gi.game_id, p.id
+    """),
+    ("scores_updated", """
+        UPDATE scores sc
+        SET score = s.score
+        FROM stage_scores_resolved s
+        WHERE sc.game_id = s.game_id AND sc.player_id = s.player_id AND sc.score IS DISTINCT FROM s.score
+    """),
+    ("scores", """
+        INSERT INTO scores (id, player_id, game_id, score)
+        SELECT gen_random_uuid(), s.player_id, s.game_id, s.score
+        FROM stage_scores_resolved s
+        WHERE NOT EXISTS (SELECT 1 FROM scores sc WHERE sc.game_id = s.game_id AND sc.player_id = s.player_id)
+    """),
+    (None, f"""
+        CREATE TEMP TABLE stage_daily_results_resolved ON COMMIT DROP AS
+        SELECT DISTINCT ON (s.tournament_id, s.day, r.id, p.id)
+               s.tournament_id, s.day, r.id AS region_id, p.id AS player_id,
+               s.total_points, s.qualified, s.tiebreaker
+        FROM stage_daily_results s
+        JOIN regions r ON r.code = s.region
+        JOIN {_PLAYER_IDS} p ON p.name = s.player
+        ORDER BY s.tournament_id, s.day, r.id, p.id
+    """),
+    ("daily_results_updated", """
+        UPDATE daily_results d
+        SET total_points = s.total_points, qualified = s.qualified, tiebreaker = s.tiebreaker
+        FROM stage_daily_results_resolved s
+        WHERE d.tournament_id = s.tournament_id AND d.day = s.day
+          AND d.region_id = s.region_id AND d.player_id = s.player_id
+          AND (d.total_points IS DISTINCT FROM s.total_points
+               OR d.qualified IS DISTINCT FROM s.qualified
+               OR d.tiebreaker IS DISTINCT FROM s.tiebreaker)
+    """),
+    ("daily_results", """
+        INSERT INTO daily_results (id, player_id, tournament_id, day, region_id, total_points, qualified, tiebreaker)
+        SELECT gen_random_uuid(), s.player_id, s.tournament_id, s.day, s.region_id,
+               s.total_points, s.qualified, s.tiebreaker
+        FROM stage_daily_results_resolved s
+        WHERE NOT EXISTS (
+            SELECT 1 FROM daily_results d
+            WHERE d.tournament_id = s.tournament_id AND d.day = s.day
+              AND d.region_id = s.region_id AND d.player_id = s.player_id
+        )
+    """),
+]
+
+
+def copy_ingest(games=(), lobbies=(), lobby_players=(), scores=(), daily_results=()):
+    """
+    Bulk-load games, lobbies, lobby_players, scores and daily_results.
+
+    Each argument is an iterable of dicts keyed by STAGING_COLUMNS (natural
+    keys: tournament_id, region code, player name). Rows are streamed with
+    COPY into temp staging tables and merged into the real tables with
+    set-based SQL, all in one transaction:
+
+      - missing regions and players are created
+      - games/lobbies are derived from every staged row, so lobby_players
+        alone are enough to build the whole hierarchy
+      - lobby_players, scores and daily_results are updated in place when
+        their values changed, inserted otherwise (re-runs are idempotent)
+      - the leaderboard aggregates (src/db/aggregates.py) are adjusted by
+        the lobby_players deltas only
+      - concurrent ingests of the same tournaments (or new players) are
+        serialised by transaction-scoped advisory locks (_LOCK_SQL)
+
+    Rows whose tournament_id has no events row are skipped by the joins.
+
+    Returns:
+        dict: rows staged per entity and rows written per merge step
+    """
+    staged_rows = {
+        "games": games,
+        "lobbies": lobbies,
+        "lobby_players": lobby_players,
+        "scores": scores,
+        "daily_results": daily_results,
+    }
+    report = {"staged": {}, "written": {}}
+    start = time.perf_counter()
+
+    conn = engine.raw_connection()
+    try:
+        cursor = conn.cursor()
+        for entity, columns in STAGING_COLUMNS.items():
+            names = [c for c, _ in columns]
+            cursor.execute(
+                f"CREATE TEMP TABLE stage_{entity} ({', '.join(f'{c} {t}' for c, t in columns)}) ON COMMIT DROP"
+            )
+            stream = _CsvStream(staged_rows[entity], names)
+            cursor.copy_expert(f"COPY stage_{entity} ({', '.join(names)}) FROM STDIN WITH (FORMAT csv)", stream)
+            cursor.execute(f"ANALYZE stage_{entity}")
+            report["staged"][entity] = stream.count
+
+        for step, sql in _MERGE_SQL:
+            cursor.execute(sql)
+            if step is not None:
+                report["written"][step] = cursor.rowcount
+
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+        # Regions/players may have been created (or rolled back) behind the cache
+        get_dimensions().invalidate()
+
+    report["seconds"] = time.perf_counter() - start
+    logger.info(f"[COPY Ingest] staged {report['staged']} written {report['written']} in {report['seconds']:.2f}s")
+    return report
@@ -0,0 +1,97 @@
+import threading
+import uuid
+from sqlalchemy import select, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from src.db.models import Region, Player
+
+# Display names for the region codes the scrapers emit
+REGION_NAMES = {
+    "APAC": "Asia Pacific",
+    "AMER": "Americas",
+    "EMEA": "Europe, Middle East, Africa",
+}
+
+
+class DimensionCache:
+    """
+    In-process lookup of dimension keys used by every loader:
+      - regions: code -> regions.id
+      - players: name -> players.id
+
+    Each map is preloaded with one query on first use; members missing from
+    the DB are created in one bulk INSERT. Lookups after that are dict hits.
+
+    The cache is never refreshed implicitly. Call invalidate() when the
+    tables may have changed behind its back, and always after rolling back a
+    transaction that created members (their ids would otherwise stay cached).
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._regions = None
+        self._players = None
+
+    def invalidate(self, dimension=None):
+        """Drop one dimension ("regions" / "players") or all of them."""
+        with self._lock:
+            if dimension in (None, "regions"):
+                self._regions = None
+            if dimension in (None, "players"):
+                self._players = None
+
+    def preload(self, session):
+        with self._lock:
+            self._load_regions(session)
+            self._load_players(session)
+
+    def _load_regions(self, session):
+        if self._regions is None:
+            self._regions = dict(session.execute(select(Region.code, Region.id)).all())
+
+    def _load_players(self, session):
+        if self._players is None:
+            # Oldest row wins if the same name was stored twice
+            self._players = {}
+            for name, player_id in session.execute(select(Player.name, Player.id)).all():
+                self._players.setdefault(name, player_id)
+
+    def region_ids(self, session, codes):
+        """Map region codes to ids, creating missing regions in bulk."""
+        codes = set(codes)
+        with self._lock:
+            self._load_regions(session)
+            missing = codes - self._regions.keys()
+            if missing:
+                session.execute(
+                    pg_insert(Region)
+                    .values([{"id": uuid.uuid4(), "code": c, "name": REGION_NAMES.get(c, c)} for c in missing])
+                    .on_conflict_do_nothing(index_elements=[Region.code])
+                )
+                # Re-read: another writer may have created some of them first
+                self._regions.update(session.execute(
+                    select(Region.code, Region.id).where(Region.code.in_(missing))
+                ).all())
+            return {c: self._regions[c] for c in codes}
+
+    def player_ids(self, session, names, region_id=None):
+        """Map player names to ids, creating missing players in bulk."""
+        names = set(names)
+        with self._lock:
+            self._load_players(session)
+            missing = names - self._players.keys()
+            if missing:
+                created = session.execute(
+                    insert(Player)
+                    .values([{"id": uuid.uuid4(), "name": n, "region_id": region_id} for n in missing])
+                    .returning(Player.name, Player.id)
+                ).all()
+                self._players.update(created)
+            return {n: self._players[n] for n in names}
+
+
+_cache = DimensionCache()
+
+
+def get_dimensions():
+    """Return the process-wide DimensionCache."""
+    return _cache
@@ -0,0 +1,189 @@
+import re
+import threading
+import unicodedata
+import uuid
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from src.db.models import Player, PlayerAlias
+from src.db.dimensions import get_dimensions
+
+# "name #tag" / "name# tag" -> "name#tag"
+_TAG_SPACING = re.compile(r"\s*#\s*")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def canonical(name):
+    """
+    Matching key for a player name or Riot ID.
+
+    NFKC-normalises (full-width letters, ligatures), drops invisible format
+    characters (zero-width spaces/joiners), collapses whitespace, tightens
+    the "#tag" separator and case-folds. "Dishsoap #NA1" and
+    "dishsoap#na1" give the same key.
+    """
+    if not name:
+        return ""
+    text = unicodedata.normalize("NFKC", str(name))
+    text = "".join(ch for ch in text if unicodedata.category(ch) != "Cf")
+    text = _WHITESPACE.sub(" ", text).strip()
+    text = _TAG_SPACING.sub("#", text)
+    return text.casefold()
+
+
+def split_riot_id(key):
+    """Split a canonical key into (game_name, tag); tag is None without '#'."""
+    game_name, sep, tag = key.rpartition("#")
+    return (game_name, tag) if sep else (key, None)
+
+
+def candidate_keys(name):
+    """
+    Keys to try for one display string, most specific first.
+
+    Display strings may carry a prefix before the Riot ID (team name,
+    "nickname main_char" from the pro points table), so when the string ends
+    in a tag every word-suffix is a candidate: "team liquid dishsoap#na1",
+    "liquid dishsoap#na1", "dishsoap#na1". Tag-less strings only match as a
+    whole, to avoid pairing "foo bar" with an unrelated "bar".
+    """
+    key = canonical(name)
+    if not key:
+        return []
+    keys = [key]
+    words = key.split(" ")
+    if "#" in words[-1]:
+        keys += [" ".join(words[i:]) for i in range(1, len(words))]
+    return keys
+
+
+class IdentityIndex:
+    """
+    Resolves whole batches of scraped names to players.id with hash lookups.
+
+    Three sources of keys, loaded with one query each:
+      - players.name (canonicalised)
+      - player_aliases.alias (already canonical)
+      - game name without tag, used only when exactly one player has it
+
+    Works for every scraped shape: participants (plain strings), ladder
+    "participant" strings and pro points rows (see resolve_rows).
+    Like the DimensionCache, call invalidate() after rolling back a
+    transaction that created players or aliases.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._by_key = {}
+        self._by_game_name = {}
+        self.loaded = False
+
+    def load(self, session):
+        with self._lock:
+            self._by_key.clear()
+            self._by_game_name.clear()
+            for name, player_id in session.execute(select(Player.name, Player.id)).all():
+                self._add(canonical(name), player_id)
+            for alias, player_id in session.execute(select(PlayerAlias.alias, PlayerAlias.player_id)).all():
+                self._add(alias, player_id)
+            self.loaded = True
+
+    def invalidate(self):
+        with self._lock:
+            self._by_key.clear()
+            self._by_game_name.clear()
+            self.loaded = False
+
+    def _add(self, key, player_id):
+        if not key:
+            return
+        self._by_key.setdefault(key, player_id)
+        game_name, tag = split_riot_id(key)
+        if tag is not None:
+            self._by_game_name.setdefault(game_name, set()).add(player_id)
+
+    def lookup(self, name):
+        """players.id for one display string, or None."""
+        keys = candidate_keys(name)
+        for key in keys:
+            player_id = self._by_key.get(key)
+            if player_id is not None:
+                return player_id
+
+        # Tag-less name: accept only an unambiguous game-name match
+        if keys and split_riot_id(keys[0])[1] is None:
+            ids = self._by_game_name.get(keys[0])
+            if ids is not None and len(ids) == 1:
+                return next(iter(ids))
+        return None
+
+    def resolve(self, names):
+        """Map each distinct name to its players.id (None if unknown). Pure in-memory."""
+        with self._lock:
+            return {name: self.lookup(name) for name in set(names)}
+
+    def resolve_rows(self, rows, fields):
+        """
+        Resolve dict rows, trying `fields` in order, e.g. pro points rows with
+        fields=("main_char", "nickname"). Returns a list of ids aligned with rows.
+        """
+        with self._lock:
+            resolved = []
+            for row in rows:
+                player_id = None
+                for field in fields:
+                    player_id = self.lookup(row.get(field))
+                    if player_id is not None:
+                        break
+                resolved.append(player_id)
+            return resolved
+
+    def add_aliases(self, session, aliases):
+        """
+        Bulk-insert {display_name: player_id} aliases (ON CONFLICT DO NOTHING)
+        and add them to the index.
+        """
+        rows = {canonical(name): player_id for name, player_id in aliases.items() if canonical(name)}
+        if not rows:
+            return
+        session.execute(
+            pg_insert(PlayerAlias)
+            .values([{"id": uuid.uuid4(), "alias": key, "player_id": pid} for key, pid in rows.items()])
+            .on_conflict_do_nothing(index_elements=[PlayerAlias.alias])
+        )
+        with self._lock:
+            for key, player_id in rows.items():
+                self._add(key, player_id)
+
+    def resolve_or_create(self, session, names):
+        """
+        Resolve names, creating players in bulk (through the DimensionCache)
+        for the ones nobody matches. Returns {name: players.id}.
+        """
+        if not self.loaded:
+            self.load(session)
+
+        resolved = self.resolve(names)
+
+        # One new player per canonical key, named after its first spelling
+        missing = {}
+        for name, player_id in resolved.items():
+            key = canonical(name)
+            if player_id is None and key:
+                missing.setdefault(key, name.strip())
+        if not missing:
+            return resolved
+
+        created = get_dimensions().player_ids(session, missing.values())
+        by_key = {key: created[display] for key, display in missing.items()}
+        with self._lock:
+            for key, player_id in by_key.items():
+                self._add(key, player_id)
+        return {name: pid if pid is not None else by_key.get(canonical(name)) for name, pid in resolved.items()}
+
+
+_index = IdentityIndex()
+
+
+def get_identity_index():
+    """Return the process-wide IdentityIndex."""
+    return _index
@@ -0,0 +1,103 @@
+import time
+from collections import Counter
+from functools import lru_cache
+from typing import List
+from pydantic import TypeAdapter, ValidationError
+from src.config.settings import INGEST_BATCH_SIZE
+from src.db.session import SessionLocal
+from src.db.dimensions import get_dimensions
+from src.utils.logger import logger
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model):
+    return TypeAdapter(List[model])
+
+
+def validate_batch(model, raws):
+    """
+    Validate a whole list of dicts against `model` in one TypeAdapter call.
+
+    Returns:
+        (valid, rejects): validated models in input order, and one reject per
+        bad record: {"index", "record", "errors": [{"field", "type", "msg"}]}.
+        Errors not tied to a record (empty loc, e.g. `raws` is not a list)
+        reject the whole input as one entry with index and record None.
+    """
+    adapter = _list_adapter(model)
+    try:
+        return adapter.validate_python(raws), []
+    except ValidationError as exc:
+        bad, root = {}, []
+        for err in exc.errors():
+            index, *field = err["loc"] or (None,)
+            error = {"field": ".".join(str(f) for f in field), "type": err["type"], "msg": err["msg"]}
+            if isinstance(index, int):
+                bad.setdefault(index, []).append(error)
+            else:
+                root.append(error)
+        if root:
+            return [], [{"index": None, "record": None, "errors": root}]
+
+    # Second pass over the records that passed, still a single call
+    valid = adapter.validate_python([r for i, r in enumerate(raws) if i not in bad])
+    rejects = [{"index": i, "record": raws[i], "errors": errors} for i, errors in sorted(bad.items())]
+    return valid, rejects
+
+
+def ingest(raws, model, writer, batch_size=INGEST_BATCH_SIZE, label=None):
+    """
+    Batched validate-and-load stage usable for any entity type.
+
+      1. validate every record at once (validate_batch)
+      2. hand valid rows to `writer(session, batch)` in batches of
+         `batch_size`, one transaction per batch
+
+    `writer` does the set-based write (e.g. upsert_events) and returns a dict
+    of counts, which are summed across batches. A failed batch is rolled back,
+    reported, and does not stop the remaining batches.
+
+    Returns:
+        dict: received, rejects, written (models committed), failed (models in
+        failed batches), counts, seconds, rows_per_sec
+    """
+    label = label or model.__name__
+    start = time.perf_counter()
+
+    valid, rejects = validate_batch(model, raws)
+    for reject in rejects:
+        logger.warning(f"[Ingest] {label} record {reject['index']} rejected: {reject['errors']}")
+
+    counts = Counter()
+    written, failed = [], []
+    for i in range(0, len(valid), batch_size):
+        batch = valid[i:i + batch_size]
+        session = SessionLocal()
+        try:
+            counts.update(writer(session, batch) or {})
+            session.commit()
+            written.extend(batch)
+        except Exception as e:
+            session.rollback()
+            # Dimension members created in this transaction are gone
+            get_dimensions().invalidate()
+            failed.extend(batch)
+            logger.error(f"[Ingest] {label} batch {i // batch_size + 1} failed ({len(batch)} rows): {e}")
+        finally:
+            session.close()
+
+    seconds = time.perf_counter() - start
+    rows_per_sec = len(raws) / seconds if seconds > 0 else 0.0
+    logger.info(
+        f"[Ingest] {label}: {len(raws)} received, {len(written)} written, {len(rejects)} rejected, "
+        f"{len(failed)} failed {dict(counts)} in {seconds:.3f}s ({rows_per_sec:.0f} rows/s)"
+    )
+    return {
+        "received": len(raws),
+        "rejects": rejects,
+        "written": written,
+        "failed": failed,
+        "counts": dict(counts),
+        "seconds": seconds,
+        "rows_per_sec": rows_per_sec,
+    }
@@ -1,5 +1,15 @@
+import uuid
+from datetime import datetime
+from sqlalchemy import or_, select, literal_column
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from src.db.session import SessionLocal
-from src.db.models import Event
+from src.db.models import Event, Schedule, TournamentSchedule
+from src.db.dimensions import get_dimensions
+
+# Columns refreshed when an existing tournament_id is scraped again
+EVENT_UPDATE_COLUMNS = ("url", "name", "type", "category")
+TOURNAMENT_SCHEDULE_UPDATE_COLUMNS = ("schedule_id", "url", "time", "name", "region_id")
+
 
 def insert_event(event_item):
     """
@@ -22,3 +32,149 @@ def insert_event(event_item):
         raise e
     finally:
         session.close()
+
+
+def _chunks(rows, size):
+    for i in range(0, len(rows), size):
+        yield rows[i:i + size]
+
+
+def _upsert_counts(session, stmt, batch_size):
+    """Run an upsert RETURNING (xmax = 0); returns (inserted, updated, unchanged)."""
+    touched = session.execute(stmt).all()
+    inserted = sum(1 for r in touched if r.inserted)
+    return inserted, len(touched) - inserted, batch_size - len(touched)
+
+
+def upsert_events(events, session=None, batch_size=1000):
+    """
+    Bulk upsert events keyed by tournament_id.
+
+    One INSERT ... ON CONFLICT (tournament_id) DO UPDATE per batch, all in a
+    single transaction. Rows whose url/name/type/category are unchanged are
+    left untouched. `events` may be dicts or EventItem models.
+
+    Pass `session` to join a caller's transaction (the caller commits);
+    otherwise a session is opened and committed here.
+
+    Returns:
+        dict: inserted / updated / unchanged counts
+    """
+    # ON CONFLICT cannot touch the same row twice in one statement: last one wins
+    rows = {}
+    for e in events:
+        e = e.model_dump() if hasattr(e, "model_dump") else e
+        rows[e["tournament_id"]] = {
+            "id": uuid.uuid4(),
+            "tournament_id": e["tournament_id"],
+            **{c: e[c] for c in EVENT_UPDATE_COLUMNS},
+        }
+    rows = list(rows.values())
+
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+    own_session = session is None
+    session = session or SessionLocal()
+    try:
+        for batch in _chunks(rows, batch_size):
+            stmt = pg_insert(Event).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Event.tournament_id],
+                set_={c: stmt.excluded[c] for c in EVENT_UPDATE_COLUMNS},
+                where=or_(*(getattr(Event, c).is_distinct_from(stmt.excluded[c]) for c in EVENT_UPDATE_COLUMNS)),
+            ).returning(literal_column("(xmax = 0)").label("inserted"))
+
+            # Only inserted or actually updated rows come back
+            inserted, updated, unchanged = _upsert_counts(session, stmt, len(batch))
+            counts["inserted"] += inserted
+            counts["updated"] += updated
+            counts["unchanged"] += unchanged
+
+        if own_session:
+            session.commit()
+        return counts
+    except Exception:
+        if own_session:
+            session.rollback()
+        raise
+    finally:
+        if own_session:
+            session.close()
+
+
+def upsert_schedule(sections, session=None, batch_size=1000):
+    """
+    Idempotent, set-based load of scraped schedule sections.
+
+      - schedules are upserted by their unique date
+      - region codes are resolved to regions.id through the DimensionCache
+      - tournament_schedules are upserted by tournament_id (moving a
+        tournament to another date/region updates it in place)
+
+    Re-running with the same data changes nothing. Pass `session` to join a
+    caller's transaction (the caller commits).
+
+    Returns:
+        dict: inserted / updated / unchanged counts for tournaments
+    """
+    dates = {s["date"]: datetime.strptime(s["date"], "%Y-%m-%d").date() for s in sections}
+    counts = {"inserted": 0, "updated": 0, "unchanged": 0}
+    if not dates:
+        return counts
+
+    own_session = session is None
+    session = session or SessionLocal()
+    try:
+        # ===== Schedule dates =====
+        session.execute(
+            pg_insert(Schedule)
+            .values([{"id": uuid.uuid4(), "date": d} for d in set(dates.values())])
+            .on_conflict_do_nothing(index_elements=[Schedule.date])
+        )
+        schedule_ids = dict(session.execute(
+            select(Schedule.date, Schedule.id).where(Schedule.date.in_(set(dates.values())))
+        ).all())
+
+        # ===== Regions (cached; missing codes created in bulk) =====
+        region_ids = get_dimensions().region_ids(session, (t["region"] for s in sections for t in s["tournaments"]))
+
+        # ===== Tournaments (last occurrence of a tournament_id wins) =====
+        rows = {}
+        for s in sections:
+            for t in s["tournaments"]:
+                rows[t["tournament_id"]] = {
+                    "id": uuid.uuid4(),
+                    "schedule_id": schedule_ids[dates[s["date"]]],
+                    "tournament_id": t["tournament_id"],
+                    "url": t["url"],
+                    "time": t["time"],
+                    "name": t["name"],
+                    "region_id": region_ids[t["region"]],
+                }
+        rows = list(rows.values())
+
+        for batch in _chunks(rows, batch_size):
+            stmt = pg_insert(TournamentSchedule).values(batch)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[TournamentSchedule.tournament_id],
+                set_={c: stmt.excluded[c] for c in TOURNAMENT_SCHEDULE_UPDATE_COLUMNS},
+                where=or_(*(getattr(TournamentSchedule, c).is_distinct_from(stmt.excluded[c])
+                            for c in TOURNAMENT_SCHEDULE_UPDATE_COLUMNS)),
+            ).returning(literal_column("(xmax = 0)").label("inserted"))
+
+            inserted, updated, unchanged = _upsert_counts(session, stmt, len(batch))
+            counts["inserted"] += inserted
+            counts["updated"] += updated
+            counts["unchanged"] += unchanged
+
+        if own_session:
+            session.commit()
+        return counts
+    except Exception:
+        if own_session:
+            session.rollback()
+        # Regions created in the failed transaction no longer exist
+        get_dimensions().invalidate("regions")
+        raise
+    finally:
+        if own_session:
+            session.close()
@@ -0,0 +1,170 @@
+import re
+import threading
+import time
+from bisect import bisect_left
+from functools import lru_cache
+from sqlalchemy import event
+from sqlalchemy.pool import QueuePool
+from src.utils.logger import logger
+
+# Latency histogram bucket upper bounds (ms); the last bucket is open-ended
+BUCKETS_MS = (1, 5, 10, 50, 100, 500, 1000, 5000)
+
+_PARAM_GROUP = re.compile(r"\((?:\s*%\([^)]+\)s\s*,?)+\)")          # (%(a)s, %(b)s, ...)
+_REPEATED_GROUPS = re.compile(r"\(\?\)(?:\s*,\s*\(\?\))+")            # (?), (?), ... from multi-row VALUES
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_WHITESPACE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def statement_shape(statement):
+    """
+    Collapse a SQL statement to its shape so every execution of "the same
+    query" lands in one bucket, whatever its batch size or literals.
+    """
+    shape = _WHITESPACE.sub(" ", statement).strip()
+    shape = _PARAM_GROUP.sub("(?)", shape)
+    shape = _REPEATED_GROUPS.sub("(?), ...", shape)
+    shape = _LITERALS.sub("?", shape)
+    return shape[:300]
+
+
+class _ShapeStats:
+    __slots__ = ("count", "total_ms", "max_ms", "rows", "buckets")
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def add(self, ms, rows):
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+        if rows and rows > 0:
+            self.rows += rows
+        self.buckets[bisect_left(BUCKETS_MS, ms)] += 1
+
+
+class QueryStats:
+    """
+    Low-overhead query instrumentation hooked into SQLAlchemy engine events.
+
+    Per statement shape: execution count, total/max latency, a latency
+    histogram and rows affected/returned. Also tracks how long callers wait
+    to check a connection out of the pool (needs InstrumentedQueuePool).
+    Only a perf_counter() call and a dict update happen per statement; SQL
+    text is never formatted or logged on the hot path.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._shapes = {}
+        self._checkout = _ShapeStats()
+
+    def attach(self, engine):
+        event.listen(engine, "before_cursor_execute", self._before)
+        event.listen(engine, "after_cursor_execute", self._after)
+        if isinstance(engine.pool, InstrumentedQueuePool):
+            engine.pool.stats = self
+        return self
+
+    # The start time lives on the statement's execution context, so a
+    # statement that raises (no after_cursor_execute) leaves nothing behind
+    # to be paired with a later statement's end
+    def _before(self, conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_start = time.perf_counter()
+
+    def _after(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, "_query_start", None)
+        if start is None:
+            return
+        ms = (time.perf_counter() - start) * 1000
+        shape = statement_shape(statement)
+        with self._lock:
+            stats = self._shapes.get(shape)
+            if stats is None:
+                stats = self._shapes[shape] = _ShapeStats()
+            stats.add(ms, cursor.rowcount)
+
+    def record_checkout(self, ms):
+        with self._lock:
+            self._checkout.add(ms, 0)
+
+    def reset(self):
+        with self._lock:
+            self._shapes.clear()
+            self._checkout = _ShapeStats()
+
+    def summary(self, top=None):
+        """Per-shape stats sorted by total time (slowest first), plus pool checkout waits."""
+        with self._lock:
+            shapes = sorted(self._shapes.items(), key=lambda kv: kv[1].total_ms, reverse=True)
+            labels = [f"<={b}ms" for b in BUCKETS_MS] + [f">{BUCKETS_MS[-1]}ms"]
+            return {
+                "statements": [
+                    {
+                        "shape": shape,
+                        "count": s.count,
+                        "total_ms": round(s.total_ms, 3),
+                        "avg_ms": round(s.total_ms / s.count, 3),
+                        "max_ms": round(s.max_ms, 3),
+                        "rows": s.rows,
+                        "histogram": {label: n for label, n in zip(labels, s.buckets) if n},
+                    }
+                    for shape, s in shapes[:top]
+                ],
+                "pool_checkout": {
+                    "count": self._checkout.count,
+                    "total_ms": round(self._checkout.total_ms, 3),
+                    "max_ms": round(self._checkout.max_ms, 3),
+                    "histogram": {label: n for label, n in zip(labels, self._checkout.buckets) if n},
+                },
+            }
+
+    def log_summary(self, top=15):
+        summary = self.summary(top)
+        if not summary["statements"] and not summary["pool_checkout"]["count"]:
+            return
+        logger.info("[DB Stats] Top statements by total time:")
+        for s in summary["statements"]:
+            logger.info(
+                f"[DB Stats] {s['count']:>6}x  total {s['total_ms']:>10.1f} ms  avg {s['avg_ms']:>8.2f}  "
+                f"max {s['max_ms']:>8.1f}  rows {s['rows']:>8}  {s['histogram']}  | {s['shape']}"
+            )
+        c = summary["pool_checkout"]
+        logger.info(f"[DB Stats] Pool checkouts: {c['count']}, waited {c['total_ms']:.1f} ms total, "
+                    f"max {c['max_ms']:.1f} ms {c['histogram']}")
+
+
+class InstrumentedQueuePool(QueuePool):
+    """
+    QueuePool that reports how long each checkout waited for a connection.
+    The stats carry over when the engine replaces its pool (engine.dispose()).
+    """
+
+    stats = None
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.stats = self.stats
+        return pool
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            if self.stats is not None:
+                self.stats.record_checkout((time.perf_counter() - start) * 1000)
+
+
+_stats = QueryStats()
+
+
+def get_query_stats():
+    """Return the process-wide QueryStats (also available on demand mid-run)."""
+    return _stats
@@ -1,6 +1,6 @@
 import uuid
 from sqlalchemy.orm import declarative_base, relationship
-from sqlalchemy import Column, String, Date, ForeignKey, Integer
+from sqlalchemy import Column, String, Date, ForeignKey, Integer, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 
 Base = declarative_base()
@@ -46,7 +46,7 @@ class Schedule(Base):
     __tablename__ = "schedules"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    date = Column(Date, nullable=False)
+    date = Column(Date, unique=True, nullable=False)
 
     tournaments = relationship("TournamentSchedule", back_populates="schedule")
 
@@ -71,21 +71,30 @@ class TournamentSchedule(Base):
 # ----------------------
 # Pro Points
 # ----------------------
-class ProPointsPlayer(Base):
-    __tablename__ = "pro_points_players"
+# Cup name under which a player's overall total is stored
+TOTAL_CUP = "Total"
+
+
+class ProPointsEntry(Base):
+    __tablename__ = "pro_points_entries"
+    __table_args__ = (
+        UniqueConstraint("points_id", "player_id", "cup", name="uq_pro_points_entries"),
+        Index("ix_pro_points_entries_standings", "points_id", "cup", "points"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
-    rank = Column(Integer, nullable=False)
+    season_id = Column(String, index=True, nullable=False)
+    points_id = Column(String, nullable=False)
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), index=True, nullable=False)
+
+    rank = Column(Integer, nullable=True)
     nickname = Column(String, nullable=False)
     main_char = Column(String, nullable=False)
 
-    total_points = Column(Integer, default=0)
-    demacia_cup_total = Column(Integer, default=0)
-    bilgewater_cup_total = Column(Integer, default=0)
-    shurima_cup_total = Column(Integer, default=0)
+    cup = Column(String, nullable=False)      # cup column header; TOTAL_CUP for the overall total
+    points = Column(Integer, nullable=True)
 
-    tournament_id = Column(String, index=True, nullable=False)
     url = Column(String, nullable=False)
 
 
@@ -112,13 +121,24 @@ class Player(Base):
     __tablename__ = "players"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    name = Column(String, nullable=False)
+    name = Column(String, index=True, nullable=False)
 
     region_id = Column(UUID(as_uuid=True), ForeignKey("regions.id"), nullable=True)
 
     region = relationship("Region", back_populates="players")
     scores = relationship("Score", back_populates="player")
     lobby_entries = relationship("LobbyPlayer", back_populates="player")
+    aliases = relationship("PlayerAlias", back_populates="player")
+
+
+class PlayerAlias(Base):
+    __tablename__ = "player_aliases"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    alias = Column(String, unique=True, nullable=False)     # canonical key, see src/db/identity.py
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), index=True, nullable=False)
+
+    player = relationship("Player", back_populates="aliases")
 
 
 # ----------------------
@@ -126,6 +146,9 @@ class Player(Base):
 # ----------------------
 class Game(Base):
     __tablename__ = "games"
+    __table_args__ = (
+        Index("ix_games_event_day_region_game", "event_id", "day", "region_id", "game_number"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
@@ -146,9 +169,12 @@ class Game(Base):
 # ----------------------
 class Score(Base):
     __tablename__ = "scores"
+    __table_args__ = (
+        Index("ix_scores_game_player", "game_id", "player_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), nullable=False)
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), index=True, nullable=False)
     game_id = Column(UUID(as_uuid=True), ForeignKey("games.id"), nullable=False)
     score = Column(Integer, nullable=False)
 
@@ -161,6 +187,9 @@ class Score(Base):
 # ----------------------
 class Lobby(Base):
     __tablename__ = "lobbies"
+    __table_args__ = (
+        Index("ix_lobbies_game_lobby", "game_id", "lobby_number"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     game_id = Column(UUID(as_uuid=True), ForeignKey("games.id"), nullable=False)
@@ -175,10 +204,13 @@ class Lobby(Base):
 # ----------------------
 class LobbyPlayer(Base):
     __tablename__ = "lobby_players"
+    __table_args__ = (
+        Index("ix_lobby_players_lobby_player", "lobby_id", "player_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     lobby_id = Column(UUID(as_uuid=True), ForeignKey("lobbies.id"), nullable=False)
-    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), nullable=False)
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), index=True, nullable=False)
     placement = Column(Integer, nullable=True)
     score = Column(Integer, nullable=False)
 
@@ -191,10 +223,14 @@ class LobbyPlayer(Base):
 # ----------------------
 class DailyResult(Base):
     __tablename__ = "daily_results"
+    __table_args__ = (
+        # Leading tournament_id also serves plain per-tournament lookups
+        Index("ix_daily_results_tournament_day_region", "tournament_id", "day", "region_id"),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
-    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), nullable=False)
-    tournament_id = Column(String, index=True, nullable=False)
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), index=True, nullable=False)
+    tournament_id = Column(String, nullable=False)
     day = Column(Integer, nullable=False)
     region_id = Column(UUID(as_uuid=True), ForeignKey("regions.id"), nullable=False)
 
@@ -204,3 +240,43 @@ class DailyResult(Base):
 
     player = relationship("Player")
     region = relationship("Region")
+
+
+# ----------------------
+# Leaderboard aggregates (maintained by src/db/aggregates.py)
+# ----------------------
+class PlayerEventStats(Base):
+    __tablename__ = "player_event_stats"
+    __table_args__ = (
+        UniqueConstraint("event_id", "player_id", name="uq_player_event_stats"),
+        Index("ix_player_event_stats_leaderboard", "event_id", "points"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), index=True, nullable=False)
+
+    points = Column(Integer, nullable=False, default=0)
+    games_played = Column(Integer, nullable=False, default=0)
+    placement_sum = Column(Integer, nullable=False, default=0)   # avg placement = placement_sum / placed_games
+    placed_games = Column(Integer, nullable=False, default=0)
+    top4 = Column(Integer, nullable=False, default=0)
+
+
+class PlayerEventDayStats(Base):
+    __tablename__ = "player_event_day_stats"
+    __table_args__ = (
+        UniqueConstraint("event_id", "day", "player_id", name="uq_player_event_day_stats"),
+        Index("ix_player_event_day_stats_leaderboard", "event_id", "day", "points"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
+    day = Column(Integer, nullable=False)
+    player_id = Column(UUID(as_uuid=True), ForeignKey("players.id"), index=True, nullable=False)
+
+    points = Column(Integer, nullable=False, default=0)
+    games_played = Column(Integer, nullable=False, default=0)
+    placement_sum = Column(Integer, nullable=False, default=0)
+    placed_games = Column(Integer, nullable=False, default=0)
+    top4 = Column(Integer, nullable=False, default=0)
@@ -0,0 +1,155 @@
+from sqlalchemy import select, func, text, Numeric
+from sqlalchemy.dialects import postgresql
+from src.db.models import (
+    Event, Region, Player, Game, Lobby, LobbyPlayer, DailyResult, PlayerEventStats, PlayerEventDayStats,
+)
+
+# Each query below is shaped to be served by an index from migration 0003:
+#   standings       -> ix_daily_results_tournament_day_region
+#   player_history  -> ix_lobby_players_player_id, then PK lookups up the hierarchy
+#   lobby_breakdown -> ix_events_tournament_id, ix_games_event_day_region_game,
+#                      ix_lobbies_game_lobby, ix_lobby_players_lobby_player
+#   leaderboard     -> ix_events_tournament_id, ix_player_event[_day]_stats_leaderboard
+
+
+def standings_query(tournament_id, day=None, region_code=None):
+    """Daily standings for one tournament; day defaults to the latest played day."""
+    if day is None:
+        day = (
+            select(func.max(DailyResult.day))
+            .where(DailyResult.tournament_id == tournament_id)
+            .scalar_subquery()
+        )
+    stmt = (
+        select(
+            Region.code.label("region"),
+            DailyResult.day,
+            Player.name.label("player"),
+            DailyResult.total_points,
+            DailyResult.qualified,
+            DailyResult.tiebreaker,
+        )
+        .join(Region, Region.id == DailyResult.region_id)
+        .join(Player, Player.id == DailyResult.player_id)
+        .where(DailyResult.tournament_id == tournament_id, DailyResult.day == day)
+        .order_by(Region.code, DailyResult.total_points.desc(), Player.name)
+    )
+    if region_code is not None:
+        stmt = stmt.where(Region.code == region_code)
+    return stmt
+
+
+def player_history_query(player_id, limit=None):
+    """Every lobby a player sat in, newest tournament first."""
+    stmt = (
+        select(
+            Event.tournament_id,
+            Event.name.label("event"),
+            Region.code.label("region"),
+            Game.day,
+            Game.game_number,
+            Lobby.lobby_number,
+            LobbyPlayer.placement,
+            LobbyPlayer.score,
+        )
+        .select_from(LobbyPlayer)
+        .join(Lobby, Lobby.id == LobbyPlayer.lobby_id)
+        .join(Game, Game.id == Lobby.game_id)
+        .join(Event, Event.id == Game.event_id)
+        .join(Region, Region.id == Game.region_id)
+        .where(LobbyPlayer.player_id == player_id)
+        .order_by(Event.tournament_id.desc(), Game.day, Game.game_number)
+    )
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def lobby_breakdown_query(tournament_id, day, game_number=None, region_code=None):
+    """Lobby-by-lobby placements for one tournament day (optionally one game/region)."""
+    stmt = (
+        select(
+            Region.code.label("region"),
+            Game.game_number,
+            Lobby.lobby_number,
+            Player.name.label("player"),
+            LobbyPlayer.placement,
+            LobbyPlayer.score,
+        )
+        .select_from(Event)
+        .join(Game, Game.event_id == Event.id)
+        .join(Region, Region.id == Game.region_id)
+        .join(Lobby, Lobby.game_id == Game.id)
+        .join(LobbyPlayer, LobbyPlayer.lobby_id == Lobby.id)
+        .join(Player, Player.id == LobbyPlayer.player_id)
+        .where(Event.tournament_id == tournament_id, Game.day == day)
+        .order_by(Region.code, Game.game_number, Lobby.lobby_number, LobbyPlayer.placement)
+    )
+    if game_number is not None:
+        stmt = stmt.where(Game.game_number == game_number)
+    if region_code is not None:
+        stmt = stmt.where(Region.code == region_code)
+    return stmt
+
+
+def leaderboard_query(tournament_id, day=None, limit=None):
+    """
+    Tournament (or single-day) leaderboard from the aggregate tables kept by
+    src/db/aggregates.py: one index range scan, however many games exist.
+    """
+    stats = PlayerEventStats if day is None else PlayerEventDayStats
+    stmt = (
+        select(
+            Player.name.label("player"),
+            stats.points,
+            stats.games_played,
+            (stats.placement_sum.cast(Numeric) / func.nullif(stats.placed_games, 0)).label("avg_placement"),
+            stats.top4,
+        )
+        .join(Event, Event.id == stats.event_id)
+        .join(Player, Player.id == stats.player_id)
+        .where(Event.tournament_id == tournament_id)
+        .order_by(stats.points.desc(), Player.name)
+    )
+    if day is not None:
+        stmt = stmt.where(stats.day == day)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+
+def standings(session, tournament_id, day=None, region_code=None):
+    return [dict(r) for r in session.execute(standings_query(tournament_id, day, region_code)).mappings()]
+
+
+def player_history(session, player_id, limit=None):
+    return [dict(r) for r in session.execute(player_history_query(player_id, limit)).mappings()]
+
+
+def lobby_breakdown(session, tournament_id, day, game_number=None, region_code=None):
+    stmt = lobby_breakdown_query(tournament_id, day, game_number, region_code)
+    return [dict(r) for r in session.execute(stmt).mappings()]
+
+
+def leaderboard(session, tournament_id, day=None, limit=None):
+    return [dict(r) for r in session.execute(leaderboard_query(tournament_id, day, limit)).mappings()]
+
+
+def explain(session, stmt, analyze=False):
+    """
+    EXPLAIN (optionally ANALYZE) a statement and return the plan lines.
+    Bound parameters are inlined so the planner sees real values.
+    """
+    sql = str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+    options = "ANALYZE, BUFFERS" if analyze else "COSTS"
+    return [row[0] for row in session.execute(text(f"EXPLAIN ({options}) {sql}"))]
+
+
+def seq_scanned_tables(plan_lines):
+    """Tables a plan reads with a sequential scan."""
+    tables = set()
+    for line in plan_lines:
+        marker = line.find("Seq Scan on ")
+        if marker != -1:
+            tables.add(line[marker + len("Seq Scan on "):].split()[0])
+    return tables
@@ -1,7 +1,9 @@
 import os
+import atexit
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
+from src.db.instrumentation import InstrumentedQueuePool, get_query_stats
 
 # Load environment variables from .env
 load_dotenv()
@@ -10,5 +12,29 @@ DATABASE_URL = os.getenv("DATABASE_URL")
 if not DATABASE_URL:
     raise RuntimeError("DATABASE_URL is not set. Please configure .env")
 
-engine = create_engine(DATABASE_URL, echo=True, pool_pre_ping=True)
+# Verbose SQL logging is opt-in: formatting every statement is costly on bulk loads
+SQL_ECHO = os.getenv("SQL_ECHO", "0") == "1"
+
+# Pool sizing for concurrent loaders
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# Per-statement latency / row / pool-wait stats (src/db/instrumentation.py)
+DB_STATS = os.getenv("DB_STATS", "1") != "0"
+
+engine = create_engine(
+    DATABASE_URL,
+    echo=SQL_ECHO,
+    pool_pre_ping=True,
+    poolclass=InstrumentedQueuePool,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    pool_timeout=DB_POOL_TIMEOUT,
+)
 SessionLocal = sessionmaker(bind=engine)
+
+if DB_STATS:
+    get_query_stats().attach(engine)
+    # Dump the summary when the run ends; get_query_stats().summary() works any time
+    atexit.register(get_query_stats().log_summary)
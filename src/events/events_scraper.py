@@ -1,39 +1,74 @@
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import logging
+import re
 import time
 from pathlib import Path
-import json
 from src.config.settings import BASE_URL
 from src.utils.logger import logger
+from src.utils.browser_pool import get_pool
+from src.utils.page_wait import wait_until_ready, SECTION_GRACE_MS
+from src.utils.http_fetcher import fetch_via_http
+from src.utils.raw_output import raw_path, RawWriter
 
 # Directory to save raw scraped data
 RAW_DATA_DIR = Path("data/raw")
 RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
-RAW_FILE = RAW_DATA_DIR / "events.json"
+RAW_FILE = raw_path(RAW_DATA_DIR / "events")
 
 URL = f"{BASE_URL}/en-US/schedule"
 
-def fetch_events_by_id(container_id, category, retries=3, delay=5):
+
+def events_from_html(soup, container_id):
+    """
+    Same extraction as the in-page JS, on server-rendered HTML.
+    Returns None when the container has not been rendered server-side.
+    """
+    container = soup.select_one(f'[id*="{container_id}"]')
+    if container is None:
+        return None
+
+    items = []
+    for a in container.select("ol > li > a"):
+        ps = a.select("div > p")
+        name = ps[0].get_text().strip() if len(ps) > 0 else "unknown"
+        type_ = re.sub("event", "", ps[1].get_text().strip(), flags=re.I).strip() if len(ps) > 1 else "unknown"
+        url = a.get("href") or ""
+
+        # Extract tournament_id from url
+        tournament_id = url.split("/")[-1]
+
+        items.append({"url": url, "tournament_id": tournament_id, "name": name, "type": type_})
+    return items or None
+
+def fetch_events_by_id(container_id, category, retries=3, delay=5, pool=None):
     """
     Scrape events from a specific container on the schedule page.
     Args:
         container_id (str): The HTML id of the container
         category (str): Friendly name for logging
+        pool (BrowserPool): Browser pool to borrow a page from (defaults to the shared one)
     Returns:
         list of dicts: Each dict has url, name, type, category, tournament_id
     """
+    pool = pool or get_pool()
     attempt = 0
     while attempt < retries:
         try:
             logger.info(f"[Events Scraper] {category} ({container_id}) attempt {attempt+1}")
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.goto(URL, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(3000)
+
+            async def extract(page):
+                await page.goto(URL, wait_until="domcontentloaded", timeout=30000)
+                await wait_until_ready(page, "events", selector=f'main, [id*="{container_id}"]')
+                # The list can render just after the page; an empty category has none (-> [])
+                try:
+                    await wait_until_ready(page, "events_list", selector=f'[id*="{container_id}"] ol > li > a',
+                                           timeout=SECTION_GRACE_MS)
+                except PlaywrightTimeoutError:
+                    logger.info(f"[Events Scraper] {category} has no events listed")
+                    return []
 
                 # Execute JS to scrape items
-                items = page.evaluate(f"""
+                return await page.evaluate(f"""
                 () => {{
                     const container = document.querySelector('[id*="{container_id}"]');
                     if (!container) return [];
@@ -53,12 +88,15 @@ def fetch_events_by_id(container_id, category, retries=3, delay=5):
                 }}
             """)
 
-                browser.close()
+            # Plain HTTP first; the browser only if the list is rendered client-side
+            items = fetch_via_http("events", URL, lambda soup, payloads: events_from_html(soup, container_id))
+            if items is None:
+                items = pool.run(extract)
 
-                for e in items:
-                    e['category'] = category
+            for e in items:
+                e['category'] = category
 
-                return items
+            return items
 
         except PlaywrightTimeoutError as e:
             logger.warning(f"[Events Scraper] Timeout on attempt {attempt+1} for {category}: {e}")
@@ -72,32 +110,35 @@ def fetch_events_by_id(container_id, category, retries=3, delay=5):
     return []
 
 
-def fetch_pro_circuit():
+def fetch_pro_circuit(pool=None):
     """Fetch Pro Circuit events"""
-    return fetch_events_by_id('r0', "Pro Circuit")
+    return fetch_events_by_id('r0', "Pro Circuit", pool=pool)
 
 
-def fetch_path_to_pro():
+def fetch_path_to_pro(pool=None):
     """Fetch Path to Pro events"""
-    return fetch_events_by_id('r2', "Path to Pro")
+    return fetch_events_by_id('r2', "Path to Pro", pool=pool)
 
 
-def scrape():
+def scrape(pool=None):
     """
     Main entry point for events scraping.
-    Combines Pro Circuit and Path to Pro, saves raw JSON, and returns list.
+    Combines Pro Circuit and Path to Pro, streams raw NDJSON, and returns list.
     """
     logger.info("[Events Scraper] Starting scrape...")
 
-    pro_circuit = fetch_pro_circuit()
-    path_to_pro = fetch_path_to_pro()
-
-    all_events = pro_circuit + path_to_pro
-
-    # Save raw JSON
-    with RAW_FILE.open("w", encoding="utf-8") as f:
-        json.dump(all_events, f, ensure_ascii=False, indent=4)
-
-    logger.info(f"[Events Scraper] Finished. Scraped {len(all_events)} items, saved to {RAW_FILE}")
+    # Each category is written as soon as it is scraped; the file is only
+    # replaced at the end, and not at all when nothing changed since the last run
+    all_events = []
+    with RawWriter(RAW_FILE, url=URL) as out:
+        for fetch in (fetch_pro_circuit, fetch_path_to_pro):
+            events = fetch(pool)
+            out.write_many(events)
+            all_events += events
+
+    if out.replaced:
+        logger.info(f"[Events Scraper] Finished. Scraped {len(all_events)} items, saved to {RAW_FILE}")
+    else:
+        logger.info(f"[Events Scraper] Finished. Scraped {len(all_events)} items, unchanged since last run")
 
     return all_events
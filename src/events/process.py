@@ -1,16 +1,34 @@
 from src.events.models import EventItem
-from src.db.insert import insert_event
+from src.db.insert import upsert_events
+from src.db.ingest import ingest
+from src.utils.fingerprint import get_store, log_diff
 
-def process_events(raw_events):
+def process_events(raw_events, batch_size=None):
     """
-    Validate and insert scraped events into DB.
+    Validate scraped events and bulk upsert them into DB.
+    Events unchanged since their last successful load are skipped
+    before validation.
+
+    Returns the ingest report (see src/db/ingest.py). This used to be the
+    list of loaded tournament_ids; those are now
+    [e.tournament_id for e in report["written"]].
     """
-    inserted_ids = []
-    for raw in raw_events:
-        try:
-            event = EventItem(**raw)   # validate with Pydantic
-            inserted_id = insert_event(event)
-            inserted_ids.append(inserted_id)
-        except Exception as err:
-            print(f"[events] Skipped due to error: {err}")
-    return inserted_ids
+    fingerprints = get_store()
+    changed, skipped = fingerprints.diff("db.events", raw_events, key="tournament_id")
+    log_diff("events", len(changed), skipped)
+
+    options = {"batch_size": batch_size} if batch_size else {}
+    report = ingest(
+        changed,
+        EventItem,
+        lambda session, batch: upsert_events(batch, session=session),
+        label="events",
+        **options,
+    )
+
+    # Only committed events count as loaded
+    raw_by_id = {raw.get("tournament_id"): raw for raw in changed}
+    for event in report["written"]:
+        fingerprints.mark("db.events", event.tournament_id, raw_by_id[event.tournament_id])
+    fingerprints.save()
+    return report
@@ -0,0 +1 @@
+from .parquet_export import export_all
@@ -0,0 +1,239 @@
+import re
+import time
+from datetime import date
+from pathlib import Path
+from urllib.parse import urlparse, parse_qs
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+from src.config.settings import RAW_DATA_DIR, EXPORT_DIR
+from src.utils.raw_output import raw_path, iter_records, read_document
+from src.utils.fingerprint import get_store
+from src.utils.logger import logger
+from src.ladder_points.ladder_table import to_frame, week_columns
+
+RAW_DIR = Path(RAW_DATA_DIR)
+TOURNAMENT_DIR = RAW_DIR / "tournaments"
+
+# Typed schemas; partition columns come first and are stored in the directory names
+SCHEMAS = {
+    "ladder_snapshots": pa.schema([
+        ("shard", pa.string()), ("snapshot_date", pa.date32()),
+        ("ladder_id", pa.string()), ("updated", pa.string()),
+        ("rank", pa.int32()), ("participant", pa.string()), ("total", pa.int32()),
+        ("week", pa.int16()), ("week_points", pa.int32()),
+    ]),
+    "pro_points": pa.schema([
+        ("season_id", pa.string()), ("snapshot_date", pa.date32()),
+        ("points_id", pa.string()), ("rank", pa.int32()), ("nickname", pa.string()),
+        ("main_char", pa.string()), ("total_points", pa.int32()),
+        ("cup", pa.string()), ("cup_points", pa.int32()),
+    ]),
+    "schedule": pa.schema([
+        ("date", pa.date32()),
+        ("tournament_id", pa.string()), ("name", pa.string()), ("region", pa.string()), ("time", pa.string()),
+    ]),
+    "tournament_placements": pa.schema([
+        ("region", pa.string()), ("start_date", pa.date32()),
+        ("tournament_id", pa.string()), ("name", pa.string()),
+        ("position", pa.string()), ("placement", pa.int16()), ("prize", pa.string()),
+    ]),
+    "points_allocation": pa.schema([
+        ("region", pa.string()), ("start_date", pa.date32()),
+        ("tournament_id", pa.string()), ("day", pa.string()),
+        ("placement", pa.string()), ("placement_rank", pa.int16()), ("points", pa.int32()),
+    ]),
+}
+PARTITIONS = {
+    "ladder_snapshots": ["shard", "snapshot_date"],
+    "pro_points": ["season_id", "snapshot_date"],
+    "schedule": ["date"],
+    "tournament_placements": ["region", "start_date"],
+    "points_allocation": ["region", "start_date"],
+}
+
+_LEADING_INT = re.compile(r"-?\d[\d,]*")
+
+
+def _int(value):
+    """First integer in a scraped cell ("1,234", "3rd", "-" -> None)."""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return int(value)
+    match = _LEADING_INT.search(str(value or ""))
+    return int(match.group().replace(",", "")) if match else None
+
+
+def _date(value, default=None):
+    parsed = pd.to_datetime(value, errors="coerce")
+    return default if pd.isna(parsed) else parsed.date()
+
+
+def _source_changed(dataset, path):
+    """Cheap change check per source file (mtime + size) so unchanged sources are not re-exported."""
+    stat = path.stat()
+    return get_store().changed_digest(f"export.{dataset}", path, f"{stat.st_mtime_ns}:{stat.st_size}")
+
+
+def _mark_source(dataset, path):
+    stat = path.stat()
+    get_store().mark_digest(f"export.{dataset}", path, f"{stat.st_mtime_ns}:{stat.st_size}")
+
+
+# ===== Row builders (raw records -> flat typed rows) =====
+def _shard_rows(data, today):
+    players = data.get("players", [])
+    if not players:
+        return None
+    url = urlparse(players[0].get("url") or "")
+    shard = data.get("shard") or (parse_qs(url.query).get("shard") or ["unknown"])[0]
+
+    frame = to_frame(data)
+    long = frame.melt(
+        id_vars=["rank", "participant", "total"], value_vars=week_columns(frame),
+        var_name="week", value_name="week_points",
+    )
+    long["week"] = long["week"].str.removeprefix("week_").astype("int16")
+    long["shard"] = shard
+    long["snapshot_date"] = _date(data.get("updated"), today)
+    long["ladder_id"] = url.path.rstrip("/").rsplit("/", 1)[-1] or None
+    long["updated"] = data.get("updated")
+    return long
+
+
+def _parts(records, key):
+    """The per-shard/season records of a raw file; older files held one merged {key: {...}} document."""
+    for doc in records:
+        yield from doc[key].values() if key in doc else [doc]
+
+
+def ladder_rows(records, today):
+    """Long (player, week) rows, one record per shard."""
+    frames = [f for f in (_shard_rows(data, today) for data in _parts(records, "shards")) if f is not None]
+    return pd.concat(frames, ignore_index=True) if frames else []
+
+
+# Cup columns of pro points files written before cups were read from the table header
+_LEGACY_CUPS = {
+    "demacia_cup_total": "Demacia Cup", "bilgewater_cup_total": "Bilgewater Cup", "shurima_cup_total": "Shurima Cup",
+}
+
+
+def pro_points_rows(records, today):
+    """Long (player, cup) rows, one record per season."""
+    rows = []
+    for data in _parts(records, "seasons"):
+        for player in data.get("players", []):
+            match = re.search(r"/season/([^/]+)/points/([^/?]+)", player.get("url") or "")
+            base = {
+                "season_id": player.get("season_id") or (match.group(1) if match else "unknown"),
+                "snapshot_date": today,
+                "points_id": player.get("points_id") or (match.group(2) if match else player.get("tournament_id")),
+                **{k: player.get(k) for k in ("nickname", "main_char")},
+                **{k: _int(player.get(k)) for k in ("rank", "total_points")},
+            }
+            cups = player.get("cups") or {name: player.get(k) for k, name in _LEGACY_CUPS.items() if k in player}
+            rows += [{**base, "cup": cup, "cup_points": _int(points)} for cup, points in cups.items()]
+    return rows
+
+
+def schedule_rows(sections):
+    return [
+        {"date": _date(section.get("date")), **{k: t.get(k) for k in ("tournament_id", "name", "region", "time")}}
+        for section in sections
+        for t in section.get("tournaments", [])
+    ]
+
+
+def _tournament_partition(doc):
+    return (doc.get("region") or "unknown", _date(doc.get("start_date")))
+
+
+def tournament_rows(doc):
+    region, start_date = _tournament_partition(doc)
+    base = {"region": region, "start_date": start_date, "tournament_id": doc.get("tournament_id")}
+    placements = [
+        {**base, "name": doc.get("name"), "position": item.get("position"),
+         "placement": _int(item.get("position")), "prize": item.get("prize")}
+        for item in (doc.get("placements_prizes") or {}).get("items", [])
+    ]
+    allocation = [
+        {**base, "day": day.get("title"), "placement": p.get("placement"),
+         "placement_rank": _int(p.get("placement")), "points": _int(p.get("points"))}
+        for day in (doc.get("points_allocation") or {}).get("days", [])
+        for p in day.get("points", [])
+    ]
+    return placements, allocation
+
+
+# ===== Writing =====
+def write_dataset(name, rows, out_dir=EXPORT_DIR):
+    """
+    Write `rows` (list of dicts or a DataFrame) as a hive-partitioned
+    Parquet dataset under out_dir/name.
+
+    Only the partitions present in `rows` are touched: each is replaced as a
+    whole (existing_data_behavior="delete_matching"), every other partition
+    is kept. Re-exporting a source is therefore idempotent and a run only
+    appends/refreshes what it brings.
+    """
+    if len(rows) == 0:
+        return 0
+    schema = SCHEMAS[name]
+    frame = rows[schema.names] if isinstance(rows, pd.DataFrame) else pd.DataFrame(rows, columns=schema.names)
+    table = pa.Table.from_pandas(frame, schema=schema, preserve_index=False)
+    partition_schema = pa.schema([schema.field(c) for c in PARTITIONS[name]])
+
+    ds.write_dataset(
+        table,
+        Path(out_dir) / name,
+        format="parquet",
+        partitioning=ds.partitioning(partition_schema, flavor="hive"),
+        existing_data_behavior="delete_matching",
+        basename_template=f"part-{time.time_ns()}-{{i}}.parquet",
+    )
+    logger.info(f"[Parquet Export] {name}: {table.num_rows} rows")
+    return table.num_rows
+
+
+def export_all(out_dir=EXPORT_DIR, full=False):
+    """
+    Export the raw scraper output under data/raw to Parquet datasets.
+    Sources unchanged since the last export are skipped unless `full`.
+    Returns {dataset: rows written}.
+    """
+    today = date.today()
+    written = {}
+    exported = []
+
+    sources = {
+        "ladder_snapshots": (raw_path(RAW_DIR / "ladder_points"), lambda p: ladder_rows(iter_records(p), today)),
+        "pro_points": (raw_path(RAW_DIR / "pro_points"), lambda p: pro_points_rows(iter_records(p), today)),
+        "schedule": (raw_path(RAW_DIR / "schedule"), lambda p: schedule_rows(iter_records(p))),
+    }
+    for name, (path, build) in sources.items():
+        if not path.exists() or not (full or _source_changed(name, path)):
+            continue
+        written[name] = write_dataset(name, build(path), out_dir)
+        exported.append((name, path))
+
+    # Tournaments share partitions (region/start_date), so a changed file
+    # re-exports every tournament of its partition together.
+    paths = sorted(p for p in TOURNAMENT_DIR.glob("*.ndjson*") if not p.name.endswith(".partial"))
+    changed = [p for p in paths if full or _source_changed("tournaments", p)]
+    if changed:
+        docs = {p: read_document(p) for p in paths}
+        affected = {_tournament_partition(docs[p]) for p in changed if docs[p]}
+        placements, allocation = [], []
+        for doc in docs.values():
+            if doc and _tournament_partition(doc) in affected:
+                p_rows, a_rows = tournament_rows(doc)
+                placements += p_rows
+                allocation += a_rows
+        written["tournament_placements"] = write_dataset("tournament_placements", placements, out_dir)
+        written["points_allocation"] = write_dataset("points_allocation", allocation, out_dir)
+        exported += [("tournaments", p) for p in changed]
+
+    for name, path in exported:
+        _mark_source(name, path)
+    get_store().save()
+    return written
@@ -1,45 +1,264 @@
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pathlib import Path
 import logging
 import time
-import json
+from datetime import datetime
+from urllib.parse import urlencode
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.utils.logger import logger
-from src.config.settings import BASE_URL
+from src.utils.browser_pool import get_pool
+from src.utils.page_wait import wait_until_ready
+from src.utils.payload_capture import PayloadCapture, find_rows, find_value, pick
+from src.utils.http_fetcher import fetch_via_http
+from src.utils.raw_output import raw_path, RawWriter
+from src.ladder_points.snapshot_store import get_snapshot_store
+from src.config.settings import BASE_URL, JSON_EXTRACTION, LADDER_SHARDS, PAGE_READY_TIMEOUT_MS
 
 # ===== Raw data folder =====
 RAW_DATA_DIR = Path("data/raw")
 RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
-RAW_FILE = RAW_DATA_DIR / "ladder_points.json"
+RAW_FILE = raw_path(RAW_DATA_DIR / "ladder_points")
 
-# URL for Ladder Points page
-LADDER_URL = f"{BASE_URL}/en-US/ladder-points/115376765699628532?shard=SG2"
+# URL for Ladder Points pages (one per shard, ?shard=...&page=...)
+LADDER_BASE_URL = f"{BASE_URL}/en-US/ladder-points/115376765699628532"
+DEFAULT_SHARD = "SG2"
 
-def scrape(retries=3, delay=5):
+# Safety cap on pagination per shard
+MAX_PAGES = 100
+NEXT_PAGE_SELECTOR = 'a[rel="next"], button[aria-label*="next" i], a[aria-label*="next" i]'
+FIRST_PARTICIPANT_JS = "() => document.querySelector('table tbody tr td:nth-child(2)')?.textContent.trim() ?? null"
+
+# Player rows of the currently rendered table page (same shape as the full extraction)
+TABLE_ROWS_JS = """
+() => {
+    const table = document.querySelector('table');
+    if (!table) return [];
+    const headers = Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim());
+    const players = [];
+    table.querySelectorAll('tbody tr').forEach(tr => {
+        const tds = tr.querySelectorAll('td');
+        if (tds.length < 3) return;
+        const points = {};
+        for (let i = 2; i < tds.length; i++) points[headers[i]] = tds[i].textContent.trim();
+        players.push({ rank: parseInt(tds[0].textContent.trim()), participant: tds[1].textContent.trim(), points });
+    });
+    return players;
+}
+"""
+
+
+def ladder_url(shard, page=None):
+    params = {"shard": shard}
+    if page and page > 1:
+        params["page"] = page
+    return f"{LADDER_BASE_URL}?{urlencode(params)}"
+
+
+def table_from_payloads(payloads):
+    """
+    Build {'headers', 'players'} from a captured JSON payload, in the same
+    shape the DOM scrape produces (points as header -> text).
+    Returns None when no payload looks like the ladder table.
+    """
+    rows = find_rows(
+        payloads,
+        ("rank", "position"),
+        ("participant", "displayName", "name", "gameName", "riotId"),
+        ("points", "totalPoints", "total"),
+    )
+    if not rows:
+        return None
+
+    weeks = max((len(pick(r, "weeks", "weeklyPoints", default=[])) for r in rows), default=0)
+    headers = ["Rank", "Participant", "Total"] + [f"Week {i + 1}" for i in range(weeks)]
+
+    players = []
+    for row in rows:
+        game_name, tag = pick(row, "gameName"), pick(row, "tagLine")
+        participant = pick(row, "participant", "displayName", "name", "riotId",
+                           default=f"{game_name}#{tag}" if tag else game_name)
+
+        week_points = pick(row, "weeks", "weeklyPoints", default=[])
+        values = [pick(row, "totalPoints", "points", "total")]
+        values += [w.get("points") if isinstance(w, dict) else w for w in week_points]
+        values += [None] * (len(headers) - 2 - len(values))
+
+        points = {h: "-" if v is None else str(v) for h, v in zip(headers[2:], values)}
+        players.append({"rank": pick(row, "rank", "position"), "participant": participant, "points": points})
+
+    return {"headers": headers, "players": players}
+
+
+def text_sections_from_html(soup):
+    """Updated / Next Update / Seeding from server-rendered HTML (mirrors the in-page JS)."""
+    result = {}
+
+    def labelled(label):
+        for p in soup.find_all("p"):
+            span = p.find("span")
+            if span is not None and label in span.get_text():
+                return p
+        return None
+
+    for key, label in (("updated", "Updated"), ("next_update", "Next Update")):
+        p = labelled(label)
+        if p is not None and ":" in p.get_text():
+            # Split on the label's colon only: the time has colons too ("5:00 PM")
+            result[key] = p.get_text().split(":", 1)[1].strip()
+
+    seeding = {"description": None, "list": []}
+    seeding_h4 = next((h for h in soup.find_all("h4") if h.get_text().strip() == "Seeding in Regional Finals"), None)
+    desc_div = seeding_h4.find_next_sibling() if seeding_h4 is not None else None
+    if desc_div is not None:
+        seeding["description"] = desc_div.get_text().strip()
+
+        hr = desc_div.find_next_sibling()
+        while hr is not None and hr.name != "hr":
+            hr = hr.find_next_sibling()
+
+        container = hr.find_next_sibling() if hr is not None else None
+        if container is not None:
+            for shard_div in container.select("div.d_flex.flex-d_column.gap_8"):
+                name_el = shard_div.find("p")
+                divs = shard_div.find_all("div")
+                seeding["list"].append({
+                    "shard": (name_el.get_text().strip() or None) if name_el is not None else None,
+                    "week1": (divs[0].get_text().strip() or None) if len(divs) > 0 else None,
+                    "play_ins": (divs[1].get_text().strip() or None) if len(divs) > 1 else None,
+                })
+
+    result["seeding"] = seeding
+    return result
+
+
+def data_from_http(soup, payloads):
+    """Full Ladder Points output from an HTTP fetch, or None if the table needs JS."""
+    table = table_from_payloads(payloads)
+    if table is None:
+        return None
+    data = text_sections_from_html(soup)
+    data.update(table)
+    return data
+
+
+def page_count_from_payloads(payloads):
+    """Total page count advertised by a paginated JSON payload, or None when none is."""
+    pages = find_value(payloads, "totalPages", "pageCount", "lastPage")
+    try:
+        return max(1, int(pages))
+    except (TypeError, ValueError):
+        return None
+
+
+def discover_shards(data):
+    """Shard names listed in the "Seeding in Regional Finals" block."""
+    return [s["shard"] for s in (data.get("seeding") or {}).get("list", []) if s.get("shard")]
+
+
+def _merge_pages(data, pages):
+    """Append the players of later pages, dropping rows already seen."""
+    seen = {(p.get("rank"), p.get("participant")) for p in data["players"]}
+    for players in pages:
+        for p in players:
+            key = (p.get("rank"), p.get("participant"))
+            if key not in seen:
+                seen.add(key)
+                data["players"].append(p)
+    return data
+
+
+def _fetch_http(shard):
+    """All pages of one shard over plain HTTP, or None if the browser is needed."""
+    url = ladder_url(shard)
+    first = fetch_via_http("ladder_points", url,
+                           lambda soup, payloads: (data_from_http(soup, payloads), page_count_from_payloads(payloads)))
+    if first is None or first[0] is None:
+        return None
+
+    data, page_count = first
+    seen = {(p.get("rank"), p.get("participant")) for p in data["players"]}
+    pages = []
+    for n in range(2, min(page_count or MAX_PAGES, MAX_PAGES) + 1):
+        try:
+            table = fetch_via_http("ladder_points", ladder_url(shard, n), lambda soup, payloads: table_from_payloads(payloads))
+        except ValueError:
+            if page_count is not None:
+                raise
+            table = None    # forced "http" backend: a page past the end has no table
+        if page_count is None:
+            # No page count advertised: walk ?page=N until a page comes back
+            # empty or repeats rows already seen (past-the-end clamps to the last page)
+            rows = {(p.get("rank"), p.get("participant")) for p in (table or {}).get("players", [])}
+            if not rows or rows <= seen:
+                break
+            seen |= rows
+        elif table is None:
+            return None
+        pages.append(table["players"])
+    return _merge_pages(data, pages)
+
+
+async def _next_page_button(page):
+    """The pager's "next" control when there is a next page, else None."""
+    button = await page.query_selector(NEXT_PAGE_SELECTOR)
+    if button is None or not await button.is_enabled():
+        return None
+    return button
+
+
+def scrape_shard(shard, retries=3, delay=5, pool=None, force=False):
     """
-    Scrape Ladder Points page including:
+    Scrape every page of one shard's Ladder Points table, including:
       - Updated / Next Update timestamps
       - Players table with total and per-week points
+      - Seeding block (lists every shard)
+    Args:
+      pool (BrowserPool): Browser pool to borrow a page from (defaults to the shared one)
+      force (bool): fetch even if the stored snapshot's Next Update has not passed yet
     Side-effect:
-      Saves raw JSON to data/raw/ladder_points.json
+      Appends the snapshot to the ladder snapshot store
     """
+    snapshots = get_snapshot_store()
+    next_update = snapshots.next_update(shard)
+    if not force and next_update is not None and datetime.now() < next_update:
+        logger.info(f"[Ladder Points] {shard} not due until {next_update}, using stored snapshot")
+        return snapshots.latest(shard)
+
+    pool = pool or get_pool()
+    url = ladder_url(shard)
     attempt = 0
     while attempt < retries:
         try:
-            logger.info(f"[Ladder Points] Attempt {attempt + 1}")
+            logger.info(f"[Ladder Points] {shard} attempt {attempt + 1}")
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                
+            async def extract(page):
                 # Capture browser console logs
                 page.on("console", lambda msg: logger.info(f"[PAGE LOG] {msg.text}"))
-                
+
+                capture = PayloadCapture(page) if JSON_EXTRACTION else None
+
                 # Navigate to Ladder Points URL
-                page.goto(LADDER_URL, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(3000)
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+                # Take the table from JSON if it arrives before the rendered rows
+                json_table = None
+                if capture:
+                    json_table = await capture.race(table_from_payloads, wait_until_ready(page, "ladder_points"))
+                else:
+                    await wait_until_ready(page, "ladder_points")
+
+                if json_table is not None:
+                    await wait_until_ready(page, "ladder_points_text")  # Timestamps / seeding still come from the DOM
+                    if await _next_page_button(page) is None:
+                        logger.info("[Ladder Points] Players table built from JSON payload")
+                    else:
+                        # Later pages are read from the DOM, so page 1 must be too:
+                        # one shard's rows in one column layout
+                        await wait_until_ready(page, "ladder_points")
+                        json_table = None
 
                 # ===== Evaluate JS in page =====
-                data = page.evaluate("""
+                data = await page.evaluate("""
                 () => {
                     const result = {};
 
@@ -50,13 +269,15 @@ def scrape(retries=3, delay=5):
                         .find(p => p.querySelector('span') && p.querySelector('span').textContent.includes('Next Update'));
 
                     if (updateP) {
-                        // Split by colon and trim to get the update timestamp
-                        result.updated = updateP.textContent.split(':')[1].trim();
+                        // Text after the label's colon (the time has colons too)
+                        const text = updateP.textContent;
+                        result.updated = text.slice(text.indexOf(':') + 1).trim();
                     }
 
                     if (nextUpdateP) {
-                        // Split by colon and trim to get the next update timestamp
-                        result.next_update = nextUpdateP.textContent.split(':')[1].trim();
+                        // Text after the label's colon (the time has colons too)
+                        const text = nextUpdateP.textContent;
+                        result.next_update = text.slice(text.indexOf(':') + 1).trim();
                     }
 
                     // ===== Players Table =====
@@ -128,26 +349,97 @@ def scrape(retries=3, delay=5):
                     return result;
                 }
                 """)
-                browser.close()
 
-                # ===== Add metadata =====
-                for p in data["players"]:
-                    p["url"] = LADDER_URL
+                if json_table is not None:
+                    data.update(json_table)
+
+                # ===== Later pages: click "next" until it is gone or disabled =====
+                pages = []
+                for _ in range(MAX_PAGES - 1):
+                    next_button = await _next_page_button(page)
+                    if next_button is None:
+                        break
+                    first = await page.evaluate(FIRST_PARTICIPANT_JS)
+                    await next_button.click()
+                    await page.wait_for_function(
+                        f"(first) => ({FIRST_PARTICIPANT_JS})() !== first", arg=first, timeout=PAGE_READY_TIMEOUT_MS
+                    )
+                    pages.append(await page.evaluate(TABLE_ROWS_JS))
+                return _merge_pages(data, pages)
+
+            # Plain HTTP first; the browser only if the page needs JS
+            data = _fetch_http(shard)
+            if data is None:
+                data = pool.run(extract)
 
-                # ===== Save raw JSON =====
-                with RAW_FILE.open("w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
+            # ===== Add metadata =====
+            data["shard"] = shard
+            for p in data["players"]:
+                p["url"] = url
 
-                logger.info(f"[Ladder Points] Scraped {len(data['players'])} players, saved to {RAW_FILE}")
-                return data
+            # ===== Keep history =====
+            snapshots.append(shard, data)
+            logger.info(f"[Ladder Points] {shard}: {len(data['players'])} players")
+            return data
 
         except TimeoutError as e:
-            logger.warning(f"[Ladder Points] Timeout on attempt {attempt + 1}: {e}")
+            logger.warning(f"[Ladder Points] {shard} timeout on attempt {attempt + 1}: {e}")
         except Exception as e:
-            logger.error(f"[Ladder Points] Error on attempt {attempt + 1}: {e}")
+            logger.error(f"[Ladder Points] {shard} error on attempt {attempt + 1}: {e}")
 
         attempt += 1
         time.sleep(delay)
 
-    logger.error("[Ladder Points] Failed to scrape after all retries")
-    return {}
+    logger.error(f"[Ladder Points] {shard}: failed to scrape after all retries")
+    return None
+
+
+def scrape(shards=None, retries=3, delay=5, pool=None, force=False):
+    """
+    Scrape the Ladder Points of several shards concurrently.
+
+    Shards come from `shards`, else LADDER_SHARDS, else the seeding block of
+    the DEFAULT_SHARD page (scraped first). The remaining shards run in
+    parallel, so the total time is close to the slowest shard; browser pages
+    are still bounded by the BrowserPool size.
+    Returns:
+      dict: {"shards": {shard: ladder data}, "failed": [shards]}
+    Side-effect:
+      Writes one record per shard to data/raw/ladder_points.ndjson as each
+      shard finishes; the file is only replaced when something changed
+    """
+    results = {}
+    shards = list(shards or LADDER_SHARDS)
+    with RawWriter(RAW_FILE, url=LADDER_BASE_URL, ordered=False) as out:
+        if not shards:
+            first = scrape_shard(DEFAULT_SHARD, retries, delay, pool, force)
+            results[DEFAULT_SHARD] = first
+            if first:
+                out.write(first)
+            shards = [DEFAULT_SHARD] + [s for s in discover_shards(first or {}) if s != DEFAULT_SHARD]
+            logger.info(f"[Ladder Points] Discovered shards: {shards}")
+
+        pending = [s for s in dict.fromkeys(shards) if s not in results]
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix="ladder") as executor:
+                futures = {executor.submit(scrape_shard, s, retries, delay, pool, force): s for s in pending}
+                for future in as_completed(futures):
+                    data = results[futures[future]] = future.result()
+                    if data:
+                        out.write(data)
+
+    # Keep the requested shard order in the returned dataset
+    order = [s for s in dict.fromkeys(shards) if s in results]
+    dataset = {
+        "shards": {s: results[s] for s in order if results[s]},
+        "failed": [s for s in order if not results[s]],
+    }
+    if dataset["failed"]:
+        logger.warning(f"[Ladder Points] Failed shards: {dataset['failed']}")
+
+    players = sum(len(d["players"]) for d in dataset["shards"].values())
+    if out.replaced:
+        logger.info(f"[Ladder Points] Scraped {players} players in {len(dataset['shards'])} shards, saved to {RAW_FILE}")
+    else:
+        logger.info(f"[Ladder Points] Scraped {players} players in {len(dataset['shards'])} shards, unchanged since last run")
+    return dataset
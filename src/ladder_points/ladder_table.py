@@ -0,0 +1,86 @@
+import re
+import pandas as pd
+
+WEEK_HEADER = re.compile(r"week\s*(\d+)", re.IGNORECASE)
+_NUMBER = r"(-?\d[\d,]*)"
+
+
+def _to_int32(values):
+    """Vectorised text -> nullable int32 ("1,234" -> 1234, "-" / "" / None -> <NA>)."""
+    text = pd.Series(values, dtype="string")
+    digits = text.str.extract(_NUMBER, expand=False).str.replace(",", "", regex=False)
+    return pd.to_numeric(digits, errors="coerce").astype("Int32")
+
+
+def week_columns(frame):
+    return [c for c in frame.columns if c.startswith("week_")]
+
+
+def to_frame(data):
+    """
+    Typed ladder table from the scraper output ({'headers', 'players', ...}).
+
+    Columns: rank, participant, total, week_1 ... week_N, all numbers as
+    nullable int32 (missing cells, "-" included, become <NA>). Parsing runs
+    column by column, not cell by cell.
+    """
+    players = data.get("players", [])
+    points = pd.DataFrame([p.get("points") or {} for p in players])
+
+    frame = pd.DataFrame({
+        "rank": _to_int32([p.get("rank") for p in players]),
+        "participant": pd.Series([p.get("participant") for p in players], dtype="string"),
+        "total": _to_int32(points["Total"] if "Total" in points else [None] * len(players)),
+    })
+
+    weeks = {}
+    for header in points.columns:
+        match = WEEK_HEADER.fullmatch(str(header).strip())
+        if match:
+            weeks[int(match.group(1))] = header
+    for week in sorted(weeks):
+        # Keep the nullable Series (aligned on the frame's index): .to_numpy()
+        # would turn a column with <NA> into float64
+        frame[f"week_{week}"] = _to_int32(points[weeks[week]]).set_axis(frame.index)
+
+    untyped = {c: str(frame[c].dtype) for c in ["rank", "total", *week_columns(frame)] if frame[c].dtype != "Int32"}
+    if untyped:
+        raise TypeError(f"ladder table columns are not Int32: {untyped}")
+    return frame
+
+
+def compare(old, new):
+    """
+    Compare two ladder snapshots (frames from to_frame) in one vectorised pass.
+
+    Returns one row per participant present in either snapshot, with old/new
+    rank and total, `rank_change` (positive = moved up), `points_delta`,
+    `week_N_delta` for every week column, and `status`: "new", "dropped",
+    "moved" or "same".
+    """
+    weeks = sorted(set(week_columns(old)) | set(week_columns(new)), key=lambda c: int(c.split("_")[1]))
+    # Same columns on both sides, so every column gets a suffix
+    old = old.drop_duplicates("participant").set_index("participant").reindex(columns=["rank", "total", *weeks])
+    new = new.drop_duplicates("participant").set_index("participant").reindex(columns=["rank", "total", *weeks])
+    old["present"] = True
+    new["present"] = True
+    merged = old.join(new, how="outer", lsuffix="_old", rsuffix="_new")
+
+    diff = pd.DataFrame(index=merged.index)
+    for column in ("rank", "total"):
+        diff[f"{column}_old"] = merged[f"{column}_old"].astype("Int32")
+        diff[f"{column}_new"] = merged[f"{column}_new"].astype("Int32")
+    diff["rank_change"] = diff["rank_old"] - diff["rank_new"]
+    diff["points_delta"] = diff["total_new"].fillna(0) - diff["total_old"].fillna(0)
+    for week in weeks:
+        diff[f"{week}_delta"] = (
+            merged[f"{week}_new"].astype("Int32").fillna(0) - merged[f"{week}_old"].astype("Int32").fillna(0)
+        )
+
+    in_old = merged["present_old"].fillna(False).astype(bool)
+    in_new = merged["present_new"].fillna(False).astype(bool)
+    changed = (diff["rank_change"].fillna(0) != 0) | (diff["points_delta"] != 0)
+    status = pd.Series("same", index=merged.index, dtype="string")
+    diff["status"] = status.mask(changed, "moved").mask(~in_old, "new").mask(~in_new, "dropped")
+
+    return diff.reset_index().sort_values("rank_new", na_position="last", kind="stable").reset_index(drop=True)
@@ -0,0 +1,172 @@
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+import pandas as pd
+from src.config.settings import STATE_DIR
+from src.utils.logger import logger
+
+SNAPSHOT_DIR = Path(STATE_DIR) / "ladder_snapshots"
+
+# A full copy of the ladder is written every FULL_EVERY snapshots so a
+# lookup never replays more than that many deltas
+FULL_EVERY = 50
+
+
+def parse_time(text):
+    """Page timestamp ("Updated: ...") -> naive local datetime, or None if unparseable."""
+    if not text:
+        return None
+    parsed = pd.to_datetime(text, errors="coerce")
+    if pd.isna(parsed):
+        return None
+    parsed = parsed.to_pydatetime()
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed
+
+
+def _player_key(player):
+    return player.get("participant")
+
+
+def _rank_order(player):
+    digits = "".join(ch for ch in str(player.get("rank") or "") if ch.isdigit())
+    return int(digits) if digits else float("inf")
+
+
+class LadderSnapshotStore:
+    """
+    Append-only history of ladder snapshots, one NDJSON file per shard.
+
+    Each line is one snapshot keyed by the page's `updated` value. It carries
+    the page metadata (headers, updated, next_update, seeding) and only the
+    player rows that changed since the previous snapshot plus the
+    participants that dropped off; every FULL_EVERY-th line is a full copy.
+    latest() / as_of() rebuild a snapshot by replaying from the nearest
+    full copy, in the same shape the scraper returns.
+    """
+
+    def __init__(self, directory=SNAPSHOT_DIR):
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._entries = {}      # shard -> list of snapshot entries, oldest first
+
+    def _path(self, shard):
+        return self.directory / f"{shard}.ndjson"
+
+    def _load(self, shard):
+        entries = self._entries.get(shard)
+        if entries is None:
+            entries = []
+            path = self._path(shard)
+            if path.exists():
+                with path.open("r", encoding="utf-8") as f:
+                    entries = [json.loads(line) for line in f if line.strip()]
+            self._entries[shard] = entries
+        return entries
+
+    def _rebuild(self, entries, index):
+        """Players by participant as of entries[index]."""
+        start = index
+        while start > 0 and not entries[start].get("full"):
+            start -= 1
+        players = {}
+        for entry in entries[start:index + 1]:
+            if entry.get("full"):
+                players = {}
+            for participant in entry.get("removed", []):
+                players.pop(participant, None)
+            for row in entry.get("rows", []):
+                players[_player_key(row)] = row
+        return players
+
+    def _snapshot(self, entries, index):
+        entry = entries[index]
+        players = sorted(self._rebuild(entries, index).values(), key=_rank_order)
+        return {**entry["meta"], "players": players}
+
+    # ===== Writes =====
+    def append(self, shard, data):
+        """
+        Store a freshly scraped ladder. Returns False (and writes nothing)
+        when neither `updated` nor any row changed since the latest snapshot.
+        """
+        meta = {k: v for k, v in data.items() if k != "players"}
+        current = {_player_key(p): p for p in data.get("players", [])}
+
+        with self._lock:
+            entries = self._load(shard)
+            previous = self._rebuild(entries, len(entries) - 1) if entries else {}
+            rows = [p for key, p in current.items() if previous.get(key) != p]
+            removed = [key for key in previous if key not in current]
+            if entries and not rows and not removed and entries[-1]["meta"].get("updated") == meta.get("updated"):
+                return False
+
+            since_full = next((i for i, e in enumerate(reversed(entries)) if e.get("full")), len(entries))
+            full = not entries or since_full + 1 >= FULL_EVERY
+            updated_at = parse_time(meta.get("updated"))
+            entry = {
+                "shard": shard,
+                "updated": meta.get("updated"),
+                "updated_at": updated_at.isoformat() if updated_at else None,
+                "scraped_at": datetime.now().isoformat(timespec="seconds"),
+                "full": full,
+                "meta": meta,
+                "rows": list(current.values()) if full else rows,
+                "removed": [] if full else removed,
+            }
+
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with self._path(shard).open("a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            entries.append(entry)
+
+        logger.info(f"[Ladder Snapshots] {shard} @ {meta.get('updated')}: "
+                    f"{len(entry['rows'])} rows stored ({'full' if full else 'delta'}), {len(entry['removed'])} removed")
+        return True
+
+    # ===== Lookups =====
+    def latest(self, shard):
+        """Most recent snapshot of a shard, or None."""
+        with self._lock:
+            entries = self._load(shard)
+            return self._snapshot(entries, len(entries) - 1) if entries else None
+
+    def as_of(self, shard, when):
+        """Snapshot that was current at `when` (by the page's `updated` time, else scrape time)."""
+        with self._lock:
+            entries = self._load(shard)
+            match = None
+            for i, entry in enumerate(entries):
+                stamp = entry.get("updated_at") or entry["scraped_at"]
+                if datetime.fromisoformat(stamp) <= when:
+                    match = i
+            return self._snapshot(entries, match) if match is not None else None
+
+    def history(self, shard):
+        """(updated, scraped_at, rows stored) for every stored snapshot, oldest first."""
+        with self._lock:
+            return [(e["updated"], e["scraped_at"], len(e["rows"])) for e in self._load(shard)]
+
+    def next_update(self, shard):
+        """When the page said the latest snapshot will be replaced, or None if unknown."""
+        with self._lock:
+            entries = self._load(shard)
+            return parse_time(entries[-1]["meta"].get("next_update")) if entries else None
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_snapshot_store():
+    """Return the process-wide LadderSnapshotStore."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = LadderSnapshotStore()
+        return _store
@@ -1,26 +1,44 @@
+import argparse
 import asyncio
 from src.events.events_scraper import scrape as scrape_events
 from src.schedule.schedule_scraper import scrape as scrape_schedule
-from src.tournament.tournament_scraper import scrape as scrape_tournaments
+from src.tournament.discovery import crawl_discovered
 from src.pro_points.pro_points_scraper import scrape as scrape_pro_points
 from src.ladder_points.ladder_scraper import scrape as scrape_ladder_points
 from src.utils.logger import logger
+from src.utils.browser_pool import shutdown_pool
+from src.utils.http_fetcher import shutdown_fetcher
+from src.daemon.scheduler import run_daemon
 
 async def main():
     logger.info("Starting CompetetFT Scraper...")
 
+    try:
+        await run_all()
+    finally:
+        # Close the shared Chromium and HTTP client once every scraper is done
+        shutdown_pool()
+        shutdown_fetcher()
+
+def daemon():
+    logger.info("Starting CompetetFT Scraper in daemon mode...")
+
+    try:
+        run_daemon()
+    finally:
+        shutdown_pool()
+        shutdown_fetcher()
+
+async def run_all():
     # Scrape events
     events = await asyncio.to_thread(scrape_events)
 
     # Scrape schedule
     schedule = await asyncio.to_thread(scrape_schedule)
 
-    # Manually test 1 tournament ID
-    tournament_ids = ["115372050843537506"]  
-    logger.info(f"Testing tournament scrape with ID: {tournament_ids[0]}")
-
-    # Scrape tournament details + participants
-    tournaments = await asyncio.to_thread(scrape_tournaments, tournament_ids)
+    # Discover tournaments from events + schedule, crawl only the new or stale ones
+    reports = await asyncio.to_thread(crawl_discovered, events, schedule)
+    tournaments = [r["detail"] for r in reports if r["detail"] is not None]
 
     # Scrape pro points and ladder points
     pro_points = await asyncio.to_thread(scrape_pro_points)
@@ -31,8 +49,16 @@ async def main():
     logger.info(f"Events scraped: {len(events)}")
     logger.info(f"Schedule sections: {len(schedule)}")
     logger.info(f"Tournaments scraped: {len(tournaments)}")
-    logger.info(f"Pro points entries: {len(pro_points)}")
-    logger.info(f"Ladder points entries: {len(ladder_points)}")
+    logger.info(f"Pro points seasons: {len(pro_points.get('seasons', {}))}")
+    logger.info(f"Ladder points shards: {len(ladder_points.get('shards', {}))}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="CompetetFT scraper")
+    parser.add_argument("--daemon", action="store_true",
+                        help="keep running and refresh pages/tournaments on a schedule")
+    args = parser.parse_args()
+
+    if args.daemon:
+        daemon()
+    else:
+        asyncio.run(main())
@@ -1,56 +1,182 @@
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from pathlib import Path
 import logging
 import time
-import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from src.utils.logger import logger
-from src.config.settings import BASE_URL 
+from src.utils.browser_pool import get_pool
+from src.utils.page_wait import wait_until_ready
+from src.utils.payload_capture import PayloadCapture, find_rows, pick
+from src.utils.http_fetcher import fetch_via_http
+from src.utils.raw_output import raw_path, RawWriter
+from src.config.settings import BASE_URL, JSON_EXTRACTION, PRO_POINTS_SEASONS
 
 # ===== Raw data storage setup =====
 RAW_DATA_DIR = Path("data/raw")
 RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
-RAW_FILE = RAW_DATA_DIR / "pro_points.json"
+RAW_FILE = raw_path(RAW_DATA_DIR / "pro_points")
 
-# URL for the specific Pro Points page (season/tournament)
-PRO_POINTS_URL = f"{BASE_URL}/en-US/season/115371820222511550/points/114777641829694521"
+# Pro Points pages, one per season/points table
+PRO_POINTS_BASE_URL = f"{BASE_URL}/en-US/season"
 
-def scrape(retries=3, delay=5):
+
+def pro_points_url(season_id, points_id):
+    return f"{PRO_POINTS_BASE_URL}/{season_id}/points/{points_id}"
+
+
+def season_key(season_id, points_id):
+    return f"{season_id}/{points_id}"
+
+
+def _to_int(value):
+    try:
+        return int(str(value).replace(",", "").strip())
+    except (TypeError, ValueError):
+        return None
+
+
+def players_from_payloads(payloads):
+    """
+    Build the players list from a captured JSON payload.
+    Returns None when no payload looks like the standings table.
     """
-    Scrape Pro Points page including:
-      - Players table with rank, nickname, main_char, and cup totals
+    rows = find_rows(
+        payloads,
+        ("rank", "position", "standing"),
+        ("displayName", "nickname", "name", "gameName", "riotId"),
+        ("points", "totalPoints", "total"),
+    )
+    if not rows:
+        return None
+
+    players = []
+    for row in rows:
+        game_name, tag = pick(row, "gameName"), pick(row, "tagLine")
+        riot_id = pick(row, "riotId", default=f"{game_name}#{tag}" if game_name and tag else None)
+        nickname = pick(row, "displayName", "nickname", "name", default=riot_id)
+
+        # Cup totals come in table column order; names from the payload when it has them
+        cups = {}
+        for i, cup in enumerate(pick(row, "cups", "cupPoints", "events", default=[])):
+            if isinstance(cup, dict):
+                name = pick(cup, "name", "title", "cupName", "eventName", default=f"Cup {i + 1}")
+                cups[name] = _to_int(pick(cup, "points", "total"))
+            else:
+                cups[f"Cup {i + 1}"] = _to_int(cup)
+
+        players.append({
+            "rank": _to_int(pick(row, "rank", "position", "standing")),
+            "nickname": nickname,
+            "main_char": riot_id or nickname,
+            "total_points": _to_int(pick(row, "totalPoints", "points", "total")),
+            "cups": cups,
+        })
+    return players
+
+
+def cup_names(players):
+    """Cup column names in table order."""
+    return list(dict.fromkeys(cup for p in players for cup in p.get("cups", {})))
+
+
+def text_sections_from_html(soup):
+    """About / Seeding sections from server-rendered HTML (mirrors the in-page JS)."""
+    h5s = soup.find_all("h5")
+
+    about = None
+    about_h5 = next((h for h in h5s if h.get_text().strip() == "About Pro Points"), None)
+    if about_h5 is not None:
+        sibling = about_h5.find_next_sibling()
+        if sibling is not None and sibling.name == "p":
+            about = sibling.get_text().strip()
+
+    seeding = {"description": None, "list": []}
+    seeding_h5 = next((h for h in h5s if h.get_text().strip() == "Pro Points Seeding"), None)
+    desc_p = seeding_h5.find_next_sibling() if seeding_h5 is not None else None
+    if desc_p is not None and desc_p.name == "p":
+        seeding["description"] = desc_p.get_text().strip()
+
+        ul = desc_p.find_next_sibling()
+        while ul is not None and ul.name != "ul":
+            ul = ul.find_next_sibling()
+
+        if ul is not None:
+            for li in ul.find_all("li"):
+                divs = li.find_all("div")
+                title = (divs[0].get_text().strip() or None) if divs else None
+                desc_el = divs[1].find("p") if len(divs) > 1 else None
+                desc = desc_el.get_text().strip() if desc_el is not None else None
+                seeding["list"].append({"title": title, "desc": desc})
+
+    return about, seeding
+
+
+def data_from_http(soup, payloads):
+    """Full Pro Points output from an HTTP fetch, or None if the table needs JS."""
+    players = players_from_payloads(payloads)
+    if players is None:
+        return None
+    about, seeding = text_sections_from_html(soup)
+    return {"cups": cup_names(players), "players": players, "about": about, "seeding": seeding}
+
+
+def scrape_season(season_id, points_id, retries=3, delay=5, pool=None):
+    """
+    Scrape one Pro Points page (season/points table) including:
+      - Players table with rank, nickname, main_char, total and one entry per
+        cup column, named after the table header
       - About Pro Points section
       - Pro Points Seeding section (description + list)
-    
+
+    Args:
+        pool (BrowserPool): Browser pool to borrow a page from (defaults to the shared one)
+
     Returns:
-        dict: Contains 'players', 'about', 'seeding'
-    Side-effect:
-        Saves raw JSON to data/raw/pro_points.json
+        dict: Contains 'season_id', 'points_id', 'url', 'cups', 'players', 'about', 'seeding'
+              ({} when every attempt failed)
     """
+    pool = pool or get_pool()
+    url = pro_points_url(season_id, points_id)
+    label = season_key(season_id, points_id)
     attempt = 0
     while attempt < retries:
         try:
-            logger.info(f"[Pro Points] Attempt {attempt + 1}")
+            logger.info(f"[Pro Points] {label} attempt {attempt + 1}")
 
-            # ===== Launch headless browser =====
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                
+            # ===== Borrow a page from the shared browser =====
+            async def extract(page):
                 # Capture browser console logs
                 page.on("console", lambda msg: logger.info(f"[PAGE LOG] {msg.text}"))
-                
+
+                capture = PayloadCapture(page) if JSON_EXTRACTION else None
+
                 # Navigate to the Pro Points URL and wait for page content
-                page.goto(PRO_POINTS_URL, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(3000)  # Allow JS to render table/content
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+
+                # Take the table from JSON if it arrives before the rendered rows
+                json_players = None
+                if capture:
+                    json_players = await capture.race(players_from_payloads, wait_until_ready(page, "pro_points"))
+                else:
+                    await wait_until_ready(page, "pro_points")  # Wait for JS to render table rows
+
+                if json_players is not None:
+                    logger.info(f"[Pro Points] {label} players table built from JSON payload")
+                    await wait_until_ready(page, "pro_points_text")  # About / Seeding are still read from the DOM
 
                 # ===== Evaluate JavaScript inside the page context =====
-                data = page.evaluate("""
+                data = await page.evaluate("""
                     () => {
                         const result = {};
 
                         // ===== Players Table =====
+                        // Columns: Rank, Player, Total, then one column per cup
                         const players = [];
                         const table = document.querySelector('table');
+                        const headers = table
+                            ? Array.from(table.querySelectorAll('thead th')).map(th => th.textContent.trim())
+                            : [];
+                        const cupHeaders = headers.slice(3);
                         if (table) {
                             const rows = table.querySelectorAll('tbody tr');
                             rows.forEach(tr => {
@@ -83,11 +209,14 @@ def scrape(retries=3, delay=5):
                                     }
                                 }
 
-                                // ===== Parse point totals =====
+                                // ===== Parse point totals, cups keyed by their header =====
                                 const total_points = parseInt(tds[2].textContent.trim());
-                                const demacia_cup_total = parseInt(tds[3].textContent.trim());
-                                const bilgewater_cup_total = parseInt(tds[4].textContent.trim());
-                                const shurima_cup_total = parseInt(tds[5].textContent.trim());
+                                const cups = {};
+                                for (let i = 3; i < tds.length; i++) {
+                                    const name = cupHeaders[i - 3] || `Cup ${i - 2}`;
+                                    const points = parseInt(tds[i].textContent.trim().replace(/,/g, ''));
+                                    cups[name] = Number.isNaN(points) ? null : points;
+                                }
 
                                 // Push player object to list
                                 players.push({
@@ -95,12 +224,11 @@ def scrape(retries=3, delay=5):
                                     nickname,
                                     main_char,
                                     total_points,
-                                    demacia_cup_total,
-                                    bilgewater_cup_total,
-                                    shurima_cup_total
+                                    cups
                                 });
                             });
                         }
+                        result.cups = cupHeaders;
                         result.players = players;
 
                         // ===== About Pro Points Section =====
@@ -159,27 +287,74 @@ def scrape(retries=3, delay=5):
                         return result;
                     }
                 """)
-                browser.close()
 
-                # ===== Add metadata =====
-                for d in data["players"]:
-                    d["tournament_id"] = "114777641829694521"
-                    d["url"] = PRO_POINTS_URL
+                if json_players is not None:
+                    data["players"] = json_players
+                    data["cups"] = cup_names(json_players)
+                return data
+
+            # Plain HTTP first; the browser only if the page needs JS
+            data = fetch_via_http("pro_points", url, data_from_http)
+            if data is None:
+                data = pool.run(extract)
 
-                # ===== Save raw JSON =====
-                with RAW_FILE.open("w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
+            # ===== Add metadata =====
+            for d in data["players"]:
+                d["season_id"] = season_id
+                d["points_id"] = points_id
+                d["url"] = url
 
-                logger.info(f"[Pro Points] Scraped {len(data['players'])} players, saved to {RAW_FILE}")
-                return data
+            logger.info(f"[Pro Points] {label}: {len(data['players'])} players, cups {data['cups']}")
+            return {"season_id": season_id, "points_id": points_id, "url": url, **data}
 
         except TimeoutError as e:
-            logger.warning(f"[Pro Points] Timeout on attempt {attempt + 1}: {e}")
+            logger.warning(f"[Pro Points] {label} timeout on attempt {attempt + 1}: {e}")
         except Exception as e:
-            logger.error(f"[Pro Points] Error on attempt {attempt + 1}: {e}")
+            logger.error(f"[Pro Points] {label} error on attempt {attempt + 1}: {e}")
 
         attempt += 1
         time.sleep(delay)
 
-    logger.error("[Pro Points] Failed to scrape after all retries")
+    logger.error(f"[Pro Points] {label} failed to scrape after all retries")
     return {}
+
+
+def scrape(seasons=None, retries=3, delay=5, pool=None):
+    """
+    Scrape several Pro Points tables concurrently on the shared browser.
+
+    Seasons are (season_id, points_id) pairs from `seasons`, else
+    PRO_POINTS_SEASONS, so adding a season is a setting and not a code change.
+    Browser pages are still bounded by the BrowserPool size.
+    Returns:
+      dict: {"seasons": {"season_id/points_id": season data}, "failed": [keys]}
+    Side-effect:
+      Writes one record per season to data/raw/pro_points.ndjson as each
+      season finishes; the file is only replaced when something changed
+    """
+    seasons = list(dict.fromkeys(tuple(s) for s in (seasons or PRO_POINTS_SEASONS)))
+    results = {}
+    with RawWriter(RAW_FILE, url=PRO_POINTS_BASE_URL, ordered=False) as out:
+        if seasons:
+            with ThreadPoolExecutor(max_workers=len(seasons), thread_name_prefix="pro-points") as executor:
+                futures = {executor.submit(scrape_season, *s, retries, delay, pool): season_key(*s) for s in seasons}
+                for future in as_completed(futures):
+                    data = results[futures[future]] = future.result()
+                    if data:
+                        out.write(data)
+
+    # Keep the configured season order in the returned dataset
+    order = [season_key(*s) for s in seasons]
+    dataset = {
+        "seasons": {key: results[key] for key in order if results[key]},
+        "failed": [key for key in order if not results[key]],
+    }
+    if dataset["failed"]:
+        logger.warning(f"[Pro Points] Failed seasons: {dataset['failed']}")
+
+    players = sum(len(d["players"]) for d in dataset["seasons"].values())
+    if out.replaced:
+        logger.info(f"[Pro Points] Scraped {players} players in {len(dataset['seasons'])} seasons, saved to {RAW_FILE}")
+    else:
+        logger.info(f"[Pro Points] Scraped {players} players in {len(dataset['seasons'])} seasons, unchanged since last run")
+    return dataset
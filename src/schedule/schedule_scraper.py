@@ -1,46 +1,119 @@
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import logging
 import time
-import json
+from datetime import datetime
 from pathlib import Path
-from src.config.settings import SCHEDULE_URL
+from src.config.settings import SCHEDULE_URL, JSON_EXTRACTION
 from src.utils.logger import logger
+from src.utils.browser_pool import get_pool
+from src.utils.page_wait import wait_until_ready, SECTION_GRACE_MS
+from src.utils.payload_capture import PayloadCapture, find_rows, pick
+from src.utils.http_fetcher import fetch_via_http
+from src.utils.storage import save_if_changed
+from src.utils.raw_output import raw_path
 
 # Directory to save raw scraped data
 RAW_DATA_DIR = Path("data/raw")
 RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
-RAW_FILE = RAW_DATA_DIR / "schedule.json"
+RAW_FILE = raw_path(RAW_DATA_DIR / "schedule")
 
 
-def scrape(retries=3, delay=5):
+def sections_from_payloads(payloads):
+    """
+    Build the date sections from a captured JSON payload, in the same shape
+    the DOM scrape produces. Returns None when no payload lists tournaments.
+    """
+    rows = find_rows(
+        payloads,
+        ("tournamentId", "id"),
+        ("name", "title"),
+        ("startTime", "startDate", "startsAt", "start"),
+    )
+    if not rows:
+        return None
+
+    sections = {}
+    for row in rows:
+        name = pick(row, "name", "title")
+        # Same filter as the DOM scrape: skip snapshot entries
+        if not name or "snapshot" in name.lower():
+            continue
+
+        # Local date/time, like the browser-side formatting
+        start = str(pick(row, "startTime", "startDate", "startsAt", "start"))
+        dt = datetime.fromisoformat(start.replace("Z", "+00:00")).astimezone()
+        meridiem = "PM" if dt.hour >= 12 else "AM"
+
+        region = pick(row, "region", "regionCode", default="unknown")
+        if isinstance(region, dict):
+            region = pick(region, "code", "name", default="unknown")
+
+        tournament_id = str(pick(row, "tournamentId", "id"))
+        sections.setdefault(dt.strftime("%Y-%m-%d"), []).append({
+            "tournament_id": tournament_id,
+            "url": f"/en-US/tournament/{tournament_id}",
+            "time": f"{dt.hour % 12 or 12}:{dt.minute:02d} {meridiem}",
+            "name": name,
+            "region": str(region).upper(),
+        })
+
+    return [{"date": date, "tournaments": sections[date]} for date in sorted(sections)]
+
+
+def scrape(retries=3, delay=5, pool=None):
     """
     Scrape the tournaments schedule from CompetetFT.
-    
+
+    Args:
+        pool (BrowserPool): Browser pool to borrow a page from (defaults to the shared one)
+
     Returns:
         list of dicts: Each dict contains 'date' and 'tournaments' (list of tournament info)
         
     Side-effect:
         Saves the scraped data to data/raw/schedule.json
     """
+    pool = pool or get_pool()
     attempt = 0
     while attempt < retries:
         try:
             logger.info(f"[Schedule Scraper] Attempt {attempt + 1}")
             
-            # Launch a headless Chromium browser
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-
+            # Borrow a page from the shared Chromium
+            async def extract(page):
                 # Capture page console logs and forward to our logger
                 page.on("console", lambda msg: logger.info(f"[PAGE LOG] {msg.text}"))
 
+                capture = PayloadCapture(page) if JSON_EXTRACTION else None
+
                 # Navigate to schedule page and wait for DOM content to load
-                page.goto(SCHEDULE_URL, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(3000)  # Wait a bit for JavaScript to render
+                await page.goto(SCHEDULE_URL, wait_until="domcontentloaded", timeout=30000)
+
+                # Wait for the page, then briefly for the sections: an empty
+                # schedule renders none (-> False)
+                async def sections_ready():
+                    await wait_until_ready(page, "schedule")
+                    try:
+                        await wait_until_ready(page, "schedule_sections", timeout=SECTION_GRACE_MS)
+                        return True
+                    except PlaywrightTimeoutError:
+                        return False
+
+                # Use the schedule JSON if it arrives before the rendered sections
+                if capture:
+                    sections = await capture.race(sections_from_payloads, sections_ready())
+                    if sections is not None:
+                        logger.info("[Schedule Scraper] Built from JSON payload")
+                        return sections
+                    rendered = await page.query_selector("section[data-date]") is not None
+                else:
+                    rendered = await sections_ready()  # Wait for JavaScript to render the sections
+                if not rendered:
+                    logger.info("[Schedule Scraper] No schedule sections on the page")
+                    return []
 
                 # Execute JS in page context to scrape tournaments
-                data = page.evaluate("""
+                return await page.evaluate("""
                     () => {
                         const result = []
                         // Select all sections that have data-date attribute
@@ -140,16 +213,18 @@ def scrape(retries=3, delay=5):
                         return result
                     }
                 """)
-                
-                # Close browser
-                browser.close()
 
-                # Save scraped data to JSON
-                with RAW_FILE.open("w", encoding="utf-8") as f:
-                    json.dump(data, f, ensure_ascii=False, indent=4)
+            # Plain HTTP first; the browser only if the page needs JS
+            data = fetch_via_http("schedule", SCHEDULE_URL, lambda soup, payloads: sections_from_payloads(payloads))
+            if data is None:
+                data = pool.run(extract)
 
+            # Save scraped data to JSON (skipped when unchanged)
+            if save_if_changed(RAW_FILE, data, SCHEDULE_URL):
                 logger.info(f"[Schedule Scraper] Success: {len(data)} sections scraped and saved to {RAW_FILE}")
-                return data
+            else:
+                logger.info(f"[Schedule Scraper] Success: {len(data)} sections scraped, unchanged since last run")
+            return data
 
         except PlaywrightTimeoutError as e:
             logger.warning(f"[Schedule Scraper] Timeout on attempt {attempt + 1}: {e}")
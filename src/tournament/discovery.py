@@ -0,0 +1,213 @@
+import json
+import os
+import threading
+from datetime import datetime, date
+from pathlib import Path
+from src.config.settings import (
+    STATE_DIR, TOURNAMENT_WORKERS, TOURNAMENT_REFRESH_INTERVAL, TOURNAMENT_MAX_ATTEMPTS,
+)
+from src.utils.logger import logger
+from .tournament_scraper import crawl
+from .tournament_store import load_tournament, tournament_path
+
+FRONTIER_FILE = Path(STATE_DIR) / "tournament_frontier.json"
+
+
+def is_tournament_id(tid):
+    # The in-page extractors fall back to "unknown" / "none" when a link has no ID
+    return bool(tid) and str(tid).isdigit()
+
+
+def discovered_ids(events=None, schedule=None):
+    """(tournament_id, source, schedule date) for every tournament the events/schedule output lists."""
+    for event in events or []:
+        if is_tournament_id(event.get("tournament_id")):
+            yield str(event["tournament_id"]), event.get("category") or "events", None
+    for section in schedule or []:
+        for t in section.get("tournaments", []):
+            if is_tournament_id(t.get("tournament_id")):
+                yield str(t["tournament_id"]), "schedule", section.get("date")
+
+
+def _new_entry():
+    return {
+        "sources": [], "date": None, "status": "pending", "attempts": 0,
+        "fetched_at": None, "end_date": None, "error": None,
+        "discovered_at": datetime.now().isoformat(timespec="seconds"),
+    }
+
+
+class TournamentFrontier:
+    """
+    Persisted crawl state of every tournament ever discovered.
+
+    One entry per tournament_id: where it was seen (sources, schedule date),
+    the outcome of the last crawl (status "pending", "ok", "partial" when the
+    participants page failed, "failed"), consecutive failed attempts, when it
+    was last fetched and its end_date. due() lists what still needs a crawl:
+      - new (pending) tournaments
+      - failed or partial ones, until TOURNAMENT_MAX_ATTEMPTS in a row (a
+        partial one is then refreshed like a clean one)
+      - unfinished ones whose last fetch is older than TOURNAMENT_REFRESH_INTERVAL
+    A tournament fetched after its end_date is final and never crawled again.
+    record() is written through to disk after every tournament, so a stopped
+    backfill resumes where it left off.
+    """
+
+    def __init__(self, path=FRONTIER_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._entries = {}
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                self._entries = json.load(f)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, tid):
+        with self._lock:
+            entry = self._entries.get(str(tid))
+            return dict(entry) if entry else None
+
+    # ===== Discovery =====
+    def _stored_entry(self, tid):
+        """Entry for a tournament already on disk from before the frontier existed, or None."""
+        path = tournament_path(tid)
+        stored = load_tournament(tid) if path.exists() else None
+        if not stored:
+            return None
+        return {
+            "status": "ok",
+            "fetched_at": datetime.fromtimestamp(path.stat().st_mtime).isoformat(timespec="seconds"),
+            "end_date": stored.get("end_date"),
+        }
+
+    def add(self, tid, source, schedule_date=None):
+        """Register a discovered tournament. Returns True if it was not known yet."""
+        tid = str(tid)
+        with self._lock:
+            entry = self._entries.get(tid)
+            new = entry is None
+            if new:
+                entry = _new_entry()
+                entry.update(self._stored_entry(tid) or {})
+                self._entries[tid] = entry
+            if source not in entry["sources"]:
+                entry["sources"].append(source)
+            if schedule_date:
+                entry["date"] = schedule_date
+            return new
+
+    # ===== Scheduling =====
+    @staticmethod
+    def _final(entry):
+        if not (entry["fetched_at"] and entry["end_date"]):
+            return False
+        try:
+            return datetime.fromisoformat(entry["fetched_at"]).date() > date.fromisoformat(entry["end_date"])
+        except ValueError:
+            return False
+
+    def is_final(self, tid):
+        """True when the tournament was fetched cleanly after its end_date."""
+        with self._lock:
+            entry = self._entries.get(str(tid))
+            return entry is not None and entry["status"] == "ok" and self._final(entry)
+
+    def _is_due(self, entry, now):
+        if entry["status"] == "pending":
+            return True
+        if entry["status"] in ("failed", "partial") and entry["attempts"] < TOURNAMENT_MAX_ATTEMPTS:
+            return True
+        if entry["status"] == "failed":
+            return False
+        if not entry["fetched_at"]:
+            return True
+        if self._final(entry):
+            return False
+        return (now - datetime.fromisoformat(entry["fetched_at"])).total_seconds() >= TOURNAMENT_REFRESH_INTERVAL
+
+    def due(self, now=None):
+        """Tournament IDs that need a crawl: new ones first, then the least recently fetched."""
+        now = now or datetime.now()
+        with self._lock:
+            due = [(tid, e) for tid, e in self._entries.items() if self._is_due(e, now)]
+        due.sort(key=lambda item: (item[1]["status"] != "pending", item[1]["fetched_at"] or ""))
+        return [tid for tid, _ in due]
+
+    def record(self, report):
+        """Store the outcome of one crawl (a scrape_one status dict) and persist."""
+        tid = str(report["tournament_id"])
+        with self._lock:
+            entry = self._entries.setdefault(tid, _new_entry())
+            if report["ok"]:
+                entry["fetched_at"] = datetime.now().isoformat(timespec="seconds")
+                entry["end_date"] = (report["detail"] or {}).get("end_date") or entry["end_date"]
+            clean = report["ok"] and not report["error"]
+            entry["status"] = "ok" if clean else ("partial" if report["ok"] else "failed")
+            entry["attempts"] = 0 if clean else entry["attempts"] + 1
+            entry["error"] = report["error"]
+        self.save()
+
+    def summary(self):
+        with self._lock:
+            counts = {}
+            for entry in self._entries.values():
+                counts[entry["status"]] = counts.get(entry["status"], 0) + 1
+            return counts
+
+    def save(self):
+        """Persist atomically so a crash never leaves a half-written file."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(self._entries, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+
+
+_frontier = None
+_frontier_lock = threading.Lock()
+
+
+def get_frontier():
+    """Return the process-wide TournamentFrontier, loading it on first use."""
+    global _frontier
+    with _frontier_lock:
+        if _frontier is None:
+            _frontier = TournamentFrontier()
+        return _frontier
+
+
+def discover(events=None, schedule=None, frontier=None):
+    """Merge the tournament IDs of the events and schedule output into the frontier. Returns the new IDs."""
+    if frontier is None:
+        frontier = get_frontier()
+    new = [tid for tid, source, day in discovered_ids(events, schedule) if frontier.add(tid, source, day)]
+    frontier.save()
+    logger.info(f"[Discovery] {len(new)} new tournaments, {len(frontier)} known")
+    return new
+
+
+def crawl_discovered(events=None, schedule=None, workers=TOURNAMENT_WORKERS, limit=None, pool=None, frontier=None):
+    """
+    Discover tournaments from the events/schedule output, then crawl (detail +
+    participants, concurrently) only the ones that are new or stale.
+
+    `limit` caps how many are crawled this run, so a large backfill can go in
+    chunks; every finished tournament is checkpointed, so an interrupted run
+    resumes without refetching completed work.
+    Returns one status dict per crawled ID (see scrape_one).
+    """
+    if frontier is None:
+        frontier = get_frontier()
+    discover(events, schedule, frontier)
+
+    due = frontier.due()
+    selected = due[:limit] if limit else due
+    logger.info(f"[Discovery] Crawling {len(selected)} of {len(due)} due tournaments")
+    reports = crawl(selected, workers, pool, on_report=frontier.record) if selected else []
+
+    logger.info(f"[Discovery] Frontier: {frontier.summary()}")
+    return reports
@@ -1,39 +1,35 @@
-from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from datetime import datetime
 import time
-import json
-from pathlib import Path
 from zoneinfo import ZoneInfo
 from src.config.settings import BASE_URL
 from src.utils.logger import logger
+from src.utils.browser_pool import get_pool
+from src.utils.page_wait import wait_until_ready, SECTION_GRACE_MS
+from src.utils.http_fetcher import fetch_via_http
 
 LOCAL_TZ = ZoneInfo("Asia/Jakarta")
 
-# Directory to save raw tournament data
-RAW_DATA_DIR = Path("data/raw/tournaments")
-RAW_DATA_DIR.mkdir(parents=True, exist_ok=True)
 
-
-def fetch_tournament_detail(tournament_id, retries=3):
+def fetch_tournament_detail(tournament_id, retries=3, pool=None):
     """
     Fetch tournament detail from competetft.com
     Returns dict with overview, rules, placements, points allocation, etc.
-    Saves JSON to data/raw/tournaments/{tournament_id}.json
+    Nothing is written here: see tournament_store.save_tournament
+    Pages are borrowed from `pool` (defaults to the shared BrowserPool)
     """
+    pool = pool or get_pool()
     url = f"{BASE_URL}/en-US/tournament/{tournament_id}/overview"
-    file_path = RAW_DATA_DIR / f"{tournament_id}.json"
 
     for attempt in range(1, retries + 1):
         try:
             logger.info(f"[Tournament] Fetch detail {tournament_id} attempt {attempt}")
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(3000)
+            async def extract(page):
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                await wait_until_ready(page, "tournament_overview")
 
-                data = page.evaluate("""
+                return await page.evaluate("""
                 () => {
 
                 
@@ -308,18 +304,14 @@ result.points_allocation = points_allocation
                 }
                 """)
 
-                browser.close()
+            data = pool.run(extract)
 
             # Post-processing
             data["tournament_id"] = tournament_id
             data["url"] = url
             data["timezone"] = str(LOCAL_TZ)
 
-            # Save raw JSON
-            with file_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
-
-            logger.info(f"[Tournament] Success: {tournament_id}, saved to {file_path}")
+            logger.info(f"[Tournament] Success: {tournament_id}")
             return data
 
         except PlaywrightTimeoutError as e:
@@ -333,25 +325,55 @@ result.points_allocation = points_allocation
     return None
 
 
-def fetch_tournament_participants(tournament_id, retries=3):
+def participants_from_html(soup):
+    """
+    Same extraction as the in-page JS, on server-rendered HTML.
+    Returns None when the participants list is rendered client-side (no
+    section, no list container, or an empty one), so the browser runs.
+    """
+    title = next((h for h in soup.find_all("h5") if h.get_text().strip().lower() == "participating players"), None)
+    if title is None:
+        return None
+
+    el = title.find_next_sibling()
+    while el is not None and el.name != "hr":
+        el = el.find_next_sibling()
+    if el is None:
+        return None
+
+    container = el.find_next_sibling()
+    if container is None or container.name != "div":
+        return None
+
+    names = [name for name in (div.get_text().strip() for div in container.find_all(recursive=False)) if name]
+    return names or None
+
+
+def fetch_tournament_participants(tournament_id, retries=3, pool=None):
     """
     Fetch tournament participants
-    Saves to the same JSON file as detail if exists
+    Nothing is written here: see tournament_store.save_tournament
+    Pages are borrowed from `pool` (defaults to the shared BrowserPool)
     """
+    pool = pool or get_pool()
     url = f"{BASE_URL}/en-US/tournament/{tournament_id}/participants"
-    file_path = RAW_DATA_DIR / f"{tournament_id}.json"
 
     for attempt in range(1, retries + 1):
         try:
             logger.info(f"[Tournament] Fetch participants {tournament_id} attempt {attempt}")
 
-            with sync_playwright() as p:
-                browser = p.chromium.launch(headless=True)
-                page = browser.new_page()
-                page.goto(url, wait_until="domcontentloaded", timeout=30000)
-                page.wait_for_timeout(3000)
-
-                participants = page.evaluate("""
+            async def extract(page):
+                await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                await wait_until_ready(page, "tournament_participants")
+                # The header can render just before the list; an upcoming
+                # tournament has no participants section at all (-> [])
+                try:
+                    await wait_until_ready(page, "participants_section", timeout=SECTION_GRACE_MS)
+                except PlaywrightTimeoutError:
+                    logger.info(f"[Tournament] {tournament_id} has no participants section yet")
+                    return []
+
+                return await page.evaluate("""
 () => {
     const result = [];
     const h5s = Array.from(document.querySelectorAll('h5'));
@@ -374,21 +396,11 @@ def fetch_tournament_participants(tournament_id, retries=3):
 }
 """)
 
-                browser.close()
-
-            # Save participants into existing JSON if exists
-            if file_path.exists():
-                with file_path.open("r", encoding="utf-8") as f:
-                    data = json.load(f)
-            else:
-                data = {}
-
-            data["participants"] = participants
-
-            with file_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=4)
+            participants = fetch_via_http("tournament_participants", url, lambda soup, payloads: participants_from_html(soup))
+            if participants is None:
+                participants = pool.run(extract)
 
-            logger.info(f"[Tournament] Participants saved for {tournament_id}")
+            logger.info(f"[Tournament] Participants fetched for {tournament_id}: {len(participants)}")
             return {"tournament_id": tournament_id, "participants": participants}
 
         except Exception as e:
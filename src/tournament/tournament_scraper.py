@@ -1,27 +1,80 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from src.config.settings import TOURNAMENT_WORKERS
 from .tournament_detail import fetch_tournament_detail, fetch_tournament_participants
+from .tournament_store import save_tournament
 
-def scrape(tournament_ids):
+
+def scrape_one(tid, pool=None):
     """
-    Scrape tournament details and participants for a list of tournament IDs.
-    Returns a list of dictionaries containing full tournament info.
+    Scrape detail + participants for a single tournament.
+    All sub-pages are gathered in memory and written once, atomically;
+    a failed participants page keeps the participants stored earlier.
+    Returns a status dict: tournament_id, ok, detail, error
+    """
+    logging.info(f"Scraping tournament {tid}")
+
+    # Fetch tournament detail
+    detail = fetch_tournament_detail(tid, pool=pool)
+    if detail is None:
+        logging.warning(f"Skipping tournament {tid}, failed to fetch details")
+        return {"tournament_id": tid, "ok": False, "detail": None, "error": "failed to fetch details"}
+
+    # Fetch participants
+    participants = fetch_tournament_participants(tid, pool=pool)
+    error = None
+    if participants is None:
+        logging.warning(f"Tournament {tid}: failed to fetch participants")
+        error = "failed to fetch participants"
+    else:
+        detail["participants"] = participants.get("participants", [])
+
+    detail, _ = save_tournament(tid, detail)
+    return {"tournament_id": tid, "ok": True, "detail": detail, "error": error}
+
+
+def crawl(tournament_ids, workers=TOURNAMENT_WORKERS, pool=None, on_report=None):
+    """
+    Scrape many tournaments concurrently.
+
+    Up to `workers` tournaments are in flight at once; actual browser pages
+    are further bounded by the BrowserPool size. `on_report`, if given, is
+    called with each status dict as soon as its tournament finishes (from
+    the worker thread), e.g. to checkpoint progress.
+    Returns one status dict per ID (see scrape_one), in input order.
     """
-    results = []
+    tournament_ids = list(tournament_ids)
+    workers = max(1, min(workers, len(tournament_ids) or 1))
+
+    def run(tid):
+        try:
+            report = scrape_one(tid, pool)
+        except Exception as e:
+            logging.error(f"Tournament {tid} crashed: {e}")
+            report = {"tournament_id": tid, "ok": False, "detail": None, "error": str(e)}
+        if on_report is not None:
+            on_report(report)
+        return report
 
-    for tid in tournament_ids:
-        logging.info(f"Scraping tournament {tid}")
+    if workers == 1:
+        reports = [run(tid) for tid in tournament_ids]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="tournament") as executor:
+            reports = list(executor.map(run, tournament_ids))
 
-        # Fetch tournament detail
-        detail = fetch_tournament_detail(tid)
-        if detail is None:
-            logging.warning(f"Skipping tournament {tid}, failed to fetch details")
-            continue
+    failed = [r["tournament_id"] for r in reports if r["error"]]
+    logging.info(f"Scraped {len(reports) - len(failed)}/{len(reports)} tournaments cleanly with {workers} workers")
+    if failed:
+        logging.warning(f"Tournaments with errors: {failed}")
 
-        # Fetch participants
-        participants = fetch_tournament_participants(tid)
-        if participants is not None:
-            detail["participants"] = participants.get("participants", [])
+    return reports
 
-        results.append(detail)
 
-    return results
+def scrape(tournament_ids, workers=TOURNAMENT_WORKERS, pool=None):
+    """
+    Scrape tournament details and participants for a list of tournament IDs.
+    Returns a list of dictionaries containing full tournament info,
+    in the same order as `tournament_ids` (failed IDs are left out).
+    Use crawl() for the per-ID failure report.
+    """
+    return [r["detail"] for r in crawl(tournament_ids, workers, pool) if r["detail"] is not None]
@@ -0,0 +1,105 @@
+import threading
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from src.config.settings import BASE_URL, RAW_DATA_DIR, STATE_DIR
+from src.utils.raw_output import raw_path, read_document, write_records
+from src.utils.logger import logger
+
+try:
+    import fcntl
+except ImportError:     # Windows: in-process locking only
+    fcntl = None
+
+# Directory to save raw tournament data
+TOURNAMENT_DIR = Path(RAW_DATA_DIR) / "tournaments"
+TOURNAMENT_DIR.mkdir(parents=True, exist_ok=True)
+
+# Keys owned by each sub-page; the overview owns everything else
+SUB_PAGE_KEYS = {
+    "participants": ("participants",),
+}
+
+# Writers are serialised per stripe, not per tournament: a fixed set of
+# thread locks and flock files, however many tournaments a daemon sees
+LOCK_STRIPES = 64
+LOCK_DIR = Path(STATE_DIR) / "locks"
+_locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+
+
+def tournament_path(tournament_id):
+    return raw_path(TOURNAMENT_DIR / str(tournament_id))
+
+
+def _legacy_path(tournament_id):
+    return TOURNAMENT_DIR / f"{tournament_id}.json"
+
+
+def _stripe(tournament_id):
+    return zlib.crc32(str(tournament_id).encode("utf-8")) % LOCK_STRIPES
+
+
+@contextmanager
+def _locked(tournament_id):
+    """Serialise writers of one tournament: threads via a lock, processes via flock."""
+    stripe = _stripe(tournament_id)
+    with _locks[stripe]:
+        if fcntl is None:
+            yield
+            return
+        LOCK_DIR.mkdir(parents=True, exist_ok=True)
+        with (LOCK_DIR / f"tournaments-{stripe:02d}.lock").open("w") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+
+def load_tournament(tournament_id):
+    """Stored record for a tournament (NDJSON, or a legacy .json dump), or None."""
+    for path in (tournament_path(tournament_id), _legacy_path(tournament_id)):
+        if path.exists():
+            return read_document(path)
+    return None
+
+
+def merge_tournament(stored, fresh):
+    """
+    Merge policy for a tournament record.
+
+    Every key in `fresh` replaces the stored one. A sub-page that is missing
+    from `fresh` (not fetched, or failed this run) keeps its stored keys, so
+    a flaky participants page never wipes participants saved earlier.
+    """
+    merged = dict(fresh)
+    if stored:
+        for keys in SUB_PAGE_KEYS.values():
+            if not any(k in fresh for k in keys):
+                merged.update({k: stored[k] for k in keys if k in stored})
+    return merged
+
+
+def save_tournament(tournament_id, fresh):
+    """
+    Write one tournament record with a single atomic replace (temp file +
+    rename, see RawWriter). Sub-pages missing from `fresh` are merged in
+    from the stored record. Safe to call for many tournaments in parallel,
+    and for the same tournament from several threads or processes.
+
+    Returns:
+        (record, written): the merged record and whether the file changed
+    """
+    url = f"{BASE_URL}/en-US/tournament/{tournament_id}"
+    path = tournament_path(tournament_id)
+
+    with _locked(tournament_id):
+        complete = all(any(k in fresh for k in keys) for keys in SUB_PAGE_KEYS.values())
+        record = fresh if complete else merge_tournament(load_tournament(tournament_id), fresh)
+        written = write_records(path, record, url=url)
+
+    if written:
+        logger.info(f"[Tournament] Saved {tournament_id} to {path}")
+    else:
+        logger.info(f"[Tournament] {tournament_id} unchanged since last run")
+    return record, written
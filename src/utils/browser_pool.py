@@ -0,0 +1,124 @@
+import asyncio
+import atexit
+import threading
+from playwright.async_api import async_playwright
+from src.utils.loop_thread import LoopThread
+from src.config.settings import BROWSER_POOL_SIZE, BROWSER_HEADLESS, REQUEST_FILTER_ENABLED
+from src.utils.request_filter import RequestFilter
+from src.utils.logger import logger
+
+
+class BrowserPool:
+    """
+    One headless Chromium shared by every scraper in the process.
+
+    Playwright is driven from a private event loop thread, so any thread
+    (including asyncio.to_thread workers) can borrow a page. Each borrow gets
+    its own browser context, which keeps cookies/storage isolated and is
+    closed as soon as the job returns. Unless `block_requests` is off, every
+    context gets a RequestFilter so images, fonts, media and trackers are
+    never downloaded.
+
+    Usage:
+        async def extract(page):
+            await page.goto(url)
+            return await page.evaluate("...")
+
+        data = get_pool().run(extract)
+    """
+
+    def __init__(self, size=BROWSER_POOL_SIZE, headless=BROWSER_HEADLESS, block_requests=REQUEST_FILTER_ENABLED):
+        self.size = size
+        self.headless = headless
+        self.block_requests = block_requests
+        self._loop = LoopThread("browser-pool")
+        self._playwright = None
+        self._browser = None
+        self._slots = None
+        self._launch_lock = None
+
+    # ===== Lifecycle =====
+    async def _launch(self):
+        self._playwright = await async_playwright().start()
+        self._browser = await self._playwright.chromium.launch(headless=self.headless)
+        self._slots = asyncio.Semaphore(self.size)
+        self._launch_lock = asyncio.Lock()
+        logger.info(f"[Browser Pool] Chromium started (pool size {self.size})")
+
+    async def _ensure_browser(self):
+        # Relaunch once if Chromium crashed underneath us
+        async with self._launch_lock:
+            if not self._browser.is_connected():
+                logger.warning("[Browser Pool] Chromium disconnected, relaunching")
+                self._browser = await self._playwright.chromium.launch(headless=self.headless)
+            return self._browser
+
+    async def _shutdown(self):
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._browser = self._playwright = None
+
+    def close(self):
+        """Close Chromium and stop the pool thread. Safe to call more than once."""
+        try:
+            if self._loop.stop(self._shutdown):
+                logger.info("[Browser Pool] Chromium stopped")
+        except Exception as e:
+            logger.error(f"[Browser Pool] Error during shutdown: {e}")
+
+    # ===== Borrowing pages =====
+    async def _with_page(self, fn):
+        async with self._slots:
+            browser = await self._ensure_browser()
+            context = await browser.new_context()
+            request_filter = None
+            page = None
+            try:
+                if self.block_requests:
+                    request_filter = RequestFilter()
+                    await request_filter.attach(context)
+                page = await context.new_page()
+                return await fn(page)
+            finally:
+                if request_filter is not None:
+                    request_filter.log_summary(page.url if page is not None else "context")
+                await context.close()
+
+    def submit(self, fn):
+        """
+        Schedule `fn(page)` (an async function) on a pooled page.
+        Returns a concurrent.futures.Future with its result.
+        """
+        self._loop.start(self._launch)
+        return self._loop.submit(self._with_page(fn))
+
+    def run(self, fn, timeout=None):
+        """Run `fn(page)` on a pooled page and block until it returns."""
+        return self.submit(fn).result(timeout)
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    """Return the process-wide BrowserPool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = BrowserPool()
+        return _pool
+
+
+def shutdown_pool():
+    """Close the process-wide BrowserPool if one was started."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.close()
+
+
+atexit.register(shutdown_pool)
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from src.config.settings import STATE_DIR
+from src.utils.logger import logger
+
+FINGERPRINT_FILE = Path(STATE_DIR) / "fingerprints.json"
+
+
+def digest(obj):
+    """Stable SHA-256 of any JSON-serialisable object (key order does not matter)."""
+    blob = json.dumps(obj, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+
+class FingerprintStore:
+    """
+    Remembers a content hash per URL and per extracted record between runs,
+    so unchanged data can skip file rewrites, validation and DB writes.
+
+    Hashes are grouped by namespace, e.g. "pages" (keyed by URL) or "events"
+    (keyed by tournament_id). Record hashes with mark() only after the
+    downstream work succeeded, then persist with save().
+    """
+
+    def __init__(self, path=FINGERPRINT_FILE):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._hashes = {}
+        if self.path.exists():
+            with self.path.open("r", encoding="utf-8") as f:
+                self._hashes = json.load(f)
+
+    def changed(self, namespace, key, obj):
+        return self.changed_digest(namespace, key, digest(obj))
+
+    def mark(self, namespace, key, obj):
+        self.mark_digest(namespace, key, digest(obj))
+
+    def changed_digest(self, namespace, key, value):
+        """Like changed(), for a hash computed elsewhere (e.g. while streaming)."""
+        with self._lock:
+            return self._hashes.get(namespace, {}).get(str(key)) != value
+
+    def mark_digest(self, namespace, key, value):
+        with self._lock:
+            self._hashes.setdefault(namespace, {})[str(key)] = value
+
+    def diff(self, namespace, records, key):
+        """
+        Split `records` into the ones that changed since they were last marked.
+        `key` is the record field that identifies it (e.g. "tournament_id").
+        Returns (changed_records, skipped_count).
+        """
+        changed = [r for r in records if self.changed(namespace, r.get(key), r)]
+        return changed, len(records) - len(changed)
+
+    def mark_all(self, namespace, records, key):
+        for r in records:
+            self.mark(namespace, r.get(key), r)
+
+    def save(self):
+        """Persist atomically so a crash never leaves a half-written file."""
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(self._hashes, f)
+            os.replace(tmp, self.path)
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_store():
+    """Return the process-wide FingerprintStore, loading it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = FingerprintStore()
+        return _store
+
+
+def log_diff(label, changed, skipped):
+    logger.info(f"[{label}] {changed} changed, {skipped} unchanged (skipped)")
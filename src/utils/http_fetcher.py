@@ -0,0 +1,173 @@
+import atexit
+import json
+import threading
+import time
+import httpx
+from bs4 import BeautifulSoup
+from src.config.settings import (
+    BASE_URL,
+    HEADERS,
+    FETCH_BACKENDS,
+    DATA_URLS,
+    HTTP_MAX_CONNECTIONS,
+    HTTP_TIMEOUT,
+)
+from src.utils.loop_thread import LoopThread
+from src.utils.logger import logger
+
+
+class HttpFetcher:
+    """
+    Lightweight fetch backend: one pooled, keep-alive, HTTP/2 httpx client
+    shared by every scraper. Much cheaper than a browser page for anything
+    that does not need JavaScript (server-rendered HTML, embedded hydration
+    JSON, JSON data endpoints).
+
+    `base_url` only resolves relative URLs; the scrapers build absolute
+    URLs from settings.BASE_URL, so set BASE_URL (env) to send every
+    scraper to a local stand-in server.
+    """
+
+    def __init__(self, base_url=BASE_URL, headers=HEADERS, max_connections=HTTP_MAX_CONNECTIONS,
+                 timeout=HTTP_TIMEOUT, http2=True):
+        self.base_url = base_url
+        self.headers = dict(headers)
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.http2 = http2
+        self._loop = LoopThread("http-fetcher")
+        self._client = None
+
+    async def _open(self):
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            http2=self.http2,
+            timeout=self.timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_connections,
+            ),
+        )
+
+    async def _close(self):
+        await self._client.aclose()
+        self._client = None
+
+    def close(self):
+        self._loop.stop(self._close)
+
+    async def get(self, url):
+        """GET `url` (absolute, or relative to base_url) on the shared client."""
+        response = await self._client.get(url)
+        response.raise_for_status()
+        return response
+
+    def _run(self, coro):
+        self._loop.start(self._open)
+        return self._loop.run(coro)
+
+    def fetch_text(self, url):
+        return self._run(self._text(url))
+
+    def fetch_json(self, url):
+        return self._run(self._json(url))
+
+    async def _text(self, url):
+        return (await self.get(url)).text
+
+    async def _json(self, url):
+        return (await self.get(url)).json()
+
+    def fetch_page(self, url, page_type=None):
+        """
+        Fetch a page over HTTP.
+        Returns (soup, payloads): the parsed HTML and every JSON payload found
+        in it, plus the page type's DATA_URLS endpoint if one is configured.
+        """
+        return self._run(self._page(url, page_type))
+
+    async def _page(self, url, page_type):
+        html = await self._text(url)
+        soup = BeautifulSoup(html, "lxml")
+        payloads = embedded_payloads(soup)
+
+        data_url = DATA_URLS.get(page_type)
+        if data_url:
+            payloads.append(await self._json(data_url))
+        return soup, payloads
+
+
+def embedded_payloads(soup):
+    """JSON hydration payloads embedded in server HTML (__NEXT_DATA__, application/json scripts)."""
+    payloads = []
+    for script in soup.find_all("script", attrs={"type": ["application/json", "application/ld+json"]}):
+        try:
+            payloads.append(json.loads(script.string or ""))
+        except ValueError:
+            continue
+    return payloads
+
+
+def backend_for(page_type):
+    return FETCH_BACKENDS.get(page_type, "browser")
+
+
+def fetch_via_http(page_type, url, parse, fetcher=None):
+    """
+    HTTP-first fetch for `page_type`.
+
+    Calls `parse(soup, payloads)`, which returns the scraper's usual output or
+    None when the server HTML does not contain the data (i.e. the page needs
+    JavaScript). Returns None when the caller should use the browser instead;
+    raises if the backend is "http" and the page could not be served.
+    """
+    backend = backend_for(page_type)
+    if backend == "browser":
+        return None
+
+    start = time.perf_counter()
+    try:
+        soup, payloads = (fetcher or get_fetcher()).fetch_page(url, page_type)
+        result = parse(soup, payloads)
+    except Exception as e:
+        if backend == "http":
+            raise
+        logger.warning(f"[HTTP Fetcher] {page_type} failed over HTTP, using browser: {e}")
+        return None
+
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if result is None:
+        if backend == "http":
+            raise ValueError(f"{page_type}: data not present in server HTML ({url})")
+        logger.info(f"[HTTP Fetcher] {page_type} needs JS ({elapsed_ms:.0f} ms wasted), using browser")
+        return None
+
+    logger.info(f"[HTTP Fetcher] {page_type} served over HTTP in {elapsed_ms:.0f} ms")
+    return result
+
+
+_fetcher = None
+_fetcher_lock = threading.Lock()
+
+
+def get_fetcher():
+    """Return the process-wide HttpFetcher, creating it on first use."""
+    global _fetcher
+    with _fetcher_lock:
+        if _fetcher is None:
+            _fetcher = HttpFetcher()
+        return _fetcher
+
+
+def shutdown_fetcher():
+    """Close the process-wide HttpFetcher if one was started."""
+    global _fetcher
+    with _fetcher_lock:
+        fetcher, _fetcher = _fetcher, None
+    if fetcher is not None:
+        fetcher.close()
+
+
+atexit.register(shutdown_fetcher)
@@ -0,0 +1,63 @@
+import asyncio
+import threading
+
+
+class LoopThread:
+    """
+    An asyncio event loop running forever on a daemon thread.
+
+    Lets synchronous code (the scrapers, asyncio.to_thread workers) share
+    async resources such as a Playwright browser or an httpx client that must
+    live on a single loop.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+
+    @property
+    def running(self):
+        return self._loop is not None
+
+    def start(self, setup=None):
+        """Start the loop (no-op if running) and run the optional `setup` coroutine function on it."""
+        with self._lock:
+            if self._loop is not None:
+                return
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, name=self.name, daemon=True)
+            thread.start()
+            if setup is not None:
+                try:
+                    asyncio.run_coroutine_threadsafe(setup(), loop).result()
+                except Exception:
+                    loop.call_soon_threadsafe(loop.stop)
+                    thread.join()
+                    loop.close()
+                    raise
+            self._loop, self._thread = loop, thread
+
+    def submit(self, coro):
+        """Schedule `coro` on the loop; returns a concurrent.futures.Future."""
+        return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+    def run(self, coro, timeout=None):
+        """Run `coro` on the loop and block until it returns."""
+        return self.submit(coro).result(timeout)
+
+    def stop(self, teardown=None):
+        """Run the optional `teardown` coroutine function, then stop the loop. Returns False if not running."""
+        with self._lock:
+            if self._loop is None:
+                return False
+            try:
+                if teardown is not None:
+                    asyncio.run_coroutine_threadsafe(teardown(), self._loop).result()
+            finally:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._thread.join()
+                self._loop.close()
+                self._loop = self._thread = None
+            return True
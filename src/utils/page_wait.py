@@ -0,0 +1,50 @@
+import time
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+from src.config.settings import PAGE_READY_TIMEOUT_MS
+from src.utils.logger import logger
+
+# Readiness condition per page type: the selector that only exists once the
+# client-side app has rendered the data we scrape.
+READY_SELECTORS = {
+    # The page shell or the list itself: an empty category or schedule renders
+    # no list items at all, so those are waited for separately (see below)
+    "events": "main, ol > li > a",
+    "schedule": "main, section[data-date]",
+    "tournament_overview": ".grid-area_title h2",
+    # Either the participants section or, for tournaments without one yet
+    # (upcoming), the tournament header: a missing section is not a timeout
+    "tournament_participants": 'h5:text-matches("participating players", "i"), .grid-area_title h2',
+    "pro_points": "table tbody tr",
+    "ladder_points": "table tbody tr",
+    # Static text sections, used when the table itself came from JSON
+    "pro_points_text": "h5",
+    "ladder_points_text": "h4",
+    # Sections that may legitimately be absent once the page has rendered
+    "participants_section": 'h5:text-matches("participating players", "i")',
+    "events_list": "ol > li > a",
+    "schedule_sections": "section[data-date]",
+}
+
+# Extra wait for an optional section after the page itself is ready
+SECTION_GRACE_MS = 2000
+
+
+async def wait_until_ready(page, page_type, selector=None, timeout=PAGE_READY_TIMEOUT_MS):
+    """
+    Wait until the readiness selector for `page_type` is in the DOM.
+
+    Returns the time actually spent waiting (ms). Raises Playwright's
+    TimeoutError if the page never becomes ready, so the caller's retry
+    loop kicks in instead of scraping a half-rendered page.
+    """
+    selector = selector or READY_SELECTORS[page_type]
+    start = time.perf_counter()
+    try:
+        await page.wait_for_selector(selector, state="attached", timeout=timeout)
+    except PlaywrightTimeoutError:
+        logger.warning(f"[Page Wait] {page_type} not ready after {timeout} ms ({selector})")
+        raise
+
+    waited_ms = (time.perf_counter() - start) * 1000
+    logger.info(f"[Page Wait] {page_type} ready in {waited_ms:.0f} ms")
+    return waited_ms
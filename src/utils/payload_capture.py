@@ -0,0 +1,142 @@
+import asyncio
+from src.utils.logger import logger
+
+# Hydration payloads client-rendered apps commonly embed in the HTML
+EMBEDDED_STATE_JS = """
+() => {
+    const found = [];
+    const next = document.getElementById('__NEXT_DATA__');
+    if (next) { try { found.push(JSON.parse(next.textContent)); } catch (e) {} }
+    document.querySelectorAll('script[type="application/json"], script[type="application/ld+json"]').forEach(s => {
+        if (s.id === '__NEXT_DATA__') return;
+        try { found.push(JSON.parse(s.textContent)); } catch (e) {}
+    });
+    for (const key of ['__NUXT__', '__APOLLO_STATE__', '__INITIAL_STATE__', '__remixContext']) {
+        if (window[key]) { try { found.push(JSON.parse(JSON.stringify(window[key]))); } catch (e) {} }
+    }
+    return found;
+}
+"""
+
+
+class PayloadCapture:
+    """
+    Collect JSON data the page loads (XHR/fetch responses) or embeds
+    (hydration state), so scrapers can build their output from structured
+    data instead of walking the rendered DOM.
+
+    Create it before page.goto() so no response is missed.
+    """
+
+    def __init__(self, page):
+        self.page = page
+        self.payloads = []
+        self._arrived = asyncio.Event()
+        page.on("response", self._on_response)
+
+    def _on_response(self, response):
+        if response.request.resource_type not in ("xhr", "fetch"):
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        asyncio.ensure_future(self._read(response))
+
+    async def _read(self, response):
+        try:
+            self.payloads.append(await response.json())
+            self._arrived.set()
+        except Exception as e:
+            logger.debug(f"[Payload Capture] Unreadable JSON from {response.url}: {e}")
+
+    async def read_embedded(self):
+        """Add any hydration payload embedded in the current document."""
+        try:
+            embedded = await self.page.evaluate(EMBEDDED_STATE_JS)
+        except Exception as e:
+            logger.debug(f"[Payload Capture] No embedded state: {e}")
+            return
+        if embedded:
+            self.payloads.extend(embedded)
+            self._arrived.set()
+
+    def _parse(self, parser):
+        try:
+            return parser(self.payloads)
+        except Exception as e:
+            logger.warning(f"[Payload Capture] Parser failed, falling back to DOM: {e}")
+            return None
+
+    async def race(self, parser, dom_ready):
+        """
+        Return `parser(payloads)` as soon as it yields a result, or None once
+        `dom_ready` (a readiness coroutine) completes first, in which case the
+        caller scrapes the DOM as before. A timeout from `dom_ready` is only
+        raised if no payload matched either.
+        """
+        await self.read_embedded()
+        ready_task = asyncio.ensure_future(dom_ready)
+        try:
+            while True:
+                result = self._parse(parser)
+                if result is not None:
+                    return result
+                if ready_task.done():
+                    ready_task.result()
+                    return None
+
+                self._arrived.clear()
+                arrived_task = asyncio.ensure_future(self._arrived.wait())
+                await asyncio.wait([ready_task, arrived_task], return_when=asyncio.FIRST_COMPLETED)
+                arrived_task.cancel()
+        finally:
+            if not ready_task.done():
+                ready_task.cancel()
+
+
+# ===== Helpers for shape-based payload parsing =====
+def iter_dict_lists(obj):
+    """Yield every non-empty list of dicts nested anywhere in `obj`."""
+    stack = [obj]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            if node and all(isinstance(item, dict) for item in node):
+                yield node
+            stack.extend(node)
+
+
+def pick(d, *keys, default=None):
+    """First present, non-null value among `keys` in dict `d`."""
+    for key in keys:
+        if d.get(key) is not None:
+            return d[key]
+    return default
+
+
+def find_rows(payloads, *key_groups):
+    """
+    Find the first list of dicts where every dict has at least one key from
+    each group in `key_groups`, e.g. find_rows(p, ("rank",), ("name", "displayName")).
+    """
+    for payload in payloads:
+        for rows in iter_dict_lists(payload):
+            if all(any(k in row for k in group) for row in rows for group in key_groups):
+                return rows
+    return None
+
+
+def find_value(payloads, *keys):
+    """First scalar value stored under any of `keys` anywhere in the payloads."""
+    stack = list(payloads)
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for key in keys:
+                if isinstance(node.get(key), (str, int, float)):
+                    return node[key]
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return None
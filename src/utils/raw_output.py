@@ -0,0 +1,171 @@
+import gzip
+import hashlib
+import io
+import json
+import os
+from pathlib import Path
+from src.config.settings import RAW_COMPRESSION
+from src.utils.fingerprint import get_store
+from src.utils.logger import logger
+
+SUFFIXES = {"": "", "none": "", "gzip": ".gz", "zstd": ".zst"}
+
+
+def raw_path(base, compression=RAW_COMPRESSION):
+    """Output path for `base` (no extension), e.g. data/raw/events -> data/raw/events.ndjson.gz"""
+    if compression not in SUFFIXES:
+        raise ValueError(f"Unknown RAW_COMPRESSION {compression!r}, expected one of {sorted(SUFFIXES)}")
+    return Path(f"{base}.ndjson{SUFFIXES[compression]}")
+
+
+def _zstd():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise RuntimeError("zstd raw output needs the 'zstandard' package (pip install zstandard)") from e
+    return zstandard
+
+
+def open_text(path, mode):
+    """Open a raw file for text "r"/"w", (de)compressing by its suffix."""
+    path = Path(path)
+    suffix = path.suffix
+    if path.name.endswith(".partial"):
+        suffix = Path(path.name[: -len(".partial")]).suffix
+    if suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    if suffix == ".zst":
+        zstandard = _zstd()
+        raw = path.open(mode + "b")
+        if mode == "w":
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+def _line(record):
+    return json.dumps(record, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def _canonical(record):
+    return json.dumps(record, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def records_digest(records):
+    """Content hash of a record stream, as RawWriter computes it while writing."""
+    h = hashlib.sha256()
+    for record in records:
+        h.update(_canonical(record).encode("utf-8"))
+        h.update(b"\n")
+    return h.hexdigest()
+
+
+class RawWriter:
+    """
+    Write scraper output as newline-delimited JSON, one record per line, as
+    results arrive.
+
+    Records go to "<path>.partial" straight away (flushed every
+    `flush_every` records), so a crash keeps everything scraped so far.
+    On a clean close the partial file atomically replaces `path`. With `url`
+    set, content identical to the last run (same "pages" fingerprint) is
+    discarded instead and `replaced` stays False. With `ordered=False` that
+    fingerprint ignores record order, for records written as concurrent
+    work completes.
+
+        with RawWriter(RAW_FILE, url=URL) as out:
+            for batch in batches:
+                out.write_many(batch)
+    """
+
+    def __init__(self, path, url=None, flush_every=None, ordered=True):
+        self.path = Path(path)
+        self.partial = self.path.with_name(self.path.name + ".partial")
+        self.url = url
+        self.ordered = ordered
+        # Compressed streams pay for every flush, so batch them
+        self.flush_every = flush_every or (1 if self.path.suffix == ".ndjson" else 100)
+        self.count = 0
+        self.replaced = False
+        self._hash = hashlib.sha256()
+        self._record_hashes = []
+        self._file = None
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open_text(self.partial, "w")
+        return self
+
+    def write(self, record):
+        self._file.write(_line(record))
+        self._file.write("\n")
+        if self.ordered:
+            self._hash.update(_canonical(record).encode("utf-8"))
+            self._hash.update(b"\n")
+        else:
+            self._record_hashes.append(hashlib.sha256(_canonical(record).encode("utf-8")).hexdigest())
+        self.count += 1
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def __exit__(self, exc_type, exc, tb):
+        self._file.close()
+        if exc_type is not None:
+            logger.warning(f"[Raw Output] Run failed after {self.count} records, partial output kept in {self.partial}")
+            return False
+
+        value = self._hash.hexdigest() if self.ordered else records_digest(sorted(self._record_hashes))
+        store = get_store()
+        if self.url is not None and self.path.exists() and not store.changed_digest("pages", self.url, value):
+            self.partial.unlink()
+            return False
+
+        os.replace(self.partial, self.path)
+        self.replaced = True
+        if self.url is not None:
+            store.mark_digest("pages", self.url, value)
+            store.save()
+        return False
+
+
+def write_records(path, records, url=None):
+    """
+    Write an already-complete list (or a single document) in one go.
+    With `url`, unchanged content is detected before anything is written.
+    Returns True if the file was replaced.
+    """
+    records = records if isinstance(records, list) else [records]
+    if url is not None and Path(path).exists() and not get_store().changed_digest("pages", url, records_digest(records)):
+        return False
+    with RawWriter(path, url=url) as out:
+        out.write_many(records)
+    return out.replaced
+
+
+def iter_records(path):
+    """
+    Lazily yield the records of a raw file. Legacy pretty-printed .json files
+    are still readable (a list yields its items, a dict yields itself).
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with path.open("r", encoding="utf-8") as f:
+            data = json.load(f)
+        yield from data if isinstance(data, list) else [data]
+        return
+
+    with open_text(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def read_document(path):
+    """First record of a single-document raw file (a tournament)."""
+    return next(iter_records(path), None)
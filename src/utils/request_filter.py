@@ -0,0 +1,65 @@
+from collections import Counter
+from fnmatch import fnmatch
+from urllib.parse import urlparse
+from src.config.settings import BLOCK_RESOURCE_TYPES, BLOCK_HOST_PATTERNS
+from src.utils.logger import logger
+
+# Rough size of a typical blocked asset, used only to estimate savings
+# (a blocked request is never downloaded, so its real size is unknown).
+TYPICAL_BYTES = {
+    "image": 50_000,
+    "font": 40_000,
+    "media": 500_000,
+    "script": 40_000,
+}
+
+
+class RequestFilter:
+    """
+    Abort requests the scrapers never need (images, fonts, media, trackers).
+
+    Attached per browser context, so the counters below describe exactly one
+    borrowed page.
+    """
+
+    def __init__(self, resource_types=BLOCK_RESOURCE_TYPES, host_patterns=BLOCK_HOST_PATTERNS):
+        self.resource_types = {t.strip() for t in resource_types if t.strip()}
+        self.host_patterns = list(host_patterns)
+        self.blocked = Counter()
+        self.allowed = 0
+        self.bytes_received = 0
+
+    def should_block(self, resource_type, url):
+        if resource_type in self.resource_types:
+            return True
+        host = urlparse(url).hostname or ""
+        return any(fnmatch(host, pattern) for pattern in self.host_patterns)
+
+    async def _handle(self, route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked[request.resource_type] += 1
+            await route.abort()
+        else:
+            self.allowed += 1
+            await route.continue_()
+
+    def _on_response(self, response):
+        length = response.headers.get("content-length")
+        if length and length.isdigit():
+            self.bytes_received += int(length)
+
+    async def attach(self, context):
+        await context.route("**/*", self._handle)
+        context.on("response", self._on_response)
+
+    def estimated_bytes_saved(self):
+        return sum(TYPICAL_BYTES.get(kind, 10_000) * count for kind, count in self.blocked.items())
+
+    def log_summary(self, label):
+        blocked = sum(self.blocked.values())
+        by_type = ", ".join(f"{kind}={count}" for kind, count in self.blocked.most_common()) or "none"
+        logger.info(
+            f"[Request Filter] {label}: blocked {blocked} ({by_type}), allowed {self.allowed}, "
+            f"received {self.bytes_received / 1024:.0f} KB, saved ~{self.estimated_bytes_saved() / 1024:.0f} KB"
+        )
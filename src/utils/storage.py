@@ -1,12 +1,21 @@
-import json
 import os
+from pathlib import Path
 from src.config.settings import DATA_DIR
+from src.utils.raw_output import raw_path, write_records
 
 os.makedirs(DATA_DIR, exist_ok=True)
 
 def save_json(data, filename):
-    """Save data to JSON file in data/ folder."""
-    filepath = os.path.join(DATA_DIR, filename)
-    with open(filepath, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    """Save data as NDJSON in data/ folder ("foo.json" -> data/foo.ndjson[.gz|.zst])."""
+    filepath = raw_path(Path(DATA_DIR) / Path(filename).with_suffix(""))
+    write_records(filepath, data)
     print(f"Saved data to {filepath}")
+
+
+def save_if_changed(path, data, url):
+    """
+    Write scraped `data` to `path` (see src/utils/raw_output.py) unless the
+    content scraped from `url` is identical to the last run (and the file is
+    still on disk). Returns True if the file was written.
+    """
+    return write_records(path, data, url=url)